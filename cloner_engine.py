@@ -36,6 +36,16 @@ class CloneReport:
 # Low-level DB helpers
 # -----------------------------
 
+# Per-connection cache tuning (same values as constructor_engine._READ_PRAGMAS).
+# Never journal_mode=WAL: it is stored in the SLT and the game must open it.
+# synchronous stays at its default here because a car clone's backup is optional.
+_PRAGMAS = (
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+
 def _connect(db: Path, readonly: bool = False) -> sqlite3.Connection:
     """SQLite connect helper with safety: never create new DB files."""
     db = Path(db)
@@ -48,6 +58,8 @@ def _connect(db: Path, readonly: bool = False) -> sqlite3.Connection:
     else:
         con = sqlite3.connect(str(db))
     con.row_factory = sqlite3.Row
+    for pragma in _PRAGMAS:
+        con.execute(pragma)
     return con
 
 
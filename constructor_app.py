@@ -1,9 +1,17 @@
 # constructor_app.py
 from __future__ import annotations
 
+import bisect
+from concurrent.futures import Future, ThreadPoolExecutor
+import functools
 import os
+from operator import itemgetter
+import queue
+import re
+import threading
+import time
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
+from tkinter import ttk, filedialog, messagebox, simpledialog
 import traceback
 
 from pathlib import Path
@@ -19,14 +27,7 @@ clone_engine_to_main = None
 suggest_next_engine_id = None
 cloner_import_error = None
 try:
-    import importlib
-    import sys
-
-    if "cloner_engine" in sys.modules:
-        del sys.modules["cloner_engine"]
-
     import cloner_engine as cl
-    importlib.reload(cl)
 
     clone_engine_to_main = getattr(cl, "clone_engine_to_main", None)
     suggest_next_engine_id = getattr(cl, "suggest_next_engine_id", None)
@@ -47,6 +48,503 @@ except Exception as e:
 
 APP_TITLE = f"Forza Constructor Studio ({ce.CONSTRUCTOR_VERSION})"
 
+# Field definitions: (column, label, widget_kind)
+CAR_FIELDS: Tuple[Tuple[str, str, str], ...] = (
+    ("CarTypeID", "CarTypeID (1 Production, 2 Race, 3 Pre-Tuned)", "dropdown_cartype"),
+    ("EnginePlacementID", "EnginePlacementID", "dropdown_engineplacement"),
+    ("MaterialTypeID", "MaterialTypeID", "dropdown_materialtype"),
+    ("CurbWeight", "CurbWeight", "num"),
+    ("WeightDistribution", "WeightDistribution", "num"),
+    ("NumGears", "NumGears", "num"),
+    ("TireBrandID", "TireBrandID", "num"),
+    ("FrontTireWidthMM", "FrontTireWidthMM", "num"),
+    ("FrontTireAspect", "FrontTireAspect", "num"),
+    ("FrontWheelDiameterIN", "FrontWheelDiameterIN", "num"),
+    ("RearTireWidthMM", "RearTireWidthMM", "num"),
+    ("RearTireAspect", "RearTireAspect", "num"),
+    ("RearWheelDiameterIN", "RearWheelDiameterIN", "num"),
+    ("BaseCost", "BaseCost", "num"),
+    ("IsUnicorn", "IsUnicorn (0/1)", "bool"),
+)
+
+ENGINE_FIELDS: Tuple[Tuple[str, str, str], ...] = (
+    ("EngineMass-kg", 'EngineMass-kg', "num"),
+    ("MediaName", "MediaName", "dropdown_engine_medianame"),
+    ("ConfigID", "ConfigID", "dropdown_engine_config"),
+    ("CylinderID", "CylinderID", "dropdown_engine_cylinders"),
+    ("Compression", "Compression", "num"),
+    ("VariableTimingID", "VariableTimingID", "dropdown_engine_vtiming"),
+    ("StockBoost-bar", 'StockBoost-bar', "num"),
+    ("MomentInertia", "MomentInertia", "num"),
+    ("GasTankSize", "GasTankSize", "num"),
+    ("TorqueSteerLeftSpeedScale", "TorqueSteerLeftSpeedScale", "num"),
+    ("TorqueSteerRightSpeedScale", "TorqueSteerRightSpeedScale", "num"),
+    ("EngineGraphingMaxTorque", "EngineGraphingMaxTorque", "num"),
+    ("EngineGraphingMaxPower", "EngineGraphingMaxPower", "num"),
+    ("EngineName", "EngineName", "text"),
+    ("EngineRotation", "EngineRotation", "num"),
+    ("Carbureted", "Carbureted (0/1)", "bool"),
+    ("Diesel", "Diesel (0/1)", "bool"),
+    ("Rotary", "Rotary (0/1)", "bool"),
+)
+
+
+# ----------------------------
+# Field widget builders: (parent, row) -> (variable, widget)
+# ----------------------------
+def _make_entry(parent, r: int):
+    v = tk.StringVar(value="")
+    e = ttk.Entry(parent, textvariable=v)
+    e.grid(row=r, column=1, sticky="ew")
+    return v, e
+
+
+def _make_bool(parent, r: int):
+    v = tk.IntVar(value=0)
+    w = ttk.Checkbutton(parent, variable=v)
+    w.grid(row=r, column=1, sticky="w")
+    return v, w
+
+
+_CARTYPE_LABELS = {1: "1 Production", 2: "2 Race", 3: "3 Pre-Tuned"}
+
+
+def _on_id_combo_selected(e):
+    """Shared <<ComboboxSelected>> handler: stores the picked label's id in the combobox's _idvar."""
+    cb = e.widget
+    var = cb._idvar
+    var.set(cb._id_by_label.get(cb.get(), var.get()))
+
+
+def _bind_combo_ids(cb: ttk.Combobox, var: tk.Variable, id_by_label: Dict[str, int]):
+    """Selecting a label stores its id in var: a dict lookup, no display-text parsing."""
+    cb._idvar = var
+    cb._id_by_label = id_by_label
+    cb.bind("<<ComboboxSelected>>", _on_id_combo_selected, add="+")
+
+
+def _make_cartype(parent, r: int):
+    v = tk.IntVar(value=1)
+    cb = ttk.Combobox(parent, state="readonly", values=tuple(_CARTYPE_LABELS.values()))
+    cb.grid(row=r, column=1, sticky="ew")
+    _bind_combo_ids(cb, v, {lbl: k for k, lbl in _CARTYPE_LABELS.items()})
+    return v, cb
+
+
+_TYPEAHEAD_RESET_S = 1.5  # a pause this long starts a new typeahead query
+
+
+def _bind_combo_typeahead(cb: ttk.Combobox):
+    """
+    Readonly comboboxes can't be typed into: instead, typed characters filter the
+    dropdown to matching labels (case-insensitive substring), so the popup only
+    renders the matches. BackSpace trims the query, Escape clears it, and
+    picking an entry restores the full list.
+    """
+    cb._all_values = ()
+    cb._typed = ""
+    cb._typed_at = 0.0
+
+    def show(q: str):
+        cb._typed = q
+        cb._typed_at = time.monotonic()
+        cb.configure(values=tuple(v for v in cb._all_values if q in v.lower()) if q else cb._all_values)
+
+    def on_key(e):
+        if e.keysym == "Escape":
+            show("")
+        elif e.keysym == "BackSpace":
+            show(cb._typed[:-1])
+        elif e.char and e.char.isprintable():
+            fresh = time.monotonic() - cb._typed_at > _TYPEAHEAD_RESET_S
+            show(("" if fresh else cb._typed) + e.char.lower())
+
+    cb.bind("<KeyPress>", on_key, add="+")
+    cb.bind("<<ComboboxSelected>>", lambda e: show(""), add="+")
+
+
+def _set_combo_values(cb: ttk.Combobox, values: Tuple[str, ...]):
+    """Full value list of a typeahead combobox (drops any pending query)."""
+    cb._all_values = values
+    cb._typed = ""
+    cb.configure(values=values)
+
+
+def _make_id_combo(parent, r: int):
+    # values / label<->id dicts are filled later by _refresh_dropdowns; bound once here
+    v = tk.IntVar(value=0)
+    cb = ttk.Combobox(parent, state="readonly")
+    cb.grid(row=r, column=1, sticky="ew")
+    _bind_combo_ids(cb, v, {})
+    cb._label_by_id = {}
+    _bind_combo_typeahead(cb)
+    return v, cb
+
+
+def _make_text_combo(parent, r: int):
+    v = tk.StringVar(value="")
+    cb = ttk.Combobox(parent, textvariable=v, state="readonly")
+    cb.grid(row=r, column=1, sticky="ew")
+    _bind_combo_typeahead(cb)
+    return v, cb
+
+
+# ----------------------------
+# Per-source read memo
+# Keyed by (path, mtime_ns, size, change counter): a write to an SLT changes its
+# key, so stale entries are never returned; unchanged DLCs are not re-queried on
+# reload. The counter is SQLite's file change counter (header bytes 24-27, bumped
+# by every commit): an in-place UPDATE keeps the size, and FAT/exFAT timestamps
+# are too coarse to tell two quick writes apart.
+# ----------------------------
+_SourceKey = Tuple[str, int, int, int]
+
+
+def _source_key(p: Path) -> Optional[_SourceKey]:
+    try:
+        st = os.stat(p)
+        with open(p, "rb") as f:
+            header = f.read(28)
+    except OSError:
+        return None
+    counter = int.from_bytes(header[24:28], "big") if len(header) == 28 else 0
+    return (str(p), st.st_mtime_ns, st.st_size, counter)
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_list_cars(path: str, mtime_ns: int, size: int, change_counter: int) -> Tuple[Dict[str, Any], ...]:
+    return tuple(ce.iter_cars_all_sources([Path(path)]))
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_list_engines(path: str, mtime_ns: int, size: int, change_counter: int) -> Tuple[Dict[str, Any], ...]:
+    return tuple(ce.iter_engines_all_sources([Path(path)]))
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_car_related_tables(path: str, mtime_ns: int, size: int, change_counter: int) -> Tuple[str, ...]:
+    return tuple(ce.list_car_related_tables(Path(path)))
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_car_scope(path: str, mtime_ns: int, size: int, change_counter: int, car_id: int) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+    """
+    (stock EngineID, CarBody Id, stock drivetrain id) for a MAIN car - the scope
+    values load_table_rows needs; any write to MAIN changes the key.
+    """
+    main_db = Path(path)
+    engine_id = carbody_id = drivetrain_id = None
+    try:
+        drivetrain_id = ce.get_stock_drivetrain_id_for_car(main_db, car_id)
+    except Exception:
+        drivetrain_id = None
+
+    try:
+        stock = ce.get_stock_engine_for_car(main_db, car_id)
+        if stock:
+            eid = stock.get("EngineID") or stock.get("EngineId") or stock.get("Engine")
+            if eid is not None:
+                engine_id = int(eid)
+    except Exception:
+        engine_id = None
+
+    try:
+        body = ce.get_data_carbody_for_car(main_db, car_id)
+        if body and body.get("Id") is not None:
+            carbody_id = int(body["Id"])
+    except Exception:
+        carbody_id = None
+    return engine_id, carbody_id, drivetrain_id
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_engine_name(sources: Tuple[Path, ...], main_key: Optional[_SourceKey], engine_id: int) -> str:
+    """
+    ce.resolve_engine_name memoized per source set. DLCs are read-only, so only
+    MAIN's _source_key is part of the key.
+    """
+    return ce.resolve_engine_name(list(sources), engine_id)
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_engine_medianames(source_keys: Tuple[_SourceKey, ...]) -> Tuple[str, ...]:
+    return tuple(ce.list_distinct_engine_medianames([Path(k[0]) for k in source_keys]))
+
+
+def _engine_medianames(sources) -> List[str]:
+    """ce.list_distinct_engine_medianames, memoized on every source's _source_key."""
+    keys = tuple(k for k in map(_source_key, sources) if k)
+    return list(_cached_engine_medianames(keys))
+
+
+def _table_display_name(t: str) -> str:
+    if t.startswith("List_Upgrade"):
+        return t.replace("List_Upgrade", "", 1)
+    if t.startswith("List_"):
+        return t.replace("List_", "", 1)
+    return t
+
+
+_TABLE_PRIORITY_PREFIXES = ("engine", "drivetrain")  # listed first in the table dropdown
+
+
+def _table_display_sort_key(x: str):
+    xl = x.lower()  # once per element
+    return (0 if xl.startswith(_TABLE_PRIORITY_PREFIXES) else 1, xl)
+
+
+@functools.lru_cache(maxsize=8)
+def _table_display_maps(real_tables: Tuple[str, ...]) -> Tuple[Dict[str, str], Dict[str, str], Tuple[str, ...]]:
+    """(display -> real, real -> display, sorted display names) for the table dropdown."""
+    real_to_display = {t: _table_display_name(t) for t in real_tables}
+    display_to_real = {d: t for t, d in real_to_display.items()}
+    return display_to_real, real_to_display, tuple(sorted(display_to_real, key=_table_display_sort_key))
+
+
+def _clear_source_memo():
+    _cached_list_cars.cache_clear()
+    _cached_list_engines.cache_clear()
+    _cached_car_related_tables.cache_clear()
+    _cached_car_scope.cache_clear()
+    _cached_engine_name.cache_clear()
+    _cached_engine_medianames.cache_clear()
+
+
+def _merge_source_rows(sources, loader, id_key: str) -> List[Dict[str, Any]]:
+    """
+    Chains memoized per-source rows (as fresh dicts) keeping ce's dedupe rule:
+    one row per (id, source basename). Each row gets _source_name (the basename
+    shown in the lists), computed once per source.
+    """
+    keys = [_source_key(p) for p in sources]
+    # fill the memo for every source concurrently first (hits return at once);
+    # the merge below then only reads cached tuples, in source order
+    ce.read_sources(lambda k: loader(*k), [k for k in keys if k])
+
+    out: List[Dict[str, Any]] = []
+    seen_by_name: Dict[str, set] = {}
+    for p, key in zip(sources, keys):
+        if key is None:
+            continue
+        name = p.name
+        ids = seen_by_name.setdefault(name, set())
+        for r in loader(*key):
+            if r[id_key] in ids:
+                continue
+            ids.add(r[id_key])
+            row = dict(r)
+            row["_source_name"] = name
+            out.append(row)
+    return out
+
+
+# Sort keys over the cached list rows (None-free: MediaName is "", _year_key is Year or 0)
+_CAR_SORT_KEYS = {
+    "CarID": itemgetter("CarID"),
+    "MediaName": itemgetter("MediaName", "CarID"),
+    "Year": itemgetter("_year_key", "CarID"),
+    "Source": itemgetter("Source", "CarID"),
+}
+_ENGINE_SORT_KEY = itemgetter("EngineID", "Source")
+
+
+def _row_iid(row_id: int, source: str) -> str:
+    """Stable Treeview iid for a (CarID/EngineID, Source) list row."""
+    return f"{row_id}|{source}"
+
+
+def _car_iid(c: Dict[str, Any]) -> str:
+    return _row_iid(c["CarID"], c["Source"])
+
+
+def _car_values(c: Dict[str, Any]) -> tuple:
+    return (c["CarID"], c.get("MediaName", ""), c.get("Year", ""), c["_source_name"])
+
+
+def _engine_iid(e: Dict[str, Any]) -> str:
+    return _row_iid(e["EngineID"], e["Source"])
+
+
+def _engine_values(e: Dict[str, Any]) -> tuple:
+    return (e["EngineID"], e.get("EngineName", ""), e.get("MediaName", ""), e["_source_name"])
+
+
+def _replace_tree_rows(tree: ttk.Treeview, values_iter):
+    """Clears tree with one delete call, then appends one item per values tuple."""
+    kids = tree.get_children("")
+    if kids:
+        tree.delete(*kids)
+    for values in values_iter:
+        tree.insert("", "end", values=values)
+
+
+class _LazyTreeRows:
+    """
+    Feeds an ordered list of rows into a Treeview on demand: only the first
+    CHUNK rows are attached up front and the next chunk is attached whenever
+    the view is scrolled near the end of what is attached.
+
+    Items are inserted once and afterwards only detached/moved back -
+    Treeview.insert is the slow call. `known` holds every iid created in
+    tree (attached or detached).
+    """
+
+    CHUNK = 100
+
+    def __init__(self, tree: ttk.Treeview, scrollbar: ttk.Scrollbar, iid_of, values_of):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.iid_of = iid_of
+        self.values_of = values_of
+        self.known: set = set()
+        self.rows: List[Dict[str, Any]] = []
+        self.shown = 0  # rows[:shown] are attached, in order
+        tree.configure(yscrollcommand=self._on_yscroll)
+
+    def show(self, rows: List[Dict[str, Any]]):
+        """Makes `rows` (kept by reference, in order) the content of tree."""
+        attached = self.tree.get_children()
+        if attached:
+            self.tree.detach(*attached)
+        self.rows = rows
+        self.shown = 0
+        self._attach_more()
+
+    def row_inserted(self, pos: int):
+        """
+        rows[pos] was just inserted into the shown list: attach it if it falls in
+        or right after the attached part (a row sorted last in a fully shown list
+        would otherwise never be attached: a short list never scrolls).
+        """
+        if pos <= self.shown:
+            self._attach(pos)
+            self.shown += 1
+
+    def forget(self):
+        """Deletes every item ever created in tree (rows were reloaded)."""
+        if self.known:
+            self.tree.delete(*self.known)
+            self.known.clear()
+        self.rows = []
+        self.shown = 0
+
+    def _attach(self, idx: int):
+        r = self.rows[idx]
+        iid = self.iid_of(r)
+        if iid in self.known:
+            self.tree.move(iid, "", idx)
+        else:
+            self.tree.insert("", idx, iid=iid, values=self.values_of(r))
+            self.known.add(iid)
+
+    def _attach_more(self):
+        end = min(len(self.rows), self.shown + self.CHUNK)
+        for idx in range(self.shown, end):
+            self._attach(idx)
+        self.shown = end
+
+    def _on_yscroll(self, first, last):
+        self.scrollbar.set(first, last)
+        if self.shown < len(self.rows) and float(last) >= 0.9:
+            self._attach_more()
+
+
+_FIELD_BUILDERS = {
+    "num": _make_entry,
+    "text": _make_entry,
+    "bool": _make_bool,
+    "dropdown_cartype": _make_cartype,
+    "dropdown_engineplacement": _make_id_combo,
+    "dropdown_materialtype": _make_id_combo,
+    "dropdown_engine_config": _make_id_combo,
+    "dropdown_engine_cylinders": _make_id_combo,
+    "dropdown_engine_vtiming": _make_id_combo,
+    "dropdown_engine_medianame": _make_text_combo,
+}
+
+# widget kinds the app keeps a handle to (kind -> ConstructorApp attribute)
+_FIELD_WIDGET_ATTRS = {
+    "dropdown_cartype": "_cartype_cb",
+    "dropdown_engineplacement": "_engineplacement_cb",
+    "dropdown_materialtype": "_materialtype_cb",
+    "dropdown_engine_config": "_engine_config_cb",
+    "dropdown_engine_cylinders": "_engine_cylinders_cb",
+    "dropdown_engine_vtiming": "_engine_vtiming_cb",
+    "dropdown_engine_medianame": "_engine_medianame_cb",
+}
+
+
+def _split_fields(fields: Dict[str, tk.Variable]) -> Tuple[Dict[str, tk.Variable], Dict[str, tk.Variable]]:
+    """(IntVar fields, text fields) - split once at build time, not per load/apply."""
+    ints = {k: v for k, v in fields.items() if isinstance(v, tk.IntVar)}
+    texts = {k: v for k, v in fields.items() if k not in ints}
+    return ints, texts
+
+
+def _as_int(v: Any) -> Optional[int]:
+    """int for int-like cell/entry values, else None - checked up front instead of via int() raising."""
+    if isinstance(v, int):
+        return v
+    if isinstance(v, float):
+        return int(v) if v.is_integer() else None
+    if isinstance(v, str):
+        s = v.strip()
+        if (s[1:] if s.startswith("-") else s).isdecimal():
+            return int(s)
+    return None
+
+
+def _parse_levels(s: str) -> Optional[List[int]]:
+    """ "3", "1-5" or "1,3,5" (mixable: "0,2-4") -> sorted unique levels; None if malformed."""
+    levels = set()
+    for part in s.split(","):
+        lo, sep, hi = part.partition("-")
+        lo, hi = _as_int(lo), _as_int(hi) if sep else _as_int(lo)
+        if lo is None or hi is None or lo > hi:
+            return None
+        levels.update(range(lo, hi + 1))
+    return sorted(levels)
+
+
+_INT_RE = re.compile(r"[+-]?[0-9]+")
+_FLOAT_RE = re.compile(r"[+-]?(?:[0-9]+\.[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?")
+
+
+def _parse_text_value(s: str) -> Any:
+    # Keep numeric as numeric where possible (a float needs a "."), text stays text
+    if _INT_RE.fullmatch(s):
+        return int(s)
+    if _FLOAT_RE.fullmatch(s):
+        return float(s)
+    return s
+
+
+def _fill_form(int_fields: Dict[str, tk.Variable], text_fields: Dict[str, tk.Variable], row: Dict[str, Any]):
+    for k, var in int_fields.items():
+        if k in row:
+            try:
+                var.set(int(row[k] or 0))
+            except (TypeError, ValueError):
+                var.set(0)
+    for k, var in text_fields.items():
+        if k in row:
+            var.set("" if row[k] is None else str(row[k]))
+
+
+def _read_form(int_fields: Dict[str, tk.Variable], text_fields: Dict[str, tk.Variable]) -> Dict[str, Any]:
+    """Form values as DB updates; empty text fields are left out."""
+    updates: Dict[str, Any] = {k: int(var.get()) for k, var in int_fields.items()}
+    for k, var in text_fields.items():
+        s = (var.get() or "").strip()
+        if s:
+            updates[k] = _parse_text_value(s)
+    return updates
+
+
+_LOG_MAX_LINES = 500
+_BACKUP_INTERVAL_S = 60  # edits within this window (and _BACKUP_MAX_OPS) share one backup
+_BACKUP_MAX_OPS = 25
+
 
 class ConstructorApp(tk.Tk):
     def __init__(self):
@@ -57,8 +555,46 @@ class ConstructorApp(tk.Tk):
 
         self.main_db: Optional[Path] = None
         self.dlc_folder: Optional[Path] = None
-        self.sources: List[Path] = []  # includes MAIN + DLC paths
+        self.sources: Tuple[Path, ...] = ()  # includes MAIN + DLC paths; replaced only by reload_sources
+        self._source_index: Dict[str, int] = {}  # str(path) -> index in self.sources
+        # realpath strings computed once per reload (string compares, no stat per click)
+        self._main_db_str: str = ""
+        self._source_real_index: Dict[str, int] = {}  # realpath -> index in self.sources
+        self._sources_by_name: Dict[str, Path] = {}  # lowercased basename -> first source with that name
         self.lookup_cache: Dict[str, Dict[int, str]] = {}
+        # table -> (id_by_label, label_by_id, values), formatted once per lookup_cache rebuild
+        self._formatted_lookups: Dict[str, Tuple[Dict[str, int], Dict[int, str], Tuple[str, ...]]] = {}
+        # source keys -> build_powertrain_options result; labels use lookup_cache, so it is reset with it
+        self._powertrain_cache: Dict[Tuple[Any, ...], List[Tuple[int, str]]] = {}
+        # (table, column, source keys) -> (id_by_label, label_by_id, values) for the row editor dropdowns
+        self._combo_values_cache: Dict[Tuple[Any, ...], Tuple[Dict[str, int], Dict[int, str], Tuple[str, ...]]] = {}
+        self._all_car_rows: List[Dict[str, Any]] = []  # cached list_cars_all_sources + filter keys
+        self._car_row_by_iid: Dict[str, Dict[str, Any]] = {}
+        self._car_view_rows: List[Dict[str, Any]] = []  # filtered + sorted, paged into car_tree
+        self._car_view_key: Optional[Tuple[str, bool, str]] = None  # (query, only_clones, sort) of the view
+        self._car_page = 0
+        self._car_page_size = 500
+        self._all_engine_rows: List[Dict[str, Any]] = []
+        self._engine_row_by_iid: Dict[str, Dict[str, Any]] = {}
+        self._engine_view_rows: List[Dict[str, Any]] = []  # filtered + sorted, fed into engine_tree on scroll
+        self._engine_view_key: Optional[str] = None  # query of the current engine view
+
+        self._after_ids: Dict[str, str] = {}  # debounce handles by name
+        self._log_buffer: List[str] = []  # flushed to the log widget once per idle
+
+        # edit backups are coalesced: see _ensure_backup
+        self._last_backup_ts: Optional[float] = None
+        self._ops_since_backup = 0
+        # "Backup MAIN now" copies on this worker; buttons that write MAIN are disabled meanwhile
+        self._backup_executor = ThreadPoolExecutor(max_workers=1)
+        self._backup_future: Optional[Future] = None
+        self._mutation_buttons: List[ttk.Button] = []
+
+        # background reload: the worker posts (generation, result, error); older generations are dropped
+        self._reload_gen = 0
+        self._reload_queue: "queue.Queue[Tuple[int, Optional[Dict[str, Any]], Optional[Exception]]]" = queue.Queue()
+        self._reload_poll_id: Optional[str] = None
+        self._engine_medianames: List[str] = []
 
         self.selected_car_id: Optional[int] = None
         self.selected_car_source: Optional[Path] = None
@@ -66,7 +602,18 @@ class ConstructorApp(tk.Tk):
         self.selected_engine_id: Optional[int] = None
         self.selected_engine_source: Optional[Path] = None
 
+        # rows the body/engine forms were last loaded from (Save all writes them back)
+        self._carbody_id: Optional[int] = None
+        self._engine_fields_id: Optional[int] = None
+
         self._build_ui()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _on_close(self):
+        # let a running backup finish its copy, then drop the cached connections
+        self._backup_executor.shutdown(wait=True)
+        ce.close_shared_connections()
+        self.destroy()
 
     # ----------------------------
     # UI build
@@ -79,16 +626,22 @@ class ConstructorApp(tk.Tk):
         if not source_value:
             return None
 
+        # Match by basename against loaded sources first (the list shows basenames; no FS access)
+        sp = self._sources_by_name.get(source_value.lower())
+        if sp is not None:
+            return sp
+
+        # Full path: exact string, then the realpaths captured at reload
+        i = self._source_index.get(source_value)
+        if i is None:
+            i = self._source_real_index.get(os.path.realpath(source_value))
+        if i is not None:
+            return self.sources[i]
+
         p = Path(source_value)
         if p.exists():
             return p
 
-        # Try match by basename against loaded sources
-        sv = source_value.lower()
-        for sp in self.sources:
-            if sp.name.lower() == sv:
-                return sp
-
         return None
 
     def clone_selected_engine_into_main(self):
@@ -144,8 +697,21 @@ class ConstructorApp(tk.Tk):
             f"Backup: {backup_path}\n\n"
         )
         messagebox.showinfo("Engine cloned", f"Cloned Engine {src_engine_id} → {new_engine_id} into MAIN.")
-
-        self.refresh_engine_list()
+        self._show_cloned_engine(src_path, src_engine_id, new_engine_id)
+
+    def _show_cloned_engine(self, src_path: Path, src_engine_id: int, new_engine_id: int):
+        # Show the new row without re-reading every source; fall back to a full reload
+        donor = self._engine_row_by_iid.get(_row_iid(src_engine_id, str(src_path)))
+        if donor is not None and _row_iid(new_engine_id, str(self.main_db)) not in self._engine_row_by_iid:
+            self._insert_engine_row({
+                "EngineID": new_engine_id,
+                "EngineName": donor.get("EngineName") or "",
+                "MediaName": donor.get("MediaName") or "",
+                "Source": str(self.main_db),
+            })
+        else:
+            self._load_engine_rows()
+            self.refresh_engine_list()
         
     def _suggest_engine_id(self):
         if suggest_next_engine_id is None:
@@ -197,26 +763,32 @@ class ConstructorApp(tk.Tk):
         self.car_search_var = tk.StringVar()
         ent = ttk.Entry(sr, textvariable=self.car_search_var)
         ent.pack(side="left", fill="x", expand=True, padx=6)
-        ent.bind("<KeyRelease>", lambda e: self.refresh_car_list())
+        ent.bind("<KeyRelease>", lambda e: self._schedule_refresh_cars())
         self.only_clones_var = tk.IntVar(value=0)
         ttk.Checkbutton(
             sr,
             text="Show only cloned (Year=6969 or CarID>=2000)",
             variable=self.only_clones_var,
-            command=self.refresh_car_list,
+            command=self._schedule_refresh_cars,
         ).pack(side="left", padx=6)
 
         sortbar = ttk.Frame(left)
         sortbar.pack(fill="x", pady=(0, 6))
         ttk.Label(sortbar, text="Sort by:").pack(side="left")
         self.car_sort_var = tk.StringVar(value="CarID")
-        ttk.Combobox(
+        sort_cb = ttk.Combobox(
             sortbar,
             textvariable=self.car_sort_var,
             state="readonly",
             values=["CarID", "MediaName", "Year", "Source"],
-        ).pack(side="left", padx=6)
+        )
+        sort_cb.pack(side="left", padx=6)
+        sort_cb.bind("<<ComboboxSelected>>", lambda e: self._schedule_refresh_cars())
         ttk.Button(sortbar, text="Apply", command=self.refresh_car_list).pack(side="left")
+        ttk.Button(sortbar, text="Next ▶", command=lambda: self._car_page_step(1)).pack(side="right")
+        self.car_page_lbl = ttk.Label(sortbar, text="")
+        self.car_page_lbl.pack(side="right", padx=6)
+        ttk.Button(sortbar, text="◀ Prev", command=lambda: self._car_page_step(-1)).pack(side="right")
 
         cols = ("CarID", "MediaName", "Year", "Source")
         self.car_tree = ttk.Treeview(left, columns=cols, show="headings", height=18)
@@ -226,7 +798,7 @@ class ConstructorApp(tk.Tk):
         self.car_tree.pack(fill="both", expand=True)
 
         ys = ttk.Scrollbar(left, orient="vertical", command=self.car_tree.yview)
-        self.car_tree.configure(yscrollcommand=ys.set)
+        self._car_tree_rows = _LazyTreeRows(self.car_tree, ys, _car_iid, _car_values)
         ys.place(in_=self.car_tree, relx=1.0, rely=0, relheight=1.0, anchor="ne")
 
         self.car_tree.bind("<<TreeviewSelect>>", self.on_car_select)
@@ -250,7 +822,8 @@ class ConstructorApp(tk.Tk):
         bottom = ttk.Frame(self)
         bottom.pack(side="bottom", fill="x", padx=10, pady=8)
 
-        ttk.Button(bottom, text="Backup MAIN now", command=self.backup_main).pack(side="left")
+        self._mutation_button(bottom, text="Backup MAIN now", command=self.backup_main).pack(side="left")
+        self._mutation_button(bottom, text="Save all tabs to MAIN", command=self.save_all_fields).pack(side="left", padx=6)
         ttk.Button(bottom, text="Validate selected car (basic)", command=self.validate_selected_car).pack(
             side="left", padx=6
         )
@@ -297,7 +870,7 @@ class ConstructorApp(tk.Tk):
 
         ttk.Separator(frm).grid(row=4, column=0, columnspan=6, sticky="ew", pady=12)
 
-        ttk.Button(frm, text="Clone selected donor into MAIN", command=self.clone_selected_car_into_main).grid(
+        self._mutation_button(frm, text="Clone selected donor into MAIN", command=self.clone_selected_car_into_main).grid(
             row=5, column=0, columnspan=2, sticky="w"
         )
 
@@ -363,10 +936,7 @@ class ConstructorApp(tk.Tk):
 
         # If donor is from DLC, also use MAIN as extra source (common: extra upgrade rows live in MAIN)
         extra = None
-        try:
-            if donor_src.resolve() != self.main_db.resolve():
-                extra = self.main_db
-        except Exception:
+        if os.path.realpath(str(donor_src)) != self._main_db_str:
             extra = self.main_db
 
         try:
@@ -393,8 +963,18 @@ class ConstructorApp(tk.Tk):
             self._log(f"  {t}: {n}\n")
         self._log("\n")
 
-        # Refresh UI
-        self.refresh_car_list()
+        # Show the new row without re-reading every source; fall back to a full reload
+        donor = self._car_row_by_iid.get(_row_iid(donor_id, str(donor_src)))
+        if donor is not None and _row_iid(new_id, str(self.main_db)) not in self._car_row_by_iid:
+            self._insert_car_row({
+                "CarID": new_id,
+                "MediaName": donor.get("MediaName") or "",
+                "Year": year_marker,
+                "Source": str(self.main_db),
+            })
+        else:
+            self._load_car_rows()
+            self.refresh_car_list()
 
     def _build_tab_car(self):
         tab = ttk.Frame(self.nb)
@@ -402,84 +982,24 @@ class ConstructorApp(tk.Tk):
 
         self.car_fields: Dict[str, tk.Variable] = {}
 
-        # Field definitions: (column, label, widget_type)
-        # widget_type: "num", "text", "bool", "dropdown"
-        fields = [
-            ("CarTypeID", "CarTypeID (1 Production, 2 Race, 3 Pre-Tuned)", "dropdown_cartype"),
-            ("EnginePlacementID", "EnginePlacementID", "dropdown_engineplacement"),
-            ("MaterialTypeID", "MaterialTypeID", "dropdown_materialtype"),
-            ("CurbWeight", "CurbWeight", "num"),
-            ("WeightDistribution", "WeightDistribution", "num"),
-            ("NumGears", "NumGears", "num"),
-            ("TireBrandID", "TireBrandID", "num"),
-            ("FrontTireWidthMM", "FrontTireWidthMM", "num"),
-            ("FrontTireAspect", "FrontTireAspect", "num"),
-            ("FrontWheelDiameterIN", "FrontWheelDiameterIN", "num"),
-            ("RearTireWidthMM", "RearTireWidthMM", "num"),
-            ("RearTireAspect", "RearTireAspect", "num"),
-            ("RearWheelDiameterIN", "RearWheelDiameterIN", "num"),
-            ("BaseCost", "BaseCost", "num"),
-            ("IsUnicorn", "IsUnicorn (0/1)", "bool"),
-        ]
-
-        frm = ttk.Frame(tab)
-        frm.pack(fill="both", expand=True, padx=10, pady=10)
+        # Field count is small and fixed: grid straight into the frame (no scroll canvas)
+        inner = ttk.Frame(tab)
+        inner.pack(fill="both", expand=True, padx=10, pady=10)
 
-        canvas = tk.Canvas(frm, highlightthickness=0)
-        canvas.pack(side="left", fill="both", expand=True)
-        vs = ttk.Scrollbar(frm, orient="vertical", command=canvas.yview)
-        vs.pack(side="right", fill="y")
-        canvas.configure(yscrollcommand=vs.set)
-        inner = ttk.Frame(canvas)
-        canvas.create_window((0, 0), window=inner, anchor="nw")
-        inner.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-
-        r = 0
-        for col, label, kind in fields:
+        for r, (col, label, kind) in enumerate(CAR_FIELDS):
             ttk.Label(inner, text=label).grid(row=r, column=0, sticky="w", pady=4, padx=(0, 10))
-
-            if kind == "bool":
-                v = tk.IntVar(value=0)
-                self.car_fields[col] = v
-                ttk.Checkbutton(inner, variable=v).grid(row=r, column=1, sticky="w")
-            elif kind == "dropdown_cartype":
-                v = tk.IntVar(value=1)
-                self.car_fields[col] = v
-                cb = ttk.Combobox(inner, state="readonly",
-                                  values=["1 Production", "2 Race", "3 Pre-Tuned"])
-                cb.grid(row=r, column=1, sticky="ew")
-                cb.bind("<<ComboboxSelected>>", lambda e, var=v, widget=cb: var.set(int(widget.get().split()[0])))
-                cb._var_ref = v  # keep
-                self._cartype_cb = cb
-            elif kind == "dropdown_engineplacement":
-                v = tk.IntVar(value=0)
-                self.car_fields[col] = v
-                cb = ttk.Combobox(inner, state="readonly")
-                cb.grid(row=r, column=1, sticky="ew")
-                cb._idvar = v
-                self._engineplacement_cb = cb
-            elif kind == "dropdown_materialtype":
-                v = tk.IntVar(value=0)
-                self.car_fields[col] = v
-                cb = ttk.Combobox(inner, state="readonly")
-                cb.grid(row=r, column=1, sticky="ew")
-                cb._idvar = v
-                self._materialtype_cb = cb
-
-            else:
-                v = tk.StringVar(value="")
-                self.car_fields[col] = v
-                e = ttk.Entry(inner, textvariable=v)
-                e.grid(row=r, column=1, sticky="ew")
-
-            r += 1
+            v, w = _FIELD_BUILDERS[kind](inner, r)
+            self.car_fields[col] = v
+            if kind in _FIELD_WIDGET_ATTRS:
+                setattr(self, _FIELD_WIDGET_ATTRS[kind], w)
+        self._car_int_fields, self._car_str_fields = _split_fields(self.car_fields)
 
         inner.columnconfigure(1, weight=1)
 
         btns = ttk.Frame(tab)
         btns.pack(fill="x", padx=10, pady=(0, 10))
         ttk.Button(btns, text="Load from MAIN", command=self.load_car_fields).pack(side="left")
-        ttk.Button(btns, text="Apply to MAIN", command=self.apply_car_fields).pack(side="left", padx=6)
+        self._mutation_button(btns, text="Apply to MAIN", command=self.apply_car_fields).pack(side="left", padx=6)
 
     def _build_tab_body(self):
         tab = ttk.Frame(self.nb)
@@ -508,7 +1028,7 @@ class ConstructorApp(tk.Tk):
         btns = ttk.Frame(tab)
         btns.pack(fill="x", padx=10, pady=(0, 10))
         ttk.Button(btns, text="Load from MAIN", command=self.load_body_fields).pack(side="left")
-        ttk.Button(btns, text="Apply to MAIN", command=self.apply_body_fields).pack(side="left", padx=6)
+        self._mutation_button(btns, text="Apply to MAIN", command=self.apply_body_fields).pack(side="left", padx=6)
 
     def _build_tab_engine(self):
         tab = ttk.Frame(self.nb)
@@ -534,7 +1054,7 @@ class ConstructorApp(tk.Tk):
         self.engine_search_var = tk.StringVar()
         se = ttk.Entry(sr, textvariable=self.engine_search_var)
         se.pack(side="left", fill="x", expand=True, padx=6)
-        se.bind("<KeyRelease>", lambda e: self.refresh_engine_list())
+        se.bind("<KeyRelease>", lambda e: self._schedule_refresh_engines())
 
         cols = ("EngineID", "EngineName", "MediaName", "Source")
         self.engine_tree = ttk.Treeview(left, columns=cols, show="headings", height=16)
@@ -544,7 +1064,7 @@ class ConstructorApp(tk.Tk):
         self.engine_tree.pack(fill="both", expand=True)
 
         ys = ttk.Scrollbar(left, orient="vertical", command=self.engine_tree.yview)
-        self.engine_tree.configure(yscrollcommand=ys.set)
+        self._engine_tree_rows = _LazyTreeRows(self.engine_tree, ys, _engine_iid, _engine_values)
         ys.place(in_=self.engine_tree, relx=1.0, rely=0, relheight=1.0, anchor="ne")
 
         self.engine_tree.bind("<<TreeviewSelect>>", self.on_engine_select)
@@ -556,13 +1076,13 @@ class ConstructorApp(tk.Tk):
         assign = ttk.LabelFrame(right, text="Assign / Clone")
         assign.pack(fill="x", pady=(0, 8))
 
-        ttk.Button(
+        self._mutation_button(
             assign,
             text="Assign selected engine as STOCK (to selected car)",
             command=self.assign_selected_engine_as_stock,
         ).pack(side="left", padx=6, pady=6)
 
-        ttk.Button(
+        self._mutation_button(
             assign,
             text="Clone selected engine into MAIN",
             command=self.clone_selected_engine_into_main,
@@ -580,85 +1100,18 @@ class ConstructorApp(tk.Tk):
         editor.pack(fill="both", expand=True)
 
         self.engine_fields: Dict[str, tk.Variable] = {}
-        engine_cols = [
-            ("EngineMass-kg", 'EngineMass-kg', "num"),
-            ("MediaName", "MediaName", "dropdown_engine_medianame"),
-            ("ConfigID", "ConfigID", "dropdown_engine_config"),
-            ("CylinderID", "CylinderID", "dropdown_engine_cylinders"),
-            ("Compression", "Compression", "num"),
-            ("VariableTimingID", "VariableTimingID", "dropdown_engine_vtiming"),
-            ("StockBoost-bar", 'StockBoost-bar', "num"),
-            ("MomentInertia", "MomentInertia", "num"),
-            ("GasTankSize", "GasTankSize", "num"),
-            ("TorqueSteerLeftSpeedScale", "TorqueSteerLeftSpeedScale", "num"),
-            ("TorqueSteerRightSpeedScale", "TorqueSteerRightSpeedScale", "num"),
-            ("EngineGraphingMaxTorque", "EngineGraphingMaxTorque", "num"),
-            ("EngineGraphingMaxPower", "EngineGraphingMaxPower", "num"),
-            ("EngineName", "EngineName", "text"),
-            ("EngineRotation", "EngineRotation", "num"),
-            ("Carbureted", "Carbureted (0/1)", "bool"),
-            ("Diesel", "Diesel (0/1)", "bool"),
-            ("Rotary", "Rotary (0/1)", "bool"),
-        ]
 
-        frm = ttk.Frame(editor)
-        frm.pack(fill="both", expand=True, padx=10, pady=10)
+        # Field count is small and fixed: grid straight into the frame (no scroll canvas)
+        inner = ttk.Frame(editor)
+        inner.pack(fill="both", expand=True, padx=10, pady=10)
 
-        canvas = tk.Canvas(frm, highlightthickness=0)
-        canvas.pack(side="left", fill="both", expand=True)
-        vs = ttk.Scrollbar(frm, orient="vertical", command=canvas.yview)
-        vs.pack(side="right", fill="y")
-        canvas.configure(yscrollcommand=vs.set)
-        inner = ttk.Frame(canvas)
-        canvas.create_window((0, 0), window=inner, anchor="nw")
-        inner.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
-
-        r = 0
-        for col, label, kind in engine_cols:
+        for r, (col, label, kind) in enumerate(ENGINE_FIELDS):
             ttk.Label(inner, text=label).grid(row=r, column=0, sticky="w", pady=4, padx=(0, 10))
-
-            if kind == "bool":
-                v = tk.IntVar(value=0)
-                self.engine_fields[col] = v
-                ttk.Checkbutton(inner, variable=v).grid(row=r, column=1, sticky="w")
-
-            elif kind == "dropdown_engine_medianame":
-                v = tk.StringVar(value="")
-                self.engine_fields[col] = v
-                cb = ttk.Combobox(inner, textvariable=v, state="readonly")
-                cb.grid(row=r, column=1, sticky="ew")
-                self._engine_medianame_cb = cb
-
-            elif kind == "dropdown_engine_config":
-                v = tk.IntVar(value=0)
-                self.engine_fields[col] = v
-                cb = ttk.Combobox(inner, state="readonly")
-                cb.grid(row=r, column=1, sticky="ew")
-                cb._idvar = v
-                self._engine_config_cb = cb
-
-            elif kind == "dropdown_engine_cylinders":
-                v = tk.IntVar(value=0)
-                self.engine_fields[col] = v
-                cb = ttk.Combobox(inner, state="readonly")
-                cb.grid(row=r, column=1, sticky="ew")
-                cb._idvar = v
-                self._engine_cylinders_cb = cb
-
-            elif kind == "dropdown_engine_vtiming":
-                v = tk.IntVar(value=0)
-                self.engine_fields[col] = v
-                cb = ttk.Combobox(inner, state="readonly")
-                cb.grid(row=r, column=1, sticky="ew")
-                cb._idvar = v
-                self._engine_vtiming_cb = cb
-
-            else:
-                v = tk.StringVar(value="")
-                self.engine_fields[col] = v
-                ttk.Entry(inner, textvariable=v).grid(row=r, column=1, sticky="ew")
-
-            r += 1
+            v, w = _FIELD_BUILDERS[kind](inner, r)
+            self.engine_fields[col] = v
+            if kind in _FIELD_WIDGET_ATTRS:
+                setattr(self, _FIELD_WIDGET_ATTRS[kind], w)
+        self._engine_int_fields, self._engine_str_fields = _split_fields(self.engine_fields)
 
         inner.columnconfigure(1, weight=1)
 
@@ -667,7 +1120,7 @@ class ConstructorApp(tk.Tk):
         btns = ttk.Frame(editor)
         btns.pack(fill="x", padx=10, pady=(0, 10))
         ttk.Button(btns, text="Load engine fields from MAIN", command=self.load_engine_fields).pack(side="left")
-        ttk.Button(btns, text="Apply engine edits to MAIN", command=self.apply_engine_fields).pack(side="left", padx=6)
+        self._mutation_button(btns, text="Apply engine edits to MAIN", command=self.apply_engine_fields).pack(side="left", padx=6)
         
  
 
@@ -681,10 +1134,12 @@ class ConstructorApp(tk.Tk):
 
         ttk.Label(top, text="Table:").pack(side="left")
         self.table_var = tk.StringVar(value="")
-        self.table_cb = ttk.Combobox(top, textvariable=self.table_var, state="readonly", values=[])
+        self.table_cb = ttk.Combobox(top, textvariable=self.table_var, state="readonly", values=())
         self.table_cb.pack(side="left", padx=6)
         self._table_display_to_real = {}
         self._table_real_to_display = {}
+        self._current_table_cached: Optional[str] = None  # see _current_table
+        self.table_var.trace_add("write", lambda *_: self._forget_current_table())
 
         ttk.Button(top, text="Refresh table list", command=self.refresh_table_list).pack(side="left", padx=6)
 
@@ -713,8 +1168,8 @@ class ConstructorApp(tk.Tk):
 
         row_btns = ttk.Frame(left)
         row_btns.pack(fill="x", pady=(8, 0))
-        ttk.Button(row_btns, text="Add row (copy selected)", command=self.add_row_copy).pack(side="left")
-        ttk.Button(row_btns, text="Delete selected row", command=self.delete_selected_row).pack(side="left", padx=6)
+        self._mutation_button(row_btns, text="Add row (copy selected)", command=self.add_row_copy).pack(side="left")
+        self._mutation_button(row_btns, text="Delete selected row", command=self.delete_selected_row).pack(side="left", padx=6)
 
         right = ttk.Frame(mid)
         mid.add(right, weight=2)
@@ -735,10 +1190,12 @@ class ConstructorApp(tk.Tk):
         self.current_row_fields: Dict[str, tk.StringVar] = {}
         self.current_row_rowid: Optional[int] = None
         self.current_row_full: Dict[str, Any] = {}
+        self._current_row_iid: Optional[str] = None  # rows_tree item of current_row_rowid
+        self._rows_scope_col: Optional[str] = None  # scope column the rows were loaded by
 
         bottom = ttk.Frame(tab)
         bottom.pack(fill="x", padx=10, pady=(0, 10))
-        ttk.Button(bottom, text="Apply row edits (MAIN)", command=self.apply_row_edits).pack(side="left")
+        self._mutation_button(bottom, text="Apply row edits (MAIN)", command=self.apply_row_edits).pack(side="left")
 
     def _build_tab_constructor(self):
         tab = ttk.Frame(self.nb)
@@ -763,7 +1220,7 @@ class ConstructorApp(tk.Tk):
 
         ttk.Label(line, text="Donor source:").pack(side="left")
         self.donor_source_var = tk.StringVar(value="")
-        self.donor_source_cb = ttk.Combobox(line, textvariable=self.donor_source_var, state="readonly", values=[])
+        self.donor_source_cb = ttk.Combobox(line, textvariable=self.donor_source_var, state="readonly", values=())
         self.donor_source_cb.pack(side="left", padx=6, fill="x", expand=True)
 
         ttk.Label(line, text="Subsystem:").pack(side="left")
@@ -777,8 +1234,8 @@ class ConstructorApp(tk.Tk):
         self.level_var = tk.StringVar(value="0")
         ttk.Entry(line, textvariable=self.level_var, width=6).pack(side="left", padx=6)
 
-        ttk.Button(wrap, text="Apply donor subsystem to selected car (writes MAIN)",
-                   command=self.apply_subsystem).pack(anchor="w", pady=6)
+        self._mutation_button(wrap, text="Apply donor subsystem to selected car (writes MAIN)",
+                              command=self.apply_subsystem).pack(anchor="w", pady=6)
 
         self.constructor_log = tk.Text(wrap, height=18, wrap="word")
         self.constructor_log.pack(fill="both", expand=True, pady=10)
@@ -792,6 +1249,7 @@ class ConstructorApp(tk.Tk):
         if not fp:
             return
         self.main_db = Path(fp)
+        self._last_backup_ts = None  # first edit on the new MAIN backs it up
         self.main_lbl.configure(text=f"MAIN: {self.main_db.name}")
         self.reload_sources()
 
@@ -804,134 +1262,294 @@ class ConstructorApp(tk.Tk):
         self.reload_sources()
 
     def reload_sources(self):
+        """
+        Scans and reads every source on a worker thread (source list, car/engine
+        lists, lookup cache) and applies the result on the Tk thread, so the UI
+        stays responsive while a large DLC folder is read.
+        """
         if not self.main_db:
             return
-        self.sources = ce.build_source_list(self.main_db, self.dlc_folder)
+        self._reload_gen += 1
+        ce.close_shared_connections()  # MAIN may have been swapped or replaced on disk
+        _cached_engine_name.cache_clear()
+        self._log("Loading sources...\n")
+        threading.Thread(
+            target=self._reload_worker,
+            args=(self._reload_gen, self.main_db, self.dlc_folder),
+            daemon=True,
+        ).start()
+        if self._reload_poll_id is None:
+            self._poll_reload()
+
+    def _reload_worker(self, gen: int, main_db: Path, dlc_folder: Optional[Path]):
+        # off the Tk thread: no widget access, everything goes back through _reload_queue
+        try:
+            sources = tuple(ce.build_source_list(main_db, dlc_folder))
+            result = {
+                "sources": sources,
+                "cars": _merge_source_rows(sources, _cached_list_cars, "CarID"),
+                "engines": _merge_source_rows(sources, _cached_list_engines, "EngineID"),
+                "lookup_cache": ce.build_lookup_cache(main_db, sources),
+                "engine_medianames": _engine_medianames(sources),
+            }
+            key = _source_key(main_db)
+            if key:
+                _cached_car_related_tables(*key)  # warms the memo refresh_table_list reads
+        except Exception as e:
+            self._reload_queue.put((gen, None, e))
+            return
+        self._reload_queue.put((gen, result, None))
+
+    def _poll_reload(self):
+        self._reload_poll_id = None
+        while True:
+            try:
+                gen, result, err = self._reload_queue.get_nowait()
+            except queue.Empty:
+                break
+            if gen != self._reload_gen:
+                continue  # superseded by a newer reload
+            if err is not None:
+                self._log(f"Reload failed: {err}\n")
+                messagebox.showerror("Reload failed", str(err))
+            else:
+                self._apply_reload_result(result)
+            return
+        self._reload_poll_id = self.after(50, self._poll_reload)
+
+    def _apply_reload_result(self, result: Dict[str, Any]):
+        self.sources = result["sources"]
+        self._source_index = {str(sp): i for i, sp in enumerate(self.sources)}
+        self._main_db_str = os.path.realpath(str(self.main_db))
+        self._source_real_index = {os.path.realpath(str(sp)): i for i, sp in enumerate(self.sources)}
+        self._sources_by_name = {}
+        for sp in self.sources:
+            self._sources_by_name.setdefault(sp.name.lower(), sp)
         self._log(f"Loaded sources: {len(self.sources)}\n")
+        self._load_car_rows(result["cars"])
+        self._load_engine_rows(result["engines"])
         self.refresh_car_list()
         self.refresh_engine_list()
         self.refresh_table_list()
         self._refresh_donor_sources()
-        # auto-build lookups so dropdowns aren't empty
-        self.lookup_cache = ce.build_lookup_cache(self.main_db, self.sources)
-        self._refresh_dropdowns()
+        # lookups are built with the reload so dropdowns aren't empty
+        self._set_lookup_cache(result["lookup_cache"], result["engine_medianames"])
 
 
-    def rebuild_cache(self):
+    def rebuild_cache(self, clear_memo: bool = True):
         if not self.main_db:
             messagebox.showwarning("Missing MAIN", "Select MAIN SLT first.")
             return
-        self.lookup_cache = ce.build_lookup_cache(self.main_db, self.sources)
+        if clear_memo:
+            _clear_source_memo()
+        self._set_lookup_cache(
+            ce.build_lookup_cache(self.main_db, self.sources),
+            _engine_medianames(self.sources),
+        )
+
+    def _set_lookup_cache(self, cache: Dict[str, Dict[int, str]], engine_medianames: List[str]):
+        self.lookup_cache = cache
+        self._engine_medianames = engine_medianames
+        self._formatted_lookups = {}
+        self._powertrain_cache = {}
+        self._combo_values_cache = {}
+        for table, lookup in self.lookup_cache.items():
+            id_by_label = {f"{k} - {v}": k for k, v in sorted(lookup.items())}
+            label_by_id = {k: lbl for lbl, k in id_by_label.items()}
+            self._formatted_lookups[table] = (id_by_label, label_by_id, tuple(id_by_label))
         self._log("Lookup cache rebuilt.\n")
         self._refresh_dropdowns()
 
+    def _powertrain_options(self) -> List[Tuple[int, str]]:
+        """ce.build_powertrain_options, reused until a source SLT changes or the lookups are rebuilt."""
+        key = tuple(_source_key(p) for p in self.sources)
+        opts = self._powertrain_cache.get(key)
+        if opts is None:
+            opts = self._powertrain_cache[key] = ce.build_powertrain_options(list(self.sources), self.lookup_cache)
+        return opts
+
+    def _row_combo_values(self, table: str, col: str, labels) -> Tuple[Dict[str, int], Dict[int, str], Tuple[str, ...]]:
+        """
+        (id_by_label, label_by_id, values) for a row editor dropdown, formatted once per
+        (table, column) and source set; labels() yields the (label, id) pairs on a miss.
+        An id listed by several sources preselects its first label.
+        """
+        key = (table.lower(), col, tuple(_source_key(p) for p in self.sources))
+        fmt = self._combo_values_cache.get(key)
+        if fmt is None:
+            id_by_label = dict(labels())
+            label_by_id: Dict[int, str] = {}
+            for lbl, i in id_by_label.items():
+                label_by_id.setdefault(i, lbl)
+            fmt = self._combo_values_cache[key] = (id_by_label, label_by_id, tuple(id_by_label))
+        return fmt
+
+    @staticmethod
+    def _preselect_combo(cb: ttk.Combobox, label_by_id: Dict[int, str], v: Any):
+        label = label_by_id.get(_as_int(v))
+        if label is not None:
+            cb.set(label)
+
+    def _fill_lookup_combo(self, cb_attr: str, *tables: str):
+        """
+        Fills an id-backed combobox from the first non-empty lookup table, using the
+        label<->id dicts formatted in _set_lookup_cache (selection is bound in _make_id_combo).
+        """
+        cb = getattr(self, cb_attr, None)
+        if cb is None:
+            return
+        empty = ({}, {}, ())
+        fmt = next((self._formatted_lookups[t] for t in tables if self._formatted_lookups.get(t, empty)[0]), empty)
+        cb._id_by_label, cb._label_by_id, values = fmt
+        _set_combo_values(cb, values)
+
     def _refresh_dropdowns(self):
         # EnginePlacement (id = EnginePlacement, name = DisplayName)
-        ep = self.lookup_cache.get("List_EnginePlacement", {})
-        if hasattr(self, "_engineplacement_cb"):
-            vals = [f"{k} - {v}" for k, v in sorted(ep.items())]
-            self._engineplacement_cb.configure(values=vals)
-            self._engineplacement_cb.bind(
-                "<<ComboboxSelected>>",
-                lambda e, cb=self._engineplacement_cb: cb._idvar.set(int(cb.get().split(" - ")[0]))
-            )
+        self._fill_lookup_combo("_engineplacement_cb", "List_EnginePlacement")
 
         # MaterialType (id = MaterialTypeID, name = Material)
-        mt = self.lookup_cache.get("List_MaterialType", {})
-        if hasattr(self, "_materialtype_cb"):
-            vals = [f"{k} - {v}" for k, v in sorted(mt.items())]
-            self._materialtype_cb.configure(values=vals)
-            self._materialtype_cb.bind(
-                "<<ComboboxSelected>>",
-                lambda e, cb=self._materialtype_cb: cb._idvar.set(int(cb.get().split(" - ")[0]))
-            )
-            
+        self._fill_lookup_combo("_materialtype_cb", "List_MaterialType")
+
         # Engine Config dropdown: List_EngineConfig (EngineConfig -> DisplayName)
-        ec = self.lookup_cache.get("List_EngineConfig", {})
-        if hasattr(self, "_engine_config_cb"):
-            vals = [f"{k} - {v}" for k, v in sorted(ec.items())]
-            self._engine_config_cb.configure(values=vals)
-            self._engine_config_cb.bind(
-                "<<ComboboxSelected>>",
-                lambda e, cb=self._engine_config_cb: cb._idvar.set(int(cb.get().split(" - ")[0]))
-            )
+        self._fill_lookup_combo("_engine_config_cb", "List_EngineConfig")
 
         # Cylinders: List_Cylinders or List_Cylinder (CylinderID -> Number)
-        cyl = self.lookup_cache.get("List_Cylinders", {}) or self.lookup_cache.get("List_Cylinder", {})
-        if hasattr(self, "_engine_cylinders_cb"):
-            vals = [f"{k} - {v}" for k, v in sorted(cyl.items())]
-            self._engine_cylinders_cb.configure(values=vals)
-            self._engine_cylinders_cb.bind(
-                "<<ComboboxSelected>>",
-                lambda e, cb=self._engine_cylinders_cb: cb._idvar.set(int(cb.get().split(" - ")[0]))
-            )
+        self._fill_lookup_combo("_engine_cylinders_cb", "List_Cylinders", "List_Cylinder")
 
         # Variable timing: List_VariableTiming (VariableTimingID -> VariableTimingType)
-        vt = self.lookup_cache.get("List_VariableTiming", {})
-        if hasattr(self, "_engine_vtiming_cb"):
-            vals = [f"{k} - {v}" for k, v in sorted(vt.items())]
-            self._engine_vtiming_cb.configure(values=vals)
-            self._engine_vtiming_cb.bind(
-                "<<ComboboxSelected>>",
-                lambda e, cb=self._engine_vtiming_cb: cb._idvar.set(int(cb.get().split(" - ")[0]))
-            )
+        self._fill_lookup_combo("_engine_vtiming_cb", "List_VariableTiming")
 
         # Engine MediaName dropdown: unique MediaName values from all sources' Data_Engine
         if hasattr(self, "_engine_medianame_cb"):
-            names = ce.list_distinct_engine_medianames(self.sources)
-            self._engine_medianame_cb.configure(values=names)
-
-
+            _set_combo_values(self._engine_medianame_cb, tuple(self._engine_medianames))
 
         # CarType
         if hasattr(self, "_cartype_cb"):
             # set by load_car_fields
             pass
 
+    # ----------------------------
+    # Debounced list refresh
+    # ----------------------------
+    def _debounce(self, name: str, fn, delay_ms: int = 200):
+        """Runs fn once, delay_ms after the last call for this name (earlier calls are dropped)."""
+        pending = self._after_ids.pop(name, None)
+        if pending:
+            self.after_cancel(pending)
+
+        def run():
+            self._after_ids.pop(name, None)
+            fn()
+
+        self._after_ids[name] = self.after(delay_ms, run)
+
+    def _schedule_refresh_cars(self):
+        self._debounce("cars", self.refresh_car_list)
+
+    def _schedule_refresh_engines(self):
+        self._debounce("engines", self.refresh_engine_list)
+
     # ----------------------------
     # Cars list
     # ----------------------------
-    def refresh_car_list(self):
-        for i in self.car_tree.get_children():
-            self.car_tree.delete(i)
+    def _load_car_rows(self, cars: Optional[List[Dict[str, Any]]] = None):
+        """
+        Reads cars from all sources once (unless already read by the reload worker)
+        and precomputes the filter keys: _is_clone (Year=6969 or CarID>=2000) and
+        _blob (lowercased search text).
+        """
+        if cars is None:
+            cars = _merge_source_rows(self.sources, _cached_list_cars, "CarID")
+        for c in cars:
+            self._set_car_filter_keys(c)
+        self._all_car_rows = cars
+        self._car_row_by_iid = {_car_iid(c): c for c in cars}
+        self._car_view_key = None
+        self._car_tree_rows.forget()
+
+    @staticmethod
+    def _set_car_filter_keys(c: Dict[str, Any]):
+        c["MediaName"] = c.get("MediaName") or ""
+        c["_year_key"] = c.get("Year") or 0
+        c["_is_clone"] = c.get("Year") == 6969 or c["CarID"] >= 2000
+        c["_blob"] = f'{c["MediaName"].lower()}\n{c["CarID"]}'
 
+    def refresh_car_list(self):
         if not self.sources:
+            self._car_view_rows = []
+            self._car_view_key = None
+            self._car_page = 0
+            self._render_car_page()
             return
 
         q = (self.car_search_var.get() or "").strip().lower()
         only_clones = bool(self.only_clones_var.get())
-        sort_by = self.car_sort_var.get() or "CarID"
-
-        cars = ce.list_cars_all_sources(self.sources)
+        view_key = (q, only_clones, self.car_sort_var.get())
+        if view_key == self._car_view_key:
+            return  # same filter/sort over the same rows: the view is current
 
-        # filter
-        out = []
-        for c in cars:
-            if q and q not in (c["MediaName"] or "").lower() and q not in str(c["CarID"]).lower():
-                continue
-            if only_clones:
-                y = c.get("Year")
-                if y == 6969:
-                    pass
-                else:
-                    if c["CarID"] < 2000:
-                        continue
-            out.append(c)
-
-        # sort
-        if sort_by == "MediaName":
-            out.sort(key=lambda x: (x.get("MediaName") or "", x["CarID"]))
-        elif sort_by == "Year":
-            out.sort(key=lambda x: (x.get("Year") or 0, x["CarID"]))
-        elif sort_by == "Source":
-            out.sort(key=lambda x: (x.get("Source") or "", x["CarID"]))
+        if not q and not only_clones:
+            out = list(self._all_car_rows)
         else:
-            out.sort(key=lambda x: x["CarID"])
+            # filter: cheap clone flag first, substring search only if it passes
+            out = [
+                c for c in self._all_car_rows
+                if (not only_clones or c["_is_clone"]) and (not q or q in c["_blob"])
+            ]
+        out.sort(key=self._car_sort_key())
+
+        self._car_view_rows = out
+        self._car_view_key = view_key
+        self._car_page = 0
+        self._render_car_page()
+        self._log(f"Cars listed: {len(out)}\n")
+
+    def _car_sort_key(self):
+        return _CAR_SORT_KEYS.get(self.car_sort_var.get(), _CAR_SORT_KEYS["CarID"])
+
+    def _car_matches_filter(self, c: Dict[str, Any]) -> bool:
+        q = (self.car_search_var.get() or "").strip().lower()
+        return (not self.only_clones_var.get() or c["_is_clone"]) and (not q or q in c["_blob"])
 
-        for c in out[:5000]:
-            self.car_tree.insert("", "end", values=(c["CarID"], c.get("MediaName", ""), c.get("Year", ""), Path(c["Source"]).name))
+    def _insert_car_row(self, c: Dict[str, Any]):
+        """
+        Adds one new row (e.g. a fresh clone) to the cache and, if it passes the
+        current filter, to its sorted position in the view - no full reload.
+        """
+        c["_source_name"] = Path(c["Source"]).name
+        self._set_car_filter_keys(c)
+        self._all_car_rows.append(c)
+        iid = _car_iid(c)
+        self._car_row_by_iid[iid] = c
+        if not self._car_matches_filter(c):
+            return
 
-        self._log(f"Cars listed: {len(out)} (showing up to 5000)\n")
+        key = self._car_sort_key()
+        pos = bisect.bisect_right(self._car_view_rows, key(c), key=key)
+        self._car_view_rows.insert(pos, c)
+
+        start = self._car_page * self._car_page_size
+        if pos < start + self._car_page_size:
+            # lands on this or an earlier page: the current page shifts by one row
+            self._render_car_page()
+            return
+        self.car_page_lbl.configure(text=f"Page {self._car_page + 1}/{self._car_page_count()}")
+
+    def _car_page_count(self) -> int:
+        return max(1, -(-len(self._car_view_rows) // self._car_page_size))
+
+    def _car_page_step(self, delta: int):
+        page = min(max(self._car_page + delta, 0), self._car_page_count() - 1)
+        if page != self._car_page:
+            self._car_page = page
+            self._render_car_page()
+
+    def _render_car_page(self):
+        """Only the current page of the filtered list is fed to car_tree."""
+        start = self._car_page * self._car_page_size
+        self._car_tree_rows.show(self._car_view_rows[start:start + self._car_page_size])
+
+        self.car_page_lbl.configure(text=f"Page {self._car_page + 1}/{self._car_page_count()}")
 
     def on_car_select(self, _evt=None):
         sel = self.car_tree.selection()
@@ -940,12 +1558,7 @@ class ConstructorApp(tk.Tk):
         vals = self.car_tree.item(sel[0], "values")
         car_id = int(vals[0])
         source_name = vals[3]
-        # resolve source path
-        src = None
-        for p in self.sources:
-            if p.name == source_name:
-                src = p
-                break
+        src = self._sources_by_name.get(source_name.lower())
         self.selected_car_id = car_id
         self.selected_car_source = src
         self._log(f"Selected car: {car_id} ({vals[1]}) from {source_name}\n")
@@ -959,25 +1572,55 @@ class ConstructorApp(tk.Tk):
     # ----------------------------
     # Engines list
     # ----------------------------
-    def refresh_engine_list(self):
-        for i in self.engine_tree.get_children():
-            self.engine_tree.delete(i)
-        if not self.sources:
+    def _load_engine_rows(self, engines: Optional[List[Dict[str, Any]]] = None):
+        if engines is None:
+            engines = _merge_source_rows(self.sources, _cached_list_engines, "EngineID")
+        for e in engines:
+            self._set_engine_filter_keys(e)
+        self._all_engine_rows = engines
+        self._engine_row_by_iid = {_engine_iid(e): e for e in engines}
+        self._engine_view_key = None
+        self._engine_tree_rows.forget()
+
+    @staticmethod
+    def _set_engine_filter_keys(e: Dict[str, Any]):
+        # lowercased once per load: EngineName / MediaName / EngineID
+        e["_blob"] = f'{(e.get("EngineName") or "").lower()}\n{(e.get("MediaName") or "").lower()}\n{e["EngineID"]}'
+
+    def _engine_matches_filter(self, e: Dict[str, Any]) -> bool:
+        q = (self.engine_search_var.get() or "").strip().lower()
+        return not q or q in e["_blob"]
+
+    def _insert_engine_row(self, e: Dict[str, Any]):
+        """Adds one new engine row to the cache and its sorted place in engine_tree."""
+        e["_source_name"] = Path(e["Source"]).name
+        self._set_engine_filter_keys(e)
+        self._all_engine_rows.append(e)
+        iid = _engine_iid(e)
+        self._engine_row_by_iid[iid] = e
+        if not self._engine_matches_filter(e):
             return
+        pos = bisect.bisect_right(self._engine_view_rows, _ENGINE_SORT_KEY(e), key=_ENGINE_SORT_KEY)
+        self._engine_view_rows.insert(pos, e)
+        self._engine_tree_rows.row_inserted(pos)
 
+    def refresh_engine_list(self):
         q = (self.engine_search_var.get() or "").strip().lower()
-        engines = ce.list_engines_all_sources(self.sources)
+        if self.sources and q == self._engine_view_key:
+            return  # same query over the same rows: the view is current
 
-        out = []
-        for e in engines:
-            if q and q not in (e.get("EngineName") or "").lower() and q not in (e.get("MediaName") or "").lower() and q not in str(e["EngineID"]).lower():
-                continue
-            out.append(e)
+        self._engine_view_rows = []
+        self._engine_view_key = None
+        if not self.sources:
+            self._engine_tree_rows.show(self._engine_view_rows)
+            return
 
-        out.sort(key=lambda x: (x["EngineID"], x.get("Source") or ""))
+        out = [e for e in self._all_engine_rows if q in e["_blob"]] if q else list(self._all_engine_rows)
+        out.sort(key=_ENGINE_SORT_KEY)
+        self._engine_view_rows = out
+        self._engine_view_key = q
 
-        for e in out[:5000]:
-            self.engine_tree.insert("", "end", values=(e["EngineID"], e.get("EngineName", ""), e.get("MediaName", ""), Path(e["Source"]).name))
+        self._engine_tree_rows.show(out)  # shares the list: _insert_engine_row keeps both in step
 
     def on_engine_select(self, event=None):
         sel = self.engine_tree.selection()
@@ -1013,100 +1656,74 @@ class ConstructorApp(tk.Tk):
             self._log("Car not found in MAIN (write-only). Clone it first if needed.\n")
             return
 
-        for k, var in self.car_fields.items():
-            if k not in row:
-                continue
-            if isinstance(var, tk.IntVar):
-                try:
-                    var.set(int(row[k] if row[k] is not None else 0))
-                except Exception:
-                    var.set(0)
-            else:
-                var.set("" if row[k] is None else str(row[k]))
+        _fill_form(self._car_int_fields, self._car_str_fields, row)
 
         # Update CarType combobox text
         if hasattr(self, "_cartype_cb"):
             v = self.car_fields.get("CarTypeID")
             if isinstance(v, tk.IntVar):
                 cur = v.get()
-                mapping = {1: "1 Production", 2: "2 Race", 3: "3 Pre-Tuned"}
-                self._cartype_cb.set(mapping.get(cur, f"{cur}"))
+                self._cartype_cb.set(_CARTYPE_LABELS.get(cur, f"{cur}"))
 
         # Update dropdowns display (EnginePlacement, MaterialType)
-        self._set_dropdown_display("_engineplacement_cb", "EnginePlacementID", "List_EnginePlacement")
-        self._set_dropdown_display("_materialtype_cb", "MaterialTypeID", "List_MaterialType")
+        self._set_dropdown_display("_engineplacement_cb", "EnginePlacementID")
+        self._set_dropdown_display("_materialtype_cb", "MaterialTypeID")
 
-    def _set_dropdown_display(self, cb_attr: str, field: str, table: str):
+    def _set_dropdown_display(self, cb_attr: str, field: str):
         cb = getattr(self, cb_attr, None)
         if not cb:
             return
         v = self.car_fields.get(field)
         if not isinstance(v, tk.IntVar):
             return
-        id_val = v.get()
-        disp = self.lookup_cache.get(table, {}).get(id_val)
-        if disp is None:
+        label = getattr(cb, "_label_by_id", {}).get(v.get())
+        if label is None:
             return
-        cb.set(f"{id_val} - {disp}")
+        cb.set(label)
         
-    def _set_engine_dropdown_display(self, cb_attr: str, field: str, table: str):
+    def _set_engine_dropdown_display(self, cb_attr: str, field: str):
         cb = getattr(self, cb_attr, None)
         if not cb:
             return
         v = self.engine_fields.get(field)
         if not isinstance(v, tk.IntVar):
             return
-        id_val = v.get()
-        disp = self.lookup_cache.get(table, {}).get(id_val)
-        if disp is None:
+        label = getattr(cb, "_label_by_id", {}).get(v.get())
+        if label is None:
             return
-        cb.set(f"{id_val} - {disp}")
+        cb.set(label)
 
 
     def apply_car_fields(self):
         if not self.main_db or self.selected_car_id is None:
             messagebox.showwarning("Missing selection", "Select a car that exists in MAIN.")
             return
-        updates: Dict[str, Any] = {}
-        for k, var in self.car_fields.items():
-            if isinstance(var, tk.IntVar):
-                updates[k] = int(var.get())
-            else:
-                s = (var.get() or "").strip()
-                if s == "":
-                    continue
-                # Keep numeric as numeric where possible
-                try:
-                    if "." in s:
-                        updates[k] = float(s)
-                    else:
-                        updates[k] = int(s)
-                except Exception:
-                    updates[k] = s
+        updates = self._car_updates_from_form()
 
         try:
-            ce.backup_db(self.main_db)
+            self._ensure_backup()
             ce.update_data_car(self.main_db, self.selected_car_id, updates)
         except Exception as e:
             messagebox.showerror("Apply failed", str(e))
             return
         self._log("Data_Car updated in MAIN.\n")
 
+    def _car_updates_from_form(self) -> Dict[str, Any]:
+        return _read_form(self._car_int_fields, self._car_str_fields)
+
     # ----------------------------
     # Data_CarBody load/apply
     # ----------------------------
     def load_body_fields(self):
         if not self.main_db or self.selected_car_id is None:
             return
+        self._carbody_id = None
         row = ce.get_data_carbody_for_car(self.main_db, self.selected_car_id)
         if not row:
             self._log("CarBody not found in MAIN for this car.\n")
             return
         self._carbody_id = row.get("Id")
-        for k, var in self.body_fields.items():
-            if k not in row:
-                continue
-            var.set("" if row[k] is None else str(row[k]))
+        _fill_form({}, self.body_fields, row)
 
     def apply_body_fields(self):
         if not self.main_db or self.selected_car_id is None:
@@ -1117,36 +1734,34 @@ class ConstructorApp(tk.Tk):
             messagebox.showwarning("Missing body", "No Data_CarBody row found for this car in MAIN.")
             return
         carbody_id = int(body["Id"])
-        updates: Dict[str, Any] = {}
-        for k, var in self.body_fields.items():
-            s = (var.get() or "").strip()
-            if s == "":
-                continue
-            try:
-                updates[k] = float(s) if "." in s else int(s)
-            except Exception:
-                updates[k] = s
+        updates = self._body_updates_from_form()
 
         try:
-            ce.backup_db(self.main_db)
+            self._ensure_backup()
             ce.update_data_carbody(self.main_db, carbody_id, updates)
         except Exception as e:
             messagebox.showerror("Apply failed", str(e))
             return
         self._log("Data_CarBody updated in MAIN.\n")
 
+    def _body_updates_from_form(self) -> Dict[str, Any]:
+        return _read_form({}, self.body_fields)
+
     # ----------------------------
     # Stock engine (List_UpgradeEngine)
     # ----------------------------
     def refresh_stock_engine(self):
         if not self.main_db or self.selected_car_id is None:
             return
-        eng = ce.get_stock_engine_for_car(self.main_db, self.selected_car_id)
+        eng = ce.get_stock_engine_with_name(self.main_db, self.selected_car_id)
         if not eng:
             self.stock_engine_lbl.configure(text="Stock engine: (not found in MAIN)")
             return
         eid = eng.get("EngineID")
-        ename = ce.resolve_engine_name(self.sources, int(eid)) if eid is not None else ""
+        ename = eng["__engine_name__"]
+        if ename is None:
+            # not named in MAIN: first DLC source that has it
+            ename = _cached_engine_name(self.sources, _source_key(self.main_db), int(eid)) if eid is not None else ""
         self.stock_engine_lbl.configure(text=f"Stock engine: {eid}  {ename}")
 
     def assign_selected_engine_as_stock(self):
@@ -1166,7 +1781,7 @@ class ConstructorApp(tk.Tk):
             return
 
         try:
-            ce.backup_db(self.main_db)
+            self._ensure_backup()
             ce.set_stock_engine_for_car(self.main_db, self.selected_car_id, self.selected_engine_id)
         except Exception as e:
             messagebox.showerror("Assign failed", str(e))
@@ -1195,43 +1810,34 @@ class ConstructorApp(tk.Tk):
             )
             return
 
-            # Clone engine into MAIN using safe EngineID >= 2000
-            try:
-                if not self.selected_engine_source:
-                    raise ValueError("Engine source path is missing (select an engine first).")
-
-                # Resolve source path robustly (handles cases where Source is just a filename)
-                src = Path(str(self.selected_engine_source))
-                if not src.exists():
-                    # match by basename against loaded sources
-                    match = next((p for p in self.sources if p.name.lower() == src.name.lower()), None)
-                    if not match:
-                        raise ValueError(f"Could not resolve engine source file: {self.selected_engine_source}")
-                    src = match
-
-                # Backup MAIN first
-                ce.backup_db(self.main_db)
-
-                # Suggest next EngineID considering MAIN + DLC sources
-                new_eid = suggest_next_engine_id(
-                    main_db=self.main_db,
-                    aux_sources=self.sources,   # pass the list of Paths
-                    min_id=2000,
-                )
+        # Clone engine into MAIN using safe EngineID >= 2000
+        try:
+            # Resolve source path robustly (handles cases where Source is just a filename)
+            src = self._resolve_source_path(str(self.selected_engine_source))
+            if src is None:
+                raise ValueError(f"Could not resolve engine source file: {self.selected_engine_source}")
 
-                # Clone engine (and let engine cloner also use all sources if it supports it)
-                clone_engine_to_main(
-                    source_db=src,
-                    main_db=self.main_db,
-                    source_engine_id=int(self.selected_engine_id),
-                    new_engine_id=int(new_eid),
-                    all_source_paths=self.sources,  # if your clone_engine_to_main supports it
-                )
+            # Backup MAIN first (the only backup for clone + assign)
+            ce.backup_db(self.main_db)
 
-            except Exception as e:
-                messagebox.showerror("Clone engine failed", str(e))
-                return
+            # Suggest next EngineID considering MAIN + DLC sources
+            new_eid = suggest_next_engine_id(
+                main_db=self.main_db,
+                aux_sources=list(self.sources),
+                min_id=2000,
+            )
 
+            clone_engine_to_main(
+                source_db=src,
+                main_db=self.main_db,
+                source_engine_id=int(self.selected_engine_id),
+                new_engine_id=int(new_eid),
+                all_source_paths=list(self.sources),
+            )
+        except Exception as e:
+            messagebox.showerror("Clone engine failed", str(e))
+            return
+        self._show_cloned_engine(src, int(self.selected_engine_id), int(new_eid))
 
         # Assign new engine
         try:
@@ -1269,24 +1875,14 @@ class ConstructorApp(tk.Tk):
         if not row:
             messagebox.showwarning("Not found", "Engine row not found in MAIN.")
             return
+        self._engine_fields_id = eid
 
-        for k, var in self.engine_fields.items():
-            if k not in row:
-                continue
-            if isinstance(var, tk.IntVar):
-                try:
-                    var.set(int(row[k] if row[k] is not None else 0))
-                except Exception:
-                    var.set(0)
-            else:
-                var.set("" if row[k] is None else str(row[k]))
+        _fill_form(self._engine_int_fields, self._engine_str_fields, row)
                 
         # set dropdown visible labels (id - name) for engine dropdowns
-        self._set_engine_dropdown_display("_engine_config_cb", "ConfigID", "List_EngineConfig")
-        if hasattr(self, "_engine_cylinders_cb"):
-            table = "List_Cylinders" if "List_Cylinders" in self.lookup_cache else "List_Cylinder"
-            self._set_engine_dropdown_display("_engine_cylinders_cb", "CylinderID", table)
-        self._set_engine_dropdown_display("_engine_vtiming_cb", "VariableTimingID", "List_VariableTiming")
+        self._set_engine_dropdown_display("_engine_config_cb", "ConfigID")
+        self._set_engine_dropdown_display("_engine_cylinders_cb", "CylinderID")
+        self._set_engine_dropdown_display("_engine_vtiming_cb", "VariableTimingID")
 
     def apply_engine_fields(self):
         if not self.main_db:
@@ -1305,94 +1901,111 @@ class ConstructorApp(tk.Tk):
             messagebox.showwarning("Not in MAIN", "This engine does not exist in MAIN. Clone it first.")
             return
 
-        updates: Dict[str, Any] = {}
-        for k, var in self.engine_fields.items():
-            if isinstance(var, tk.IntVar):
-                updates[k] = int(var.get())
-            else:
-                s = (var.get() or "").strip()
-                if s == "":
-                    continue
-                try:
-                    updates[k] = float(s) if "." in s else int(s)
-                except Exception:
-                    updates[k] = s
+        updates = self._engine_updates_from_form()
 
         try:
-            ce.backup_db(self.main_db)
+            self._ensure_backup()
             ce.update_data_engine(self.main_db, eid, updates)
         except Exception as e:
             messagebox.showerror("Apply failed", str(e))
             return
+
+        self._update_engine_row(eid, updates)
         self._log("Data_Engine updated in MAIN.\n")
 
+    def _engine_updates_from_form(self) -> Dict[str, Any]:
+        return _read_form(self._engine_int_fields, self._engine_str_fields)
+
+    def _update_engine_row(self, eid: int, updates: Dict[str, Any]):
+        # reflect name edits in the engine list in place (MAIN row only)
+        iid = _row_iid(eid, str(self.main_db))
+        cached = self._engine_row_by_iid.get(iid)
+        for col in ("EngineName", "MediaName"):
+            if col not in updates:
+                continue
+            val = "" if updates[col] is None else updates[col]
+            if cached is not None:
+                cached[col] = val
+                self._set_engine_filter_keys(cached)
+                self._engine_view_key = None
+            if self.engine_tree.exists(iid):
+                self.engine_tree.set(iid, col, val)
+
+    def save_all_fields(self):
+        """
+        Writes the car, body and engine forms to MAIN with one backup and in one
+        transaction. Body/engine are included only if their forms were loaded from MAIN.
+        """
+        if not self.main_db or self.selected_car_id is None:
+            messagebox.showwarning("Missing selection", "Select a car that exists in MAIN.")
+            return
+
+        edits = [("Data_Car", self.selected_car_id, self._car_updates_from_form())]
+        if self._carbody_id is not None:
+            edits.append(("Data_CarBody", int(self._carbody_id), self._body_updates_from_form()))
+        engine_updates = None
+        if self._engine_fields_id is not None:
+            engine_updates = self._engine_updates_from_form()
+            edits.append(("Data_Engine", self._engine_fields_id, engine_updates))
+
+        try:
+            self._ensure_backup()
+            ce.apply_updates(self.main_db, edits)
+        except Exception as e:
+            messagebox.showerror("Save failed", str(e))
+            return
+
+        if engine_updates is not None:
+            self._update_engine_row(self._engine_fields_id, engine_updates)
+        self._log(f"Saved to MAIN: {', '.join(t for t, _, _ in edits)}.\n")
+
     # ----------------------------
     # List_* / upgrade table editor
     # ----------------------------
     def refresh_table_list(self):
         if not self.main_db:
-            self.table_cb.configure(values=[])
+            self.table_cb.configure(values=())
             return
 
-        real_tables = ce.list_car_related_tables(self.main_db)
-
-        self._table_display_to_real = {}
-        self._table_real_to_display = {}
-
-        display = []
-        for t in real_tables:
-            tl = t
-            if t.startswith("List_Upgrade"):
-                tl = t.replace("List_Upgrade", "", 1)
-            elif t.startswith("List_"):
-                tl = t.replace("List_", "", 1)
-            self._table_display_to_real[tl] = t
-            self._table_real_to_display[t] = tl
-            display.append(tl)
+        key = _source_key(self.main_db)
+        real_tables = _cached_car_related_tables(*key) if key else ()
 
-        display.sort(key=lambda x: (0 if x.lower().startswith("engine") or x.lower().startswith("drivetrain") else 1, x.lower()))
+        # shared, read-only maps: the same schema gives the same objects
+        self._table_display_to_real, self._table_real_to_display, display = _table_display_maps(real_tables)
+        self._forget_current_table()
 
         self.table_cb.configure(values=display)
         if display and not self.table_var.get():
             self.table_var.set(display[0])
 
 
+    def _current_table(self) -> str:
+        """Real name of the selected upgrade table, resolved once per table_var change."""
+        if self._current_table_cached is None:
+            disp = self.table_var.get()
+            self._current_table_cached = self._table_display_to_real.get(disp, disp)
+        return self._current_table_cached
+
+    def _forget_current_table(self):
+        self._current_table_cached = None
+
     def load_table_rows(self):
         if not self.main_db or self.selected_car_id is None:
             messagebox.showwarning("Missing selection", "Select a target car first.")
             return
 
-        table = self._table_display_to_real.get(self.table_var.get(), self.table_var.get())
+        table = self._current_table()
         if not table:
             return
 
-        # Resolve scope values from MAIN (write-only target)
-        engine_id = None
-        carbody_id = None
-        drivetrain_id = None
-        
-        try:
-            drivetrain_id = ce.get_stock_drivetrain_id_for_car(self.main_db, self.selected_car_id)
-        except Exception:
-            drivetrain_id = None
-
-        try:
-            stock = ce.get_stock_engine_for_car(self.main_db, self.selected_car_id)
-            if stock:
-                eid = stock.get("EngineID") or stock.get("EngineId") or stock.get("Engine")
-                if eid is not None:
-                    engine_id = int(eid)
-        except Exception:
-            engine_id = None
-
-        try:
-            body = ce.get_data_carbody_for_car(self.main_db, self.selected_car_id)
-            if body and body.get("Id") is not None:
-                carbody_id = int(body["Id"])
-        except Exception:
-            carbody_id = None
+        # Resolve scope values from MAIN (write-only target); memoized per MAIN state
+        key = _source_key(self.main_db)
+        if key:
+            engine_id, carbody_id, drivetrain_id = _cached_car_scope(*key, self.selected_car_id)
+        else:
+            engine_id = carbody_id = drivetrain_id = None
 
-        rows, scope_kind, scope_col, scope_val = ce.list_rows_scoped(
+        cols, rows, scope_kind, scope_col, scope_val = ce.list_rows_scoped(
             self.main_db,
             table,
             self.selected_car_id,
@@ -1401,17 +2014,19 @@ class ConstructorApp(tk.Tk):
             drivetrain_id=drivetrain_id,
         )
 
-        for i in self.rows_tree.get_children():
-            self.rows_tree.delete(i)
-
-        for r in rows:
-            lvl = r.get("Level", "")
-            st = r.get("IsStock", "")
-            self.rows_tree.insert("", "end", values=(r["__rowid__"], lvl, st))
+        # rows are tuples in cols order (cols[0] is __rowid__)
+        lvl = cols.index("Level") if "Level" in cols else None
+        stk = cols.index("IsStock") if "IsStock" in cols else None
+        _replace_tree_rows(
+            self.rows_tree,
+            ((r[0], "" if lvl is None else r[lvl], "" if stk is None else r[stk]) for r in rows),
+        )
 
         self.current_row_fields.clear()
         self.current_row_rowid = None
         self.current_row_full = {}
+        self._current_row_iid = None
+        self._rows_scope_col = scope_col
         self._clear_fields_panel()
 
         # Log what scope was used (super helpful for debugging “why no rows”)
@@ -1426,10 +2041,10 @@ class ConstructorApp(tk.Tk):
 
     def on_row_select(self, _evt=None):
         sel = self.rows_tree.selection()
-        if not sel:
-            return
+        if not sel or self._current_row_iid in sel:
+            return  # extending a multi-selection keeps the fields (and any typed edits)
         rowid = int(self.rows_tree.item(sel[0], "values")[0])
-        table = self._table_display_to_real.get(self.table_var.get(), self.table_var.get())
+        table = self._current_table()
 
         if not self.main_db or not table:
             return
@@ -1440,6 +2055,7 @@ class ConstructorApp(tk.Tk):
             return
         self.current_row_rowid = rowid
         self.current_row_full = row
+        self._current_row_iid = sel[0]
         self._build_fields_panel(row)
 
     def _build_fields_panel(self, row: Dict[str, Any]):
@@ -1447,92 +2063,82 @@ class ConstructorApp(tk.Tk):
         self.current_row_fields = {}
 
         # IMPORTANT: use real table name, not display label
-        table = self._table_display_to_real.get(self.table_var.get(), self.table_var.get())
+        table = self._current_table()
 
-        r = 0
+        # Widgets are created first and gridded in one pass afterwards, with
+        # propagation off, so the panel is laid out once rather than per row.
+        cells = []
         for k, v in row.items():
             if k == "__rowid__":
                 continue
 
-            ttk.Label(self.fields_inner, text=k).grid(row=r, column=0, sticky="w", pady=2, padx=(0, 10))
+            label = ttk.Label(self.fields_inner, text=k)
 
             widget = None
+            sticky = "ew"
 
             # Wheel diameters clamp 13..24
             if "wheeldiameter" in k.lower():
                 sv = tk.StringVar(value="" if v is None else str(v))
                 self.current_row_fields[k] = sv
                 sp = tk.Spinbox(self.fields_inner, from_=13, to=24, textvariable=sv, width=10)
-                sp.grid(row=r, column=1, sticky="w", pady=2)
                 widget = sp
+                sticky = "w"
 
             # TireCompound dropdown
             elif table.lower() == "list_upgradetirecompound" and k == "TireCompoundID":
-                opts = self.lookup_cache.get("List_TireCompound", {})
                 sv = tk.StringVar(value="" if v is None else str(v))
                 self.current_row_fields[k] = sv
-                cb = ttk.Combobox(self.fields_inner, state="readonly",
-                                values=[f"{i} - {n}" for i, n in sorted(opts.items())])
-                cb.grid(row=r, column=1, sticky="ew", pady=2)
-                if v is not None:
-                    try:
-                        iv = int(v)
-                        if iv in opts:
-                            cb.set(f"{iv} - {opts[iv]}")
-                    except Exception:
-                        pass
-                cb.bind("<<ComboboxSelected>>", lambda e, cb=cb, sv=sv: sv.set(cb.get().split(" - ")[0]))
+                id_by_label, label_by_id, vals = self._formatted_lookups.get("List_TireCompound", ({}, {}, ()))
+                cb = ttk.Combobox(self.fields_inner, state="readonly")
+                _bind_combo_typeahead(cb)
+                _set_combo_values(cb, vals)
+                self._preselect_combo(cb, label_by_id, v)
+                _bind_combo_ids(cb, sv, id_by_label)
                 widget = cb
 
             # Drivetrain EngineID dropdown (all engines across sources)
             elif table.lower() == "list_upgradedrivetrain" and k == "EngineID":
-                engines = ce.list_engines_all_sources(self.sources)
-                vals = [f'{e["EngineID"]} - {e.get("EngineName","")} ({Path(e["Source"]).name})' for e in engines]
+                id_by_label, label_by_id, vals = self._row_combo_values(table, k, lambda: (
+                    (f'{e["EngineID"]} - {e.get("EngineName","")} ({e["_source_name"]})', e["EngineID"])
+                    for e in _merge_source_rows(self.sources, _cached_list_engines, "EngineID")
+                ))
                 sv = tk.StringVar(value="" if v is None else str(v))
                 self.current_row_fields[k] = sv
-                cb = ttk.Combobox(self.fields_inner, state="readonly", values=vals)
-                cb.grid(row=r, column=1, sticky="ew", pady=2)
-                if v is not None:
-                    try:
-                        iv = int(v)
-                        for s in vals:
-                            if s.startswith(f"{iv} -"):
-                                cb.set(s)
-                                break
-                    except Exception:
-                        pass
-                cb.bind("<<ComboboxSelected>>", lambda e, cb=cb, sv=sv: sv.set(cb.get().split(" - ")[0]))
+                cb = ttk.Combobox(self.fields_inner, state="readonly")
+                _bind_combo_typeahead(cb)
+                _set_combo_values(cb, vals)
+                self._preselect_combo(cb, label_by_id, v)
+                _bind_combo_ids(cb, sv, id_by_label)
                 widget = cb
 
             # Drivetrain PowertrainID dropdown (Data_Drivetrain resolver)
             elif table.lower() == "list_upgradedrivetrain" and k == "PowertrainID":
-                opts = ce.build_powertrain_options(self.sources, self.lookup_cache)
                 sv = tk.StringVar(value="" if v is None else str(v))
                 self.current_row_fields[k] = sv
-                cb = ttk.Combobox(self.fields_inner, state="readonly",
-                                values=[f"{pid} - {label}" for pid, label in opts])
-                cb.grid(row=r, column=1, sticky="ew", pady=2)
-                if v is not None:
-                    try:
-                        iv = int(v)
-                        for pid, label in opts:
-                            if pid == iv:
-                                cb.set(f"{pid} - {label}")
-                                break
-                    except Exception:
-                        pass
-                cb.bind("<<ComboboxSelected>>", lambda e, cb=cb, sv=sv: sv.set(cb.get().split(" - ")[0]))
+                id_by_label, label_by_id, vals = self._row_combo_values(
+                    table, k, lambda: ((f"{pid} - {label}", pid) for pid, label in self._powertrain_options())
+                )
+                cb = ttk.Combobox(self.fields_inner, state="readonly")
+                _bind_combo_typeahead(cb)
+                _set_combo_values(cb, vals)
+                self._preselect_combo(cb, label_by_id, v)
+                _bind_combo_ids(cb, sv, id_by_label)
                 widget = cb
 
             if widget is None:
                 sv = tk.StringVar(value="" if v is None else str(v))
                 self.current_row_fields[k] = sv
-                e = ttk.Entry(self.fields_inner, textvariable=sv)
-                e.grid(row=r, column=1, sticky="ew", pady=2)
+                widget = ttk.Entry(self.fields_inner, textvariable=sv)
 
-            r += 1
+            cells.append((label, widget, sticky))
 
+        self.fields_inner.grid_propagate(False)
+        for r, (label, widget, sticky) in enumerate(cells):
+            label.grid(row=r, column=0, sticky="w", pady=2, padx=(0, 10))
+            widget.grid(row=r, column=1, sticky=sticky, pady=2)
         self.fields_inner.columnconfigure(1, weight=1)
+        self.fields_inner.grid_propagate(True)
 
 
     def _clear_fields_panel(self):
@@ -1542,35 +2148,58 @@ class ConstructorApp(tk.Tk):
     def apply_row_edits(self):
         if not self.main_db or self.selected_car_id is None:
             return
-        table = self._table_display_to_real.get(self.table_var.get(), self.table_var.get())
+        table = self._current_table()
         if not table or self.current_row_rowid is None:
             return
         updates: Dict[str, Any] = {}
         for k, var in self.current_row_fields.items():
             s = (var.get() or "").strip()
             # allow blank -> NULL
-            if s == "":
-                updates[k] = None
-                continue
-            try:
-                updates[k] = float(s) if "." in s else int(s)
-            except Exception:
-                updates[k] = s
+            val = None if s == "" else _parse_text_value(s)
+            # only columns that differ from the row as loaded
+            if k not in self.current_row_full or val != self.current_row_full[k]:
+                updates[k] = val
 
+        if not updates:
+            self._log(f"No changes to {table} rowid={self.current_row_rowid}\n")
+            return
+
+        # with several rows selected, the changed fields are written to all of them
+        sel = self.rows_tree.selection() if self._current_row_iid is not None else ()
+        others = [iid for iid in sel if iid != self._current_row_iid]
         try:
-            ce.backup_db(self.main_db)
-            ce.update_row_by_rowid(self.main_db, table, self.current_row_rowid, updates)
+            self._ensure_backup()
+            if others:
+                rowids = [self.current_row_rowid] + [int(self.rows_tree.set(iid, "__rowid__")) for iid in others]
+                ce.update_rows_by_rowid(self.main_db, table, {rid: updates for rid in rowids})
+            else:
+                ce.update_row_by_rowid(self.main_db, table, self.current_row_rowid, updates)
         except Exception as e:
             messagebox.showerror("Apply failed", str(e))
             return
 
-        self._log(f"Updated {table} rowid={self.current_row_rowid}\n")
-        self.load_table_rows()
+        if others:
+            self._log(f"Updated {table} rowids={', '.join(str(r) for r in rowids)}\n")
+        else:
+            self._log(f"Updated {table} rowid={self.current_row_rowid}\n")
+        self.current_row_full.update(updates)
+        if self._current_row_iid is None or self._rows_scope_col in updates:
+            self._schedule_rows_refresh()  # the rows may have left this car's scope
+            return
+        # patch the edited rows in place; no re-query
+        for iid in (self._current_row_iid, *others):
+            for col in ("Level", "IsStock"):
+                if col in updates:
+                    self.rows_tree.set(iid, col, "" if updates[col] is None else updates[col])
+
+    def _schedule_rows_refresh(self):
+        """Reloads the upgrade rows once after a burst of inserts/deletes."""
+        self._debounce("rows", self.load_table_rows, 150)
 
     def add_row_copy(self):
         if not self.main_db or self.selected_car_id is None:
             return
-        table = self._table_display_to_real.get(self.table_var.get(), self.table_var.get())
+        table = self._current_table()
         if not table:
             return
         if self.current_row_rowid is None:
@@ -1586,48 +2215,65 @@ class ConstructorApp(tk.Tk):
         if "Ordinal" in vals:
             vals["Ordinal"] = self.selected_car_id
 
-        # If it has Level, ask for new level number (simple prompt)
+        # If it has Level, ask for the new level(s): one copy per level, inserted together
+        rows = [vals]
         if "Level" in vals:
-            new_level = tk.simpledialog.askinteger("New level", "Enter Level value for the new row:", initialvalue=int(vals.get("Level") or 0))
-            if new_level is None:
+            s = simpledialog.askstring(
+                "New level",
+                "Enter Level value(s) for the new row(s), e.g. 4, 1-5 or 1,3,5:",
+                initialvalue=str(vals.get("Level") or 0),
+            )
+            if s is None:
+                return
+            levels = _parse_levels(s)
+            if not levels:
+                messagebox.showwarning("Bad level", f"Could not read levels from: {s}")
                 return
-            vals["Level"] = int(new_level)
+            rows = [dict(vals, Level=lv) for lv in levels]
 
         try:
-            ce.backup_db(self.main_db)
-            ce.insert_row(self.main_db, table, vals)
+            self._ensure_backup()
+            n = ce.insert_rows(self.main_db, table, rows)
         except Exception as e:
             messagebox.showerror("Insert failed", str(e))
             return
 
-        self._log(f"Inserted new row into {table}\n")
-        self.load_table_rows()
+        self._log(f"Inserted {n} new row(s) into {table}\n")
+        self._schedule_rows_refresh()
 
     def delete_selected_row(self):
         if not self.main_db:
             return
-        table = self._table_display_to_real.get(self.table_var.get(), self.table_var.get())
+        table = self._current_table()
         if not table or self.current_row_rowid is None:
             return
-        if not messagebox.askyesno("Delete row", f"Delete rowid={self.current_row_rowid} from {table}?"):
+        # every selected row goes in one transaction
+        sel = self.rows_tree.selection() if self._current_row_iid is not None else ()
+        rowids = [self.current_row_rowid] + [
+            int(self.rows_tree.set(iid, "__rowid__")) for iid in sel if iid != self._current_row_iid
+        ]
+        what = f"rowid={rowids[0]}" if len(rowids) == 1 else f"{len(rowids)} rows (rowids {', '.join(map(str, rowids))})"
+        if not messagebox.askyesno("Delete row", f"Delete {what} from {table}?"):
             return
         try:
-            ce.backup_db(self.main_db)
-            ce.delete_row_by_rowid(self.main_db, table, self.current_row_rowid)
+            self._ensure_backup()
+            n = ce.delete_rows_by_rowid(self.main_db, table, rowids)
         except Exception as e:
             messagebox.showerror("Delete failed", str(e))
             return
-        self._log(f"Deleted row from {table}\n")
-        self.load_table_rows()
+        self._log(f"Deleted {n} row(s) from {table}\n")
+        self.current_row_rowid = None
+        self._clear_fields_panel()
+        self._schedule_rows_refresh()
 
     # ----------------------------
     # Constructor donor apply
     # ----------------------------
     def _refresh_donor_sources(self):
         if not self.sources:
-            self.donor_source_cb.configure(values=[])
+            self.donor_source_cb.configure(values=())
             return
-        vals = [p.name for p in self.sources]
+        vals = tuple(p.name for p in self.sources)
         self.donor_source_cb.configure(values=vals)
         if vals and not self.donor_source_var.get():
             self.donor_source_var.set(vals[0])
@@ -1644,22 +2290,16 @@ class ConstructorApp(tk.Tk):
 
         donor_car_id = int(donor_id_s)
         donor_src_name = self.donor_source_var.get()
-        donor_src = None
-        for p in self.sources:
-            if p.name == donor_src_name:
-                donor_src = p
-                break
+        donor_src = self._sources_by_name.get((donor_src_name or "").lower())
         if donor_src is None:
             messagebox.showwarning("Missing donor source", "Select a donor source SLT.")
             return
 
         subsystem = self.subsystem_var.get()
-        try:
-            level = int((self.level_var.get() or "0").strip())
-        except Exception:
-            level = 0
+        level = _as_int(self.level_var.get()) or 0
 
         try:
+            self._ensure_backup()
             rep = ce.apply_subsystem_from_donor(
                 main_db=self.main_db,
                 donor_db=donor_src,
@@ -1678,14 +2318,59 @@ class ConstructorApp(tk.Tk):
     # ----------------------------
     # Backup / validate
     # ----------------------------
+    def _mutation_button(self, parent, **kw) -> ttk.Button:
+        """ttk.Button for an action that writes MAIN; disabled while a backup copy runs."""
+        b = ttk.Button(parent, **kw)
+        self._mutation_buttons.append(b)
+        return b
+
+    def _set_mutations_enabled(self, enabled: bool):
+        for b in self._mutation_buttons:
+            b.state(["!disabled"] if enabled else ["disabled"])
+
     def backup_main(self):
-        if not self.main_db:
+        if not self.main_db or self._backup_future is not None:
+            return
+        self._set_mutations_enabled(False)
+        self._backup_future = self._backup_executor.submit(ce.backup_db, self.main_db)
+        self._log("Backing up MAIN...\n")
+        self.after(100, self._check_backup_future, self.main_db)
+
+    def _check_backup_future(self, db: Path):
+        fut = self._backup_future
+        if not fut.done():
+            self.after(100, self._check_backup_future, db)
             return
+        self._backup_future = None
+        self._set_mutations_enabled(True)
         try:
-            b = ce.backup_db(self.main_db)
+            b = fut.result()
         except Exception as e:
             messagebox.showerror("Backup failed", str(e))
             return
+        if db == self.main_db:  # MAIN may have been switched while copying
+            self._last_backup_ts = time.monotonic()
+            self._ops_since_backup = 0
+        self._log(f"Backup created: {b}\n")
+
+    def _ensure_backup(self):
+        """
+        Backs MAIN up before an edit, unless the last backup is under
+        _BACKUP_INTERVAL_S old and fewer than _BACKUP_MAX_OPS edits ago - one
+        file copy per editing burst instead of one per click. Raises like
+        ce.backup_db. Cloning keeps its own unconditional backup.
+        """
+        now = time.monotonic()
+        if (
+            self._last_backup_ts is not None
+            and now - self._last_backup_ts < _BACKUP_INTERVAL_S
+            and self._ops_since_backup < _BACKUP_MAX_OPS
+        ):
+            self._ops_since_backup += 1
+            return
+        b = ce.backup_db(self.main_db)
+        self._last_backup_ts = now
+        self._ops_since_backup = 1
         self._log(f"Backup created: {b}\n")
 
     def validate_selected_car(self):
@@ -1705,7 +2390,19 @@ class ConstructorApp(tk.Tk):
     # Logging
     # ----------------------------
     def _log(self, s: str):
-        self.log.insert("end", s)
+        if not self._log_buffer:
+            self.after_idle(self._flush_log)
+        self._log_buffer.append(s)
+
+    def _flush_log(self):
+        if not self._log_buffer:
+            return
+        self.log.insert("end", "".join(self._log_buffer))
+        self._log_buffer.clear()
+        # keep the widget small: Text slows down as it grows over a long session
+        lines = int(self.log.index("end-1c").split(".")[0])
+        if lines > _LOG_MAX_LINES:
+            self.log.delete("1.0", f"{lines - _LOG_MAX_LINES}.0")
         self.log.see("end")
 
 
@@ -1,10 +1,18 @@
 # constructor_engine.py
 from __future__ import annotations
 
+import functools
+import os
 import sqlite3
+import sys
+import threading
+import urllib.parse
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
 
 CONSTRUCTOR_VERSION = "v0.2.1"
 
@@ -19,28 +27,219 @@ class ApplyReport:
     rows_written: Dict[str, int]
     notes: List[str]
 
+    def __str__(self) -> str:
+        written = ", ".join(f"{t}: {n}" for t, n in self.rows_written.items())
+        return (
+            f"Applied {self.subsystem} from donor CarID {self.donor_car_id} ({self.donor_source.name}) "
+            f"to target CarID {self.target_car_id} (Level {self.level}). "
+            f"Rows written: {written or 'none'}. Notes: {'; '.join(self.notes) if self.notes else 'none'}"
+        )
+
 
 # -----------------------------
 # DB helpers
 # -----------------------------
 
-def _connect(p: Path) -> sqlite3.Connection:
-    con = sqlite3.connect(str(p))
+# Per-connection read tuning. journal_mode=WAL is deliberately NOT used: it is
+# persisted in the file header and the game's SQLite must still open the SLTs.
+_READ_PRAGMAS = (
+    "PRAGMA cache_size=-65536",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+)
+
+# The editor's MAIN connection also syncs less: in rollback-journal mode
+# synchronous=NORMAL still survives an app crash, only an OS crash or power
+# loss mid-commit is at risk - and edits are backed up first.
+_EDIT_PRAGMAS = _READ_PRAGMAS + ("PRAGMA synchronous=NORMAL",)
+
+
+class _Connection(sqlite3.Connection):
+    """
+    Connection carrying a schema memo for _list_tables/_tables_set/_table_info. Nothing
+    in this module (or the cloner) runs DDL, so a connection's schema is
+    read once and then answered from memory.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._tables: Optional[Tuple[str, ...]] = None
+        self._tables_set: Optional[FrozenSet[str]] = None
+        self._table_infos: Dict[str, Tuple[sqlite3.Row, ...]] = {}
+        self._table_cols: Dict[str, Tuple[str, ...]] = {}
+        self._table_colsets: Dict[str, FrozenSet[str]] = {}
+        self._schema_primed = False
+
+
+# Debug aid: FCE_TRACE_SCHEMA=1 logs every schema query (PRAGMA / sqlite_master)
+# to stderr, so a path that bypasses the schema memo shows up as repeats.
+_TRACE_SCHEMA = bool(os.environ.get("FCE_TRACE_SCHEMA"))
+
+
+def _trace_schema_sql(stmt: str) -> None:
+    if stmt.lstrip().upper().startswith("PRAGMA") or "sqlite_master" in stmt:
+        print(f"[schema] {stmt}", file=sys.stderr)
+
+
+def _ro_uri(p: Path) -> str:
+    """
+    SQLite URI opening p read-only. The path is percent-encoded, so '#', '?'
+    and '%' in a file name stay part of the path instead of ending it; drive
+    paths become file:///C:/.. and UNC paths keep an empty authority
+    (file:////server/share/..).
+    """
+    path = Path(p).resolve().as_posix()
+    if not path.startswith("/"):
+        path = "/" + path
+    return "file://" + urllib.parse.quote(path, safe="/:") + "?mode=ro"
+
+
+def _connect(p: Path, tuned: bool = False, readonly: bool = False) -> sqlite3.Connection:
+    """
+    readonly opens with mode=ro (DLC donors and list scans: nothing can be
+    written by accident); tuned applies the read pragmas, plus
+    synchronous=NORMAL on a writable connection.
+    """
+    if readonly:
+        con = sqlite3.connect(_ro_uri(p), uri=True, cached_statements=256, factory=_Connection)
+    else:
+        con = sqlite3.connect(str(p), cached_statements=256, factory=_Connection)
     con.row_factory = sqlite3.Row
+    if tuned:
+        for pragma in _READ_PRAGMAS if readonly else _EDIT_PRAGMAS:
+            con.execute(pragma)
+    if _TRACE_SCHEMA:
+        con.set_trace_callback(_trace_schema_sql)
     return con
 
 
-def _list_tables(cur: sqlite3.Cursor) -> List[str]:
-    cur.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'")
-    return [r[0] for r in cur.fetchall()]
+# Long-lived connections for the editor's small per-click reads/writes on MAIN
+# (and per-click reads of other sources, opened readonly), keyed by
+# (realpath, readonly) and capped LRU-first at _SHARED_MAX_CONS.
+# check_same_thread=False + the lock let the reload worker share them; the
+# cursor is closed and any open transaction ended on exit, so no lock outlives
+# a call (the cloner writes through its own connections). Whole-source scans
+# (list_*_all_sources, build_lookup_cache) keep one-off connections so a large
+# DLC folder does not cycle this cache.
+_SHARED_MAX_CONS = 8
+_shared_cons: "OrderedDict[Tuple[str, bool], sqlite3.Connection]" = OrderedDict()
+_shared_lock = threading.Lock()
+# resolve_engine_name's attached-source connections (see _engine_name_queries)
+_engine_name_key: Optional[Tuple[str, ...]] = None
+_engine_name_batches: List[Tuple[sqlite3.Connection, str]] = []
+
+
+@contextmanager
+def _shared_cursor(p: Path, readonly: bool = False) -> Iterator[sqlite3.Cursor]:
+    key = (os.path.realpath(str(p)), readonly)
+    with _shared_lock:
+        con = _shared_cons.get(key)
+        if con is None:
+            if readonly:
+                con = sqlite3.connect(
+                    _ro_uri(Path(key[0])), uri=True, check_same_thread=False, cached_statements=256, factory=_Connection
+                )
+            else:
+                con = sqlite3.connect(key[0], check_same_thread=False, cached_statements=256, factory=_Connection)
+            con.row_factory = sqlite3.Row
+            for pragma in _READ_PRAGMAS if readonly else _EDIT_PRAGMAS:
+                con.execute(pragma)
+            _shared_cons[key] = con
+            while len(_shared_cons) > _SHARED_MAX_CONS:
+                _shared_cons.popitem(last=False)[1].close()
+        else:
+            _shared_cons.move_to_end(key)
+        cur = con.cursor()
+        try:
+            yield cur
+        finally:
+            cur.close()
+            if con.in_transaction:
+                con.rollback()  # error (or missing commit): leave nothing half-written
+
+
+def close_shared_connections() -> None:
+    """Closes the cached connections (the set of SLT files changed, or the app is closing)."""
+    with _shared_lock:
+        for con in _shared_cons.values():
+            con.close()
+        _shared_cons.clear()
+        _close_engine_name_batches()
+
+
+@functools.lru_cache(maxsize=512)
+def _qcols(cols: Tuple[str, ...]) -> str:
+    """Quoted, comma-joined column list: '"a","b"'."""
+    return ",".join(f'"{c}"' for c in cols)
+
+
+@functools.lru_cache(maxsize=64)
+def _qplaceholders(n: int) -> str:
+    return ",".join("?" * n)
+
+
+# SQL text per (table, columns): the same string each time lets sqlite3's
+# per-connection statement cache reuse the prepared statement.
+@functools.lru_cache(maxsize=512)
+def _update_sql(table: str, cols: Tuple[str, ...], key_sql: str) -> str:
+    sets = ", ".join(f'"{c}"=?' for c in cols)
+    return f'UPDATE "{table}" SET {sets} WHERE {key_sql}=?'
+
+
+@functools.lru_cache(maxsize=512)
+def _insert_sql(table: str, cols: Tuple[str, ...], or_replace: bool = False) -> str:
+    verb = "INSERT OR REPLACE" if or_replace else "INSERT"
+    return f'{verb} INTO "{table}" ({_qcols(cols)}) VALUES ({_qplaceholders(len(cols))})'
+
+
+@functools.lru_cache(maxsize=128)
+def _update_level_row_sql(table: str, cols: Tuple[str, ...], level_col: str) -> str:
+    sets = ", ".join(f'"{c}"=?' for c in cols)
+    return f'UPDATE "{table}" SET {sets} WHERE "Ordinal"=? AND "{level_col}"=?'
+
+
+@functools.lru_cache(maxsize=512)
+def _select_by_key_sql(table: str, key_sql: str) -> str:
+    return f'SELECT * FROM "{table}" WHERE {key_sql}=?'
+
+
+@functools.lru_cache(maxsize=512)
+def _select_cols_by_key_sql(table: str, cols: Tuple[str, ...], key_sql: str) -> str:
+    return f'SELECT {_qcols(cols)} FROM "{table}" WHERE {key_sql}=?'
+
+
+@functools.lru_cache(maxsize=512)
+def _delete_by_key_sql(table: str, key_sql: str) -> str:
+    return f'DELETE FROM "{table}" WHERE {key_sql}=?'
+
+
+def _list_tables(cur: sqlite3.Cursor) -> Tuple[str, ...]:
+    con = cur.connection
+    tables = getattr(con, "_tables", None)
+    if tables is None:
+        cur.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'")
+        tables = tuple(r[0] for r in cur.fetchall())
+        if isinstance(con, _Connection):
+            con._tables = tables
+    return tables
+
+
+def _tables_set(cur: sqlite3.Cursor) -> FrozenSet[str]:
+    """Table names as a frozenset, for membership tests; memoized like _list_tables."""
+    con = cur.connection
+    tables = getattr(con, "_tables_set", None)
+    if tables is None:
+        tables = frozenset(_list_tables(cur))
+        if isinstance(con, _Connection):
+            con._tables_set = tables
+    return tables
 
 def _pick_existing_table(cur: sqlite3.Cursor, candidates: List[str]) -> Optional[str]:
     """
     Return the first table name that exists in the DB, matching case-insensitively.
     Example: candidates ["Data_Engine", "Data_engine"].
     """
-    cur.execute("SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'")
-    existing = [r[0] for r in cur.fetchall()]
+    existing = _list_tables(cur)
     lower_map = {name.lower(): name for name in existing}
     for c in candidates:
         if c in existing:
@@ -50,14 +249,63 @@ def _pick_existing_table(cur: sqlite3.Cursor, candidates: List[str]) -> Optional
     return None
 
 def _table_info(cur: sqlite3.Cursor, table: str):
-    cur.execute(f"PRAGMA table_info('{table}')")
-    return cur.fetchall()
+    infos = getattr(cur.connection, "_table_infos", None)
+    info = infos.get(table) if infos is not None else None
+    if info is None:
+        cur.execute(f"PRAGMA table_info('{table}')")
+        info = tuple(cur.fetchall())
+        if infos is not None and info:  # a missing table stays uncached
+            infos[table] = info
+    return info
+
+
+def _prime_schema(cur: sqlite3.Cursor) -> None:
+    """
+    Fills the connection's _table_info memo for every table with one
+    sqlite_master x pragma_table_info query, instead of a PRAGMA per table.
+    """
+    con = cur.connection
+    if not isinstance(con, _Connection) or con._schema_primed:
+        return
+    cur.execute(
+        'SELECT m.name, p.cid, p.name, p.type, p."notnull", p.dflt_value, p.pk '
+        "FROM sqlite_master m JOIN pragma_table_info(m.name) p "
+        "WHERE m.type='table' AND m.name NOT LIKE 'sqlite_%' ORDER BY m.name, p.cid"
+    )
+    by_table: Dict[str, List[Tuple[Any, ...]]] = {}
+    for t, *info in cur.fetchall():
+        by_table.setdefault(t, []).append(tuple(info))
+    for t, info in by_table.items():
+        con._table_infos.setdefault(t, tuple(info))
+    con._schema_primed = True
 
 
 def _cols(info) -> List[str]:
     return [r[1] for r in info]
 
 
+def _table_cols(cur: sqlite3.Cursor, table: str) -> Tuple[str, ...]:
+    """Column names of table, memoized on the connection like _table_info."""
+    memo = getattr(cur.connection, "_table_cols", None)
+    cols = memo.get(table) if memo is not None else None
+    if cols is None:
+        cols = tuple(r[1] for r in _table_info(cur, table))
+        if memo is not None and cols:
+            memo[table] = cols
+    return cols
+
+
+def _table_colset(cur: sqlite3.Cursor, table: str) -> FrozenSet[str]:
+    """Column names of table as a frozenset, for membership tests and _first_existing_col."""
+    memo = getattr(cur.connection, "_table_colsets", None)
+    cols = memo.get(table) if memo is not None else None
+    if cols is None:
+        cols = frozenset(_table_cols(cur, table))
+        if memo is not None and cols:
+            memo[table] = cols
+    return cols
+
+
 def _pk_col(info) -> Optional[str]:
     for cid, name, typ, notnull, dflt, pkflag in info:
         if pkflag:
@@ -66,18 +314,36 @@ def _pk_col(info) -> Optional[str]:
 
 
 def _safe_int(x) -> Optional[int]:
+    if type(x) is int:  # the usual case for SLT id columns: no try/except needed
+        return x
     try:
         return int(x)
     except Exception:
         return None
 
 
+@functools.lru_cache(maxsize=512)
+def _shared_cols(cols_s: Tuple[str, ...], cols_d: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Destination columns (in destination order) that the source also has."""
+    src = set(cols_s)
+    return tuple(c for c in cols_d if c in src)
+
+
+@functools.lru_cache(maxsize=512)
+def _rewritable_idx(table: str, cols: Tuple[str, ...]) -> Tuple[int, ...]:
+    """Positions in cols of the *ID / *IDs columns the base-block rewrite may touch."""
+    return tuple(
+        i for i, c in enumerate(cols)
+        if c != "Ordinal" and c.lower().endswith(("id", "ids"))
+    )
+
+
 def _table_exists(cur: sqlite3.Cursor, table: str) -> bool:
-    return table in set(_list_tables(cur))
+    return table in _tables_set(cur)
 
 
 def _find_first_table(cur: sqlite3.Cursor, candidates: List[str]) -> Optional[str]:
-    tables = set(_list_tables(cur))
+    tables = _tables_set(cur)
     for t in candidates:
         if t in tables:
             return t
@@ -85,21 +351,23 @@ def _find_first_table(cur: sqlite3.Cursor, candidates: List[str]) -> Optional[st
 
 
 def _row_exists(cur: sqlite3.Cursor, table: str, pk: str, pk_val: int) -> bool:
-    cur.execute(f'SELECT 1 FROM "{table}" WHERE "{pk}"=? LIMIT 1', (pk_val,))
+    cur.execute(_select_by_key_sql(table, f'"{pk}"'), (pk_val,))
     return cur.fetchone() is not None
 
 
 def _alloc_id_in_block(cur: sqlite3.Cursor, table: str, pk: str, start: int, block: int = 1000) -> int:
     """
     Finds a free PK value in [start, start+block). If full, returns start+block.
+    One range query for the used ids instead of a lookup per candidate.
     """
-    for cand in range(start, start + block):
-        if not _row_exists(cur, table, pk, cand):
-            return cand
-    return start + block
+    cur.execute(f'SELECT "{pk}" FROM "{table}" WHERE "{pk}">=? AND "{pk}"<?', (start, start + block))
+    used = {r[0] for r in cur.fetchall()}
+    return next((cand for cand in range(start, start + block) if cand not in used), start + block)
 
 
-def _insert_row(cur: sqlite3.Cursor, table: str, cols: List[str], vals: List[Any], auto_drop_id: bool):
+def _insert_row(
+    cur: sqlite3.Cursor, table: str, cols: List[str], vals: List[Any], auto_drop_id: bool, or_replace: bool = False
+):
     info = _table_info(cur, table)
     cols_t = _cols(info)
     pk = _pk_col(info)
@@ -118,71 +386,66 @@ def _insert_row(cur: sqlite3.Cursor, table: str, cols: List[str], vals: List[Any
         cols = cols[:i] + cols[i + 1 :]
         vals = vals[:i] + vals[i + 1 :]
 
-    placeholders = ",".join(["?"] * len(cols))
-    cols_sql = ",".join([f'"{c}"' for c in cols])
-    cur.execute(f'INSERT INTO "{table}" ({cols_sql}) VALUES ({placeholders})', vals)
+    cur.execute(_insert_sql(table, tuple(cols), or_replace), vals)
+
+
+@functools.lru_cache(maxsize=128)
+def _copy_row_sql(table: str, cols: Tuple[str, ...], pk_col: str, src_schema: str, rewrite_base_ids: bool) -> str:
+    """
+    INSERT .. SELECT copying one row of src_schema.table into main.table, with
+    the new PK and the base-block rewrite done in SQL. Named parameters:
+    :old_id, :new_id, :lo/:hi (donor block) and :shift (new base - old base).
+    """
+    rewritable = set(_rewritable_idx(table, cols)) if rewrite_base_ids else set()
+    exprs = []
+    for i, c in enumerate(cols):
+        if c == pk_col:
+            exprs.append(":new_id")
+        elif i in rewritable:
+            exprs.append(f'CASE WHEN "{c}">=:lo AND "{c}"<:hi THEN "{c}"+:shift ELSE "{c}" END')
+        else:
+            exprs.append(f'"{c}"')
+    # the PK is written explicitly: an existing destination row gets replaced
+    verb = "INSERT OR REPLACE" if pk_col in cols else "INSERT"
+    return (
+        f'{verb} INTO main."{table}" ({_qcols(cols)}) '
+        f'SELECT {", ".join(exprs)} FROM {src_schema}."{table}" WHERE "{pk_col}"=:old_id'
+    )
 
 
 def _copy_row_by_pk(
     cur_src: sqlite3.Cursor,
     cur_dst: sqlite3.Cursor,
+    src_schema: str,
     table: str,
     pk_col: str,
     old_id: int,
     new_id: int,
-    id_rewrites: Dict[str, int],
     base_old: int,
     base_new: int,
     rewrite_base_ids: bool,
 ) -> bool:
     """
-    Copies row table(pk=old_id) -> table(pk=new_id).
-    Also rewrites known columns + optionally rewrites any *ID-like cols in base block.
+    Copies row table(pk=old_id) -> table(pk=new_id) with one INSERT .. SELECT
+    on cur_dst, which has the source attached as src_schema (cur_src is only
+    used for the source schema). Optionally rewrites any *ID-like cols in base block.
     """
     if not _table_exists(cur_dst, table):
         return False
     if not _table_exists(cur_src, table):
         return False
 
-    info_s = _table_info(cur_src, table)
-    info_d = _table_info(cur_dst, table)
-    cols_s = _cols(info_s)
-    cols_d = _cols(info_d)
-
-    cur_src.execute(f'SELECT * FROM "{table}" WHERE "{pk_col}"=?', (old_id,))
-    r = cur_src.fetchone()
-    if not r:
-        return False
-
-    src_map = {c: r[c] for c in cols_s if c in r.keys()}
-    ins_cols = [c for c in cols_d if c in src_map]
-    ins_vals = [src_map[c] for c in ins_cols]
-
-    if pk_col in ins_cols:
-        ins_vals[ins_cols.index(pk_col)] = new_id
+    # only the columns both sides have, already in destination order
+    cols = _shared_cols(_table_cols(cur_src, table), _table_cols(cur_dst, table))
 
-    # explicit rewrites
-    for c, v in id_rewrites.items():
-        if c in ins_cols:
-            ins_vals[ins_cols.index(c)] = v
-
-    # base-block rewrite for ID-like columns
-    if rewrite_base_ids:
-        for i, c in enumerate(ins_cols):
-            if c == "Ordinal":
-                continue
-            if not (c.lower().endswith("id") or c.lower().endswith("ids")):
-                continue
-            vi = _safe_int(ins_vals[i])
-            if vi is None:
-                continue
-            if base_old <= vi < base_old + 1000:
-                ins_vals[i] = base_new + (vi - base_old)
-
-    # if destination row already exists, replace
-    cur_dst.execute(f'DELETE FROM "{table}" WHERE "{pk_col}"=?', (new_id,))
-    _insert_row(cur_dst, table, ins_cols, ins_vals, auto_drop_id=True)
-    return True
+    if pk_col not in cols:
+        # no explicit PK to replace on: clear the target id, the insert picks one
+        cur_dst.execute(_delete_by_key_sql(table, f'"{pk_col}"'), (new_id,))
+    cur_dst.execute(
+        _copy_row_sql(table, cols, pk_col, src_schema, rewrite_base_ids),
+        {"old_id": old_id, "new_id": new_id, "lo": base_old, "hi": base_old + 1000, "shift": base_new - base_old},
+    )
+    return cur_dst.rowcount > 0
 
 
 # -----------------------------
@@ -201,10 +464,8 @@ _SUBSYSTEMS = [
 
 
 def list_supported_subsystems(main_db: Path) -> List[str]:
-    con = _connect(main_db)
-    cur = con.cursor()
-    tables = set(_list_tables(cur))
-    con.close()
+    with _shared_cursor(main_db) as cur:
+        tables = _tables_set(cur)
 
     out = []
     for name, candidates in _SUBSYSTEMS:
@@ -233,7 +494,7 @@ def _find_level_row(
     donor_car_id: int,
     level: int,
 ) -> Optional[sqlite3.Row]:
-    cols = _cols(_table_info(cur_src, upgrade_table))
+    cols = _table_cols(cur_src, upgrade_table)
     if "Ordinal" not in cols:
         return None
 
@@ -244,27 +505,22 @@ def _find_level_row(
         return cur_src.fetchone()
 
     # Prefer exact level row; if none, fall back to IsStock=1 and Level=0
-    cur_src.execute(
-        f'SELECT * FROM "{upgrade_table}" WHERE "Ordinal"=? AND "{level_col}"=? LIMIT 1',
-        (donor_car_id, level),
-    )
-    r = cur_src.fetchone()
-    if r:
-        return r
-
-    # fallback stock
-    if "IsStock" in cols:
-        cur_src.execute(
-            f'SELECT * FROM "{upgrade_table}" WHERE "Ordinal"=? AND "IsStock"=1 AND "{level_col}"=0 LIMIT 1',
-            (donor_car_id,),
-        )
-        return cur_src.fetchone()
+    # (or the lowest level when there is no IsStock column) in the same query
+    has_stock = "IsStock" in cols
+    params = (donor_car_id, level, level) if has_stock else (donor_car_id, level)
+    cur_src.execute(_level_row_sql(upgrade_table, level_col, has_stock), params)
+    return cur_src.fetchone()
 
-    cur_src.execute(
-        f'SELECT * FROM "{upgrade_table}" WHERE "Ordinal"=? ORDER BY "{level_col}" LIMIT 1',
-        (donor_car_id,),
+
+@functools.lru_cache(maxsize=128)
+def _level_row_sql(table: str, level_col: str, has_stock: bool) -> str:
+    where = '"Ordinal"=?'
+    if has_stock:
+        where += f' AND ("{level_col}"=? OR ("IsStock"=1 AND "{level_col}"=0))'
+    return (
+        f'SELECT * FROM "{table}" WHERE {where} '
+        f'ORDER BY CASE WHEN "{level_col}"=? THEN 0 ELSE 1 END, "{level_col}" LIMIT 1'
     )
-    return cur_src.fetchone()
 
 
 def _write_level_row(
@@ -273,9 +529,11 @@ def _write_level_row(
     target_car_id: int,
     src_row: sqlite3.Row,
     desired_level: int,
+    rewrites: Optional[Dict[str, int]] = None,
 ) -> int:
     """
     Writes/overwrites the level row for target in upgrade_table based on src_row.
+    rewrites (column -> value) are applied before the insert.
     """
     info = _table_info(cur_dst, upgrade_table)
     cols_d = _cols(info)
@@ -298,6 +556,23 @@ def _write_level_row(
     if "IsStock" in cols_d and "IsStock" in ins_cols:
         ins_vals[ins_cols.index("IsStock")] = 1 if desired_level == 0 else 0
 
+    for c, v in (rewrites or {}).items():
+        if c in ins_cols:
+            ins_vals[ins_cols.index(c)] = v
+
+    # Overwrite the existing level row in place (one statement, keeps its Id);
+    # only a missing row needs the insert. Duplicates fall through to the
+    # delete below so the level still ends up with exactly one row.
+    if level_col:
+        pk = _pk_col(info)
+        set_cols = tuple(c for c in ins_cols if c != pk)
+        cur_dst.execute(
+            _update_level_row_sql(upgrade_table, set_cols, level_col),
+            [v for c, v in zip(ins_cols, ins_vals) if c != pk] + [target_car_id, desired_level],
+        )
+        if cur_dst.rowcount == 1:
+            return 1
+
     # Delete existing target row for that level (or all if no level col)
     if level_col:
         cur_dst.execute(
@@ -315,9 +590,38 @@ def _write_level_row(
 # Physics cloning (base-block)
 # -----------------------------
 
+# physics table candidates by column-name hint, first match wins
+_PHYSICS_TABLE_HINTS = (
+    ("springdamper", ("List_SpringDamperPhysics",)),
+    ("antisway", ("List_AntiSwayPhysics",)),
+    ("transmission", ("List_TransmissionPhysics",)),
+    ("differential", ("List_DifferentialPhysics",)),
+    ("brake", ("List_BrakePhysics",)),
+    ("aero", ("List_AeroPhysics",)),
+    ("tire", ("List_TireCompound",)),  # not always PhysicsID, but leave it here
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _phys_plan(cols: Tuple[str, ...]) -> Tuple[Tuple[int, str, Optional[Tuple[str, ...]]], ...]:
+    """
+    (index, column, candidate tables) for every *PhysicsID* column of an upgrade row.
+    Candidates are None when no hint matches (caller falls back to any List_*Physics).
+    """
+    plan = []
+    for i, c in enumerate(cols):
+        cname = c.lower()
+        if "physicsid" not in cname:
+            continue
+        candidates = next((tables for hint, tables in _PHYSICS_TABLE_HINTS if hint in cname), None)
+        plan.append((i, c, candidates))
+    return tuple(plan)
+
+
 def _clone_physics_ids_from_upgrade_row(
     cur_src: sqlite3.Cursor,
     cur_dst: sqlite3.Cursor,
+    src_schema: str,
     src_row: sqlite3.Row,
     donor_car_id: int,
     target_car_id: int,
@@ -334,27 +638,14 @@ def _clone_physics_ids_from_upgrade_row(
     donor_base = donor_car_id * 1000
     target_base = target_car_id * 1000
 
-    src_cols = list(src_row.keys())
-    phys_cols = [c for c in src_cols if "physicsid" in c.lower()]
-
-    if not phys_cols:
+    plan = _phys_plan(tuple(src_row.keys()))
+    if not plan:
         return rewrites
 
-    # physics table candidates by known patterns
-    physics_tables = {
-        "SpringDamperPhysics": ["List_SpringDamperPhysics"],
-        "AntiSwayPhysics": ["List_AntiSwayPhysics"],
-        "TransmissionPhysics": ["List_TransmissionPhysics"],
-        "DifferentialPhysics": ["List_DifferentialPhysics"],
-        "BrakePhysics": ["List_BrakePhysics"],
-        "AeroPhysics": ["List_AeroPhysics"],
-        "TireCompound": ["List_TireCompound"],  # not always PhysicsID, but leave it here
-    }
-
-    dst_tables = set(_list_tables(cur_dst))
+    dst_tables = _tables_set(cur_dst)
 
-    for c in phys_cols:
-        vi = _safe_int(src_row[c])
+    for i, c, table_candidates in plan:
+        vi = _safe_int(src_row[i])
         if vi is None:
             continue
         if not (donor_base <= vi < donor_base + 1000):
@@ -364,24 +655,8 @@ def _clone_physics_ids_from_upgrade_row(
         # choose new id (same offset) then ensure free
         desired_new = target_base + (vi - donor_base)
 
-        # pick the best physics table to clone from, based on column name
-        cname = c.lower()
-        table_candidates: List[str] = []
-        if "springdamper" in cname:
-            table_candidates = physics_tables["SpringDamperPhysics"]
-        elif "antisway" in cname:
-            table_candidates = physics_tables["AntiSwayPhysics"]
-        elif "transmission" in cname:
-            table_candidates = physics_tables["TransmissionPhysics"]
-        elif "differential" in cname:
-            table_candidates = physics_tables["DifferentialPhysics"]
-        elif "brake" in cname:
-            table_candidates = physics_tables["BrakePhysics"]
-        elif "aero" in cname:
-            table_candidates = physics_tables["AeroPhysics"]
-        elif "tire" in cname:
-            table_candidates = physics_tables["TireCompound"]
-        else:
+        # best physics table to clone from, picked from the column name by _phys_plan
+        if table_candidates is None:
             # heuristic: look for any List_*Physics table
             table_candidates = [t for t in dst_tables if t.lower().startswith("list_") and t.lower().endswith("physics")]
 
@@ -408,11 +683,11 @@ def _clone_physics_ids_from_upgrade_row(
         ok = _copy_row_by_pk(
             cur_src=cur_src,
             cur_dst=cur_dst,
+            src_schema=src_schema,
             table=phys_table,
             pk_col=pk,
             old_id=vi,
             new_id=new_id,
-            id_rewrites={},  # base rewrite handles inner references
             base_old=donor_base,
             base_new=target_base,
             rewrite_base_ids=True,
@@ -431,94 +706,81 @@ def _clone_physics_ids_from_upgrade_row(
 
 def apply_subsystem_from_donor(
     main_db: Path,
-    donor_source_db: Path,
+    donor_db: Path,
     target_car_id: int,
     donor_car_id: int,
     subsystem: str,
-    level: int,
+    level: int = 0,
 ) -> ApplyReport:
     """
     Applies one subsystem at chosen level from donor car to target car.
-    Only edits MAIN.
+    Only edits MAIN; the physics clones and the level row go in as one transaction.
+    The donor is also attached to the MAIN connection so physics rows are
+    copied with INSERT .. SELECT instead of going through Python.
     """
-    con_dst = _connect(main_db)
+    con_dst = _connect(main_db, tuned=True)
     cur_dst = con_dst.cursor()
 
-    con_src = _connect(donor_source_db)
+    con_src = _connect(donor_db, readonly=True)
     cur_src = con_src.cursor()
 
     rows_written: Dict[str, int] = {}
     notes: List[str] = []
 
-    # Validate target exists in MAIN
-    cur_dst.execute('SELECT 1 FROM "Data_Car" WHERE "Id"=? LIMIT 1', (target_car_id,))
-    if not cur_dst.fetchone():
-        con_src.close()
-        con_dst.close()
-        raise ValueError(f"Target CarID {target_car_id} not found in MAIN.")
-
-    upgrade_table = _pick_upgrade_table(cur_dst, subsystem)
-    if not upgrade_table:
-        con_src.close()
-        con_dst.close()
-        raise ValueError(f"No upgrade table found in MAIN for subsystem {subsystem}.")
+    try:
+        cur_dst.execute("BEGIN IMMEDIATE")
+        if Path(donor_db).resolve() == Path(main_db).resolve():
+            # a second handle on MAIN would hold a read lock the commit waits on
+            src_schema = "main"
+        else:
+            # attached after BEGIN IMMEDIATE so only MAIN takes the write lock. Plain
+            # path (MAIN is not opened as a URI): the donor is only ever read through
+            # it, and the mode=ro open above already proved the file exists
+            cur_dst.execute("ATTACH DATABASE ? AS donor", (str(donor_db),))
+            src_schema = "donor"
+
+        # Validate target exists in MAIN
+        cur_dst.execute('SELECT 1 FROM "Data_Car" WHERE "Id"=? LIMIT 1', (target_car_id,))
+        if not cur_dst.fetchone():
+            raise ValueError(f"Target CarID {target_car_id} not found in MAIN.")
+
+        upgrade_table = _pick_upgrade_table(cur_dst, subsystem)
+        if not upgrade_table:
+            raise ValueError(f"No upgrade table found in MAIN for subsystem {subsystem}.")
+
+        # Make sure donor table exists in donor source
+        if not _table_exists(cur_src, upgrade_table):
+            raise ValueError(f'Donor source "{donor_db.name}" does not contain table "{upgrade_table}".')
+
+        src_row = _find_level_row(cur_src, upgrade_table, donor_car_id, level)
+        if not src_row:
+            raise ValueError(f"No donor row found for {upgrade_table} Ordinal={donor_car_id} Level={level}.")
+
+        # Special case: Engine uses List_UpgradesEngine and references Data_Engine but no physics cloning required.
+        # We still copy the level row and let existing stock engine assignment feature work.
+        # For other subsystems, we attempt to clone linked PhysicsIDs if they are base-block.
+        rewrites = _clone_physics_ids_from_upgrade_row(
+            cur_src, cur_dst, src_schema, src_row, donor_car_id, target_car_id, notes
+        )
+        for c in rewrites:
+            rows_written[f"{upgrade_table} ({c})"] = 1
 
-    # Make sure donor table exists in donor source
-    if not _table_exists(cur_src, upgrade_table):
-        con_src.close()
-        con_dst.close()
-        raise ValueError(f'Donor source "{donor_source_db.name}" does not contain table "{upgrade_table}".')
+        # Write the upgrade row (overwriting target) with the cloned IDs already in place
+        n = _write_level_row(cur_dst, upgrade_table, target_car_id, src_row, desired_level=level, rewrites=rewrites)
+        rows_written[upgrade_table] = rows_written.get(upgrade_table, 0) + n
 
-    src_row = _find_level_row(cur_src, upgrade_table, donor_car_id, level)
-    if not src_row:
+        con_dst.commit()
+    except Exception:
+        con_dst.rollback()
+        raise
+    finally:
         con_src.close()
         con_dst.close()
-        raise ValueError(f"No donor row found for {upgrade_table} Ordinal={donor_car_id} Level={level}.")
-
-    # Special case: Engine uses List_UpgradesEngine and references Data_Engine but no physics cloning required.
-    # We still copy the level row and let existing stock engine assignment feature work.
-    # For other subsystems, we attempt to clone linked PhysicsIDs if they are base-block.
-    rewrites = _clone_physics_ids_from_upgrade_row(cur_src, cur_dst, src_row, donor_car_id, target_car_id, notes)
-
-    # Write the upgrade row (overwriting target)
-    n = _write_level_row(cur_dst, upgrade_table, target_car_id, src_row, desired_level=level)
-    rows_written[upgrade_table] = rows_written.get(upgrade_table, 0) + n
-
-    # Apply rewrites to the just-written row (if any)
-    if rewrites:
-        cols_d = _cols(_table_info(cur_dst, upgrade_table))
-        level_col = "Level" if "Level" in cols_d else ("level" if "level" in cols_d else None)
-
-        sets = []
-        vals: List[Any] = []
-        for c, v in rewrites.items():
-            if c in cols_d:
-                sets.append(f'"{c}"=?')
-                vals.append(v)
-
-        if sets:
-            if level_col:
-                vals.extend([target_car_id, level])
-                cur_dst.execute(
-                    f'UPDATE "{upgrade_table}" SET {", ".join(sets)} WHERE "Ordinal"=? AND "{level_col}"=?',
-                    vals,
-                )
-            else:
-                vals.append(target_car_id)
-                cur_dst.execute(
-                    f'UPDATE "{upgrade_table}" SET {", ".join(sets)} WHERE "Ordinal"=?',
-                    vals,
-                )
-            rows_written[f"{upgrade_table} (rewrites)"] = cur_dst.rowcount
-
-    con_dst.commit()
-    con_src.close()
-    con_dst.close()
 
     return ApplyReport(
         target_car_id=target_car_id,
         donor_car_id=donor_car_id,
-        donor_source=donor_source_db,
+        donor_source=donor_db,
         subsystem=subsystem,
         level=level,
         rows_written=dict(sorted(rows_written.items(), key=lambda kv: (-kv[1], kv[0]))),
@@ -530,6 +792,10 @@ def apply_subsystem_from_donor(
 # Spicy camber (stock suspension row)
 # -----------------------------
 
+# UPDATE ... RETURNING needs SQLite 3.35+
+_HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+
 def apply_spicy_camber(
     main_db: Path,
     target_car_id: int,
@@ -540,78 +806,96 @@ def apply_spicy_camber(
     Applies camber by editing List_SpringDamperPhysics.StaticCamber
     for the target car's STOCK spring/damper row (IsStock=1, Level=0).
     """
-    con = _connect(main_db)
+    con = _connect(main_db, tuned=True)
     cur = con.cursor()
-    tables = set(_list_tables(cur))
-
-    if "List_UpgradeSpringDamper" not in tables:
-        con.close()
-        raise ValueError("MAIN missing List_UpgradeSpringDamper.")
-    if "List_SpringDamperPhysics" not in tables:
-        con.close()
-        raise ValueError("MAIN missing List_SpringDamperPhysics.")
-
-    cols_u = _cols(_table_info(cur, "List_UpgradeSpringDamper"))
-    needed = ["Ordinal", "IsStock", "Level"]
-    for c in needed:
-        if c not in cols_u:
-            con.close()
-            raise ValueError(f'List_UpgradeSpringDamper missing "{c}".')
-
-    front_col = next((c for c in cols_u if c.lower() == "frontspringdamperphysicsid"), None)
-    rear_col = next((c for c in cols_u if c.lower() == "rearspringdamperphysicsid"), None)
-    if not front_col or not rear_col:
-        con.close()
-        raise ValueError("List_UpgradeSpringDamper missing Front/RearSpringDamperPhysicsID columns.")
+    try:
+        # checks and both UPDATEs in one write transaction, one commit
+        cur.execute("BEGIN IMMEDIATE")
+        tables = _tables_set(cur)
+
+        if "List_UpgradeSpringDamper" not in tables:
+            raise ValueError("MAIN missing List_UpgradeSpringDamper.")
+        if "List_SpringDamperPhysics" not in tables:
+            raise ValueError("MAIN missing List_SpringDamperPhysics.")
+
+        cols_u = _table_cols(cur, "List_UpgradeSpringDamper")
+        needed = ["Ordinal", "IsStock", "Level"]
+        for c in needed:
+            if c not in cols_u:
+                raise ValueError(f'List_UpgradeSpringDamper missing "{c}".')
+
+        front_col = next((c for c in cols_u if c.lower() == "frontspringdamperphysicsid"), None)
+        rear_col = next((c for c in cols_u if c.lower() == "rearspringdamperphysicsid"), None)
+        if not front_col or not rear_col:
+            raise ValueError("List_UpgradeSpringDamper missing Front/RearSpringDamperPhysicsID columns.")
 
-    cur.execute(
-        'SELECT * FROM "List_UpgradeSpringDamper" WHERE "Ordinal"=? AND "IsStock"=1 AND "Level"=0 LIMIT 1',
-        (target_car_id,),
-    )
-    r = cur.fetchone()
-    if not r:
-        con.close()
-        raise ValueError(f"No stock spring/damper row found for CarID {target_car_id} (IsStock=1 Level=0).")
+        cur.execute(
+            'SELECT * FROM "List_UpgradeSpringDamper" WHERE "Ordinal"=? AND "IsStock"=1 AND "Level"=0 LIMIT 1',
+            (target_car_id,),
+        )
+        r = cur.fetchone()
+        if not r:
+            raise ValueError(f"No stock spring/damper row found for CarID {target_car_id} (IsStock=1 Level=0).")
 
-    f_id = _safe_int(r[front_col])
-    b_id = _safe_int(r[rear_col])
-    if f_id is None or b_id is None:
-        con.close()
-        raise ValueError("Front/RearSpringDamperPhysicsID values are null/invalid.")
+        f_id = _safe_int(r[front_col])
+        b_id = _safe_int(r[rear_col])
+        if f_id is None or b_id is None:
+            raise ValueError("Front/RearSpringDamperPhysicsID values are null/invalid.")
 
-    cols_p = _cols(_table_info(cur, "List_SpringDamperPhysics"))
-    pk = _pk_col(_table_info(cur, "List_SpringDamperPhysics"))
-    if not pk:
-        con.close()
-        raise ValueError("List_SpringDamperPhysics has no primary key.")
+        cols_p = _table_cols(cur, "List_SpringDamperPhysics")
+        pk = _pk_col(_table_info(cur, "List_SpringDamperPhysics"))
+        if not pk:
+            raise ValueError("List_SpringDamperPhysics has no primary key.")
+
+        cam_col = next((c for c in cols_p if c.lower() == "staticcamber"), None)
+        if not cam_col:
+            raise ValueError("List_SpringDamperPhysics missing StaticCamber column.")
+
+        out = {"front": 0, "rear": 0}
+
+        if _HAS_RETURNING:
+            # one UPDATE for both rows; rear wins when both ids are the same row,
+            # as it did with two statements. RETURNING tells which ids were hit.
+            cur.execute(
+                f'UPDATE "List_SpringDamperPhysics" SET "{cam_col}"=CASE "{pk}" WHEN ? THEN ? ELSE ? END '
+                f'WHERE "{pk}" IN (?, ?) RETURNING "{pk}"',
+                (b_id, float(rear_camber), float(front_camber), f_id, b_id),
+            )
+            hit = {row[0] for row in cur.fetchall()}
+            out["front"] = int(f_id in hit)
+            out["rear"] = int(b_id in hit)
+        else:
+            cur.execute(f'UPDATE "List_SpringDamperPhysics" SET "{cam_col}"=? WHERE "{pk}"=?', (float(front_camber), f_id))
+            out["front"] = cur.rowcount
+            cur.execute(f'UPDATE "List_SpringDamperPhysics" SET "{cam_col}"=? WHERE "{pk}"=?', (float(rear_camber), b_id))
+            out["rear"] = cur.rowcount
 
-    cam_col = next((c for c in cols_p if c.lower() == "staticcamber"), None)
-    if not cam_col:
+        con.commit()
+    except Exception:
+        con.rollback()
+        raise
+    finally:
         con.close()
-        raise ValueError("List_SpringDamperPhysics missing StaticCamber column.")
-
-    out = {"front": 0, "rear": 0}
-
-    cur.execute(f'UPDATE "List_SpringDamperPhysics" SET "{cam_col}"=? WHERE "{pk}"=?', (float(front_camber), f_id))
-    out["front"] = cur.rowcount
-    cur.execute(f'UPDATE "List_SpringDamperPhysics" SET "{cam_col}"=? WHERE "{pk}"=?', (float(rear_camber), b_id))
-    out["rear"] = cur.rowcount
-
-    con.commit()
-    con.close()
     return out
     
     # -----------------------------
 # Constructor Studio APIs (UI helpers)
 # -----------------------------
-import shutil
 from datetime import datetime
 
 
 def backup_db(db: Path) -> Path:
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
     out = db.with_name(f"{db.stem}_backup_{ts}{db.suffix}")
-    shutil.copy2(db, out)
+    # Online Backup API: a consistent page copy even if another connection is
+    # writing, streamed in steps so other readers are not blocked for the whole copy
+    src = _connect(db, readonly=True)
+    dst = sqlite3.connect(str(out))
+    try:
+        src.backup(dst, pages=1024)
+    finally:
+        dst.close()
+        src.close()
     return out
 
 
@@ -620,323 +904,444 @@ def build_source_list(main_db: Path, dlc_folder: Optional[Path]) -> List[Path]:
 
     if dlc_folder and Path(dlc_folder).exists():
         dlc_root = Path(dlc_folder)
+        main_real = os.path.realpath(str(main_db))
 
+        # os.walk filters on the directory entries it already read: only *.slt
+        # names (any case) become Paths, nothing else is stat'ed
         found = []
-        for p in dlc_root.rglob("*"):
-            if p.is_file() and p.suffix.lower() == ".slt":
-                if p.resolve() == Path(main_db).resolve():
+        for dirpath, _dirnames, filenames in os.walk(dlc_root):
+            for fn in filenames:
+                if not fn.lower().endswith(".slt"):
+                    continue
+                full = os.path.join(dirpath, fn)
+                if os.path.realpath(full) == main_real:
                     continue
-                found.append(p)
+                # stable order: by filename then by full path
+                found.append(((fn.lower(), full.lower()), full))
 
-        # stable order: by filename then by full path
-        found = sorted(found, key=lambda x: (x.name.lower(), str(x).lower()))
-        sources.extend(found)
+        found.sort()
+        sources.extend(Path(full) for _key, full in found)
 
     return sources
 
 
-def _first_existing_col(cols: List[str], candidates: List[str]) -> Optional[str]:
-    for c in candidates:
-        if c in cols:
-            return c
-    return None
+def _first_existing_col(cols: Iterable[str], candidates: Iterable[str]) -> Optional[str]:
+    """First candidate present in cols; pass a _table_colset for O(1) lookups."""
+    return next((c for c in candidates if c in cols), None)
 
 
-def list_cars_all_sources(sources: List[Path]) -> List[Dict[str, Any]]:
-    out: List[Dict[str, Any]] = []
-    seen: set[Tuple[int, str]] = set()
+# Worker cap for reading several SLTs at once (each worker opens its own
+# read-only connection, so nothing is shared across threads)
+_SOURCE_READ_WORKERS = 8
+
+
+def read_sources(reader, sources: Iterable[Any]) -> List[Any]:
+    """
+    reader(src) for every source, run concurrently; results keep source order.
+    The app also runs its per-source memo loaders through this.
+    """
+    sources = list(sources)
+    if len(sources) <= 1:
+        return [reader(src) for src in sources]
+    with ThreadPoolExecutor(max_workers=min(_SOURCE_READ_WORKERS, len(sources))) as pool:
+        return list(pool.map(reader, sources))
+
 
-    for src in sources:
-        con = _connect(src)
+def _iter_car_rows(src: Path) -> Iterator[Tuple[Any, Any, Any]]:
+    """
+    (CarID, MediaName, Year) rows of one source's Data_Car, streamed from
+    the cursor; nothing if it has none.
+    """
+    con = _connect(src, tuned=True, readonly=True)
+    try:
         cur = con.cursor()
-        if "Data_Car" not in set(_list_tables(cur)):
-            con.close()
-            continue
+        if "Data_Car" not in _tables_set(cur):
+            return
 
-        cols = _cols(_table_info(cur, "Data_Car"))
+        cols = _table_colset(cur, "Data_Car")
         car_id_col = _first_existing_col(cols, ["CarID", "CarId", "Id"])
         media_col = _first_existing_col(cols, ["MediaName", "CarName", "Name"])
         year_col = _first_existing_col(cols, ["ModelYear", "Year", "ReleaseYear"])
 
         if not car_id_col:
-            con.close()
-            continue
+            return
 
-        sel_cols = [car_id_col]
-        if media_col:
-            sel_cols.append(media_col)
-        if year_col:
-            sel_cols.append(year_col)
+        # fixed column positions (missing columns select a constant), unpacked per row
+        media_sql = f'"{media_col}"' if media_col else "''"
+        year_sql = f'"{year_col}"' if year_col else "NULL"
+        cur.execute(f'SELECT "{car_id_col}", {media_sql}, {year_sql} FROM "Data_Car"')
+        yield from cur
+    finally:
+        con.close()
+
+
+def _source_row_iters(reader, sources: List[Path]) -> List[Iterable[Tuple[Any, ...]]]:
+    """
+    Per-source rows for iter_*_all_sources. A lone source (how the app's
+    per-file memos call them) is streamed straight from its cursor; several
+    are read concurrently, each into a list, since the pool has to hand
+    finished results back.
+    """
+    if len(sources) == 1:
+        return [reader(sources[0])]
+    return read_sources(lambda src: list(reader(src)), sources)
 
-        sel_sql = ",".join(f'"{c}"' for c in sel_cols)
-        cur.execute(f'SELECT {sel_sql} FROM "Data_Car"')
-        rows = cur.fetchall()
 
-        for r in rows:
-            car_id = int(r[car_id_col])
-            media = r[media_col] if media_col and media_col in r.keys() else ""
-            year = r[year_col] if year_col and year_col in r.keys() else None
-            key = (car_id, src.name)
+def iter_cars_all_sources(sources: List[Path]) -> Iterator[Dict[str, Any]]:
+    """Car rows of every source, one dict at a time (see list_cars_all_sources)."""
+    seen: set[Tuple[int, str]] = set()
+
+    # sources are read in parallel, merged here in source order so the
+    # dedupe below keeps the same rows as a serial scan
+    for src, rows in zip(sources, _source_row_iters(_iter_car_rows, sources)):
+        name = src.name
+        source = str(src)
+
+        for car_id, media, year in rows:
+            car_id = int(car_id)
+            key = (car_id, name)
             if key in seen:
                 continue
             seen.add(key)
-            out.append({"CarID": car_id, "MediaName": media or "", "Year": year, "Source": str(src)})
+            yield {"CarID": car_id, "MediaName": media or "", "Year": year, "Source": source}
 
-        con.close()
-
-    return out
 
+def list_cars_all_sources(sources: List[Path]) -> List[Dict[str, Any]]:
+    return list(iter_cars_all_sources(sources))
 
-def list_engines_all_sources(sources: List[Path]) -> List[Dict[str, Any]]:
-    out: List[Dict[str, Any]] = []
-    seen: set[Tuple[int, str]] = set()
 
-    for src in sources:
-        con = _connect(src)
+def _iter_engine_rows(src: Path) -> Iterator[Tuple[Any, Any, Any]]:
+    """
+    (EngineID, EngineName, MediaName) rows of one source's Data_Engine,
+    streamed from the cursor; nothing if it has none.
+    """
+    con = _connect(src, tuned=True, readonly=True)
+    try:
         cur = con.cursor()
-        if "Data_Engine" not in set(_list_tables(cur)):
-            con.close()
-            continue
+        if "Data_Engine" not in _tables_set(cur):
+            return
 
-        cols = _cols(_table_info(cur, "Data_Engine"))
+        cols = _table_colset(cur, "Data_Engine")
         id_col = _first_existing_col(cols, ["EngineID", "EngineId", "Id"])
         name_col = _first_existing_col(cols, ["EngineName", "Name"])
         media_col = _first_existing_col(cols, ["MediaName"])
 
         if not id_col:
-            con.close()
-            continue
+            return
 
-        sel_cols = [id_col]
-        if name_col:
-            sel_cols.append(name_col)
-        if media_col:
-            sel_cols.append(media_col)
+        # fixed column positions (missing columns select a constant), unpacked per row
+        name_sql = f'"{name_col}"' if name_col else "''"
+        media_sql = f'"{media_col}"' if media_col else "''"
+        cur.execute(f'SELECT "{id_col}", {name_sql}, {media_sql} FROM "Data_Engine"')
+        yield from cur
+    finally:
+        con.close()
 
-        sel_sql = ",".join(f'"{c}"' for c in sel_cols)
-        cur.execute(f'SELECT {sel_sql} FROM "Data_Engine"')
-        rows = cur.fetchall()
 
-        for r in rows:
-            eid = int(r[id_col])
-            en = r[name_col] if name_col and name_col in r.keys() else ""
-            mn = r[media_col] if media_col and media_col in r.keys() else ""
-            key = (eid, src.name)
+def iter_engines_all_sources(sources: List[Path]) -> Iterator[Dict[str, Any]]:
+    """Engine rows of every source, one dict at a time (see list_engines_all_sources)."""
+    seen: set[Tuple[int, str]] = set()
+
+    for src, rows in zip(sources, _source_row_iters(_iter_engine_rows, sources)):
+        name = src.name
+        source = str(src)
+
+        for eid, en, mn in rows:
+            eid = int(eid)
+            key = (eid, name)
             if key in seen:
                 continue
             seen.add(key)
-            out.append({"EngineID": eid, "EngineName": en or "", "MediaName": mn or "", "Source": str(src)})
+            yield {"EngineID": eid, "EngineName": en or "", "MediaName": mn or "", "Source": source}
 
-        con.close()
 
-    return out
+def list_engines_all_sources(sources: List[Path]) -> List[Dict[str, Any]]:
+    return list(iter_engines_all_sources(sources))
+
+# (table, id column, display column) for the dropdown lookups
+_LOOKUP_TABLES = (
+    # Data_Car dropdown lookups
+    # EnginePlacement: integer is in column EnginePlacement, display in DisplayName
+    ("List_EnginePlacement", "ID", "EnginePlacement"),
+    # MaterialType: integer is MaterialTypeID, display in Material
+    ("List_MaterialType", "MaterialTypeID", "Material"),
+    # Engine editor dropdown lookups
+    # ConfigID: integer is EngineConfig, display in DisplayName
+    ("List_EngineConfig", "ConfigID", "EngineConfig"),
+    # CylinderID: integer is CylinderID, display in Number
+    # (user said List_Cylinders; in some SLTs it may be List_Cylinder or List_Cylinders)
+    ("List_Cylinders", "CylinderID", "Number"),
+    ("List_Cylinder", "CylinderID", "Number"),
+    # VariableTimingID: integer is VariableTimingID, display in VariableTimingType
+    ("List_VariableTiming", "VariableTimingID", "VariableTimingType"),
+    # Tire compound: integer is TireCompoundID, display in DisplayName
+    ("List_TireCompound", "TireCompoundID", "DisplayName"),
+    # Drive type: integer is ID, display in DriveType (for drivetrain special resolver)
+    ("List_DriveType", "ID", "DriveType"),
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _lookup_sql(table: str, id_col: str, name_col: str) -> str:
+    """
+    (id, display) rows of a lookup table, last row first. Only ids int() would
+    take: numbers (REAL truncated by the CAST) and integer text such as ' 12'
+    or '-3' (space-padded, at most one leading sign). NULL and text like 'abc',
+    '12.7' or '--12' are skipped, not read as 0.
+    """
+    c = f'"{id_col}"'
+    t = f"TRIM(CAST({c} AS TEXT))"
+    digits = f"CASE WHEN SUBSTR({t}, 1, 1) IN ('+', '-') THEN SUBSTR({t}, 2) ELSE {t} END"
+    return (
+        f'SELECT CAST({c} AS INTEGER), COALESCE(CAST("{name_col}" AS TEXT), \'\') FROM "{table}" '
+        f"WHERE typeof({c}) IN ('integer', 'real') "
+        f"OR (typeof({c}) IN ('text', 'blob') AND {digits} <> '' AND {digits} NOT GLOB '*[^0-9]*') "
+        f"ORDER BY rowid DESC"
+    )
+
 
 def build_lookup_cache(main_db: Path, sources: List[Path]) -> Dict[str, Dict[int, str]]:
     """
     Builds lookups from MAIN first; falls back to DLC for display if missing.
     Returned format: cache[TableName][id_int] = display_str
+    One connection per source; each lookup table is a single SELECT.
     """
     cache: Dict[str, Dict[int, str]] = {}
 
-    def load_table(src: Path, table: str, id_col: str, name_col: str):
-        con = _connect(src)
-        cur = con.cursor()
-        if table not in set(_list_tables(cur)):
-            con.close()
-            return
-        cols = _cols(_table_info(cur, table))
-        if id_col not in cols or name_col not in cols:
-            con.close()
-            return
-        cur.execute(f'SELECT "{id_col}" AS _id, "{name_col}" AS _name FROM "{table}"')
-        m = cache.setdefault(table, {})
-        for r in cur.fetchall():
-            try:
-                rid = int(r["_id"])
-            except Exception:
-                continue
-            if rid not in m:
-                m[rid] = "" if r["_name"] is None else str(r["_name"])
-        con.close()
-
     # MAIN first, then DLCs fill missing ids (do not overwrite)
-    primary = [Path(main_db)] + [p for p in sources if Path(p).resolve() != Path(main_db).resolve()]
+    main_real = os.path.realpath(str(main_db))
+    primary = [Path(main_db)] + [Path(p) for p in sources if os.path.realpath(str(p)) != main_real]
 
     for src in primary:
-        # Data_Car dropdown lookups
-        # EnginePlacement: integer is in column EnginePlacement, display in DisplayName
-        load_table(src, "List_EnginePlacement", "ID", "EnginePlacement")
-        
-        # MaterialType: integer is MaterialTypeID, display in Material
-        load_table(src, "List_MaterialType", "MaterialTypeID", "Material")
-
-        # Engine editor dropdown lookups
-        # ConfigID: integer is EngineConfig, display in DisplayName
-        load_table(src, "List_EngineConfig", "ConfigID", "EngineConfig")
-
-        # CylinderID: integer is CylinderID, display in Number
-        # (user said List_Cylinders; in some SLTs it may be List_Cylinder or List_Cylinders)
-        load_table(src, "List_Cylinders", "CylinderID", "Number")
-        load_table(src, "List_Cylinder", "CylinderID", "Number")
-
-        # VariableTimingID: integer is VariableTimingID, display in VariableTimingType
-        load_table(src, "List_VariableTiming", "VariableTimingID", "VariableTimingType")
-
-        # Tire compound: integer is TireCompoundID, display in DisplayName
-        load_table(src, "List_TireCompound", "TireCompoundID", "DisplayName")
-
-        # Drive type: integer is ID, display in DriveType (for drivetrain special resolver)
-        load_table(src, "List_DriveType", "ID", "DriveType")
+        con = _connect(src, tuned=True, readonly=True)
+        try:
+            cur = con.cursor()
+            tables = _tables_set(cur)
+            for table, id_col, name_col in _LOOKUP_TABLES:
+                if table not in tables:
+                    continue
+                cols = _table_cols(cur, table)
+                if id_col not in cols or name_col not in cols:
+                    continue
+                # DESC so the first row of a duplicated id wins in dict()
+                cur.execute(_lookup_sql(table, id_col, name_col))
+                found = dict(cur.fetchall())
+                # earlier sources win: lay what is already cached over this source's rows, in place
+                prev = cache.get(table)
+                if prev:
+                    found.update(prev)
+                cache[table] = found
+        finally:
+            con.close()
 
     return cache
 
 
-def get_data_car(main_db: Path, car_id: int) -> Optional[Dict[str, Any]]:
-    con = _connect(main_db)
-    cur = con.cursor()
-    if "Data_Car" not in set(_list_tables(cur)):
-        con.close()
+def _get_data_car(cur: sqlite3.Cursor, car_id: int) -> Optional[Dict[str, Any]]:
+    if "Data_Car" not in _tables_set(cur):
         return None
-    cols = _cols(_table_info(cur, "Data_Car"))
+    cols = _table_colset(cur, "Data_Car")
     pk = _first_existing_col(cols, ["CarID", "CarId", "Id"])
     if not pk:
-        con.close()
         return None
-    cur.execute(f'SELECT * FROM "Data_Car" WHERE "{pk}"=?', (car_id,))
+    cur.execute(_select_by_key_sql("Data_Car", f'"{pk}"'), (car_id,))
     r = cur.fetchone()
-    con.close()
     return dict(r) if r else None
 
 
-def update_data_car(main_db: Path, car_id: int, updates: Dict[str, Any]) -> None:
-    con = _connect(main_db)
-    cur = con.cursor()
-    cols = _cols(_table_info(cur, "Data_Car"))
-    pk = _first_existing_col(cols, ["CarID", "CarId", "Id"])
+def get_data_car(main_db: Path, car_id: int) -> Optional[Dict[str, Any]]:
+    with _shared_cursor(main_db) as cur:
+        return _get_data_car(cur, car_id)
+
+
+# Editable Data_* tables and their key column candidates
+_UPDATE_KEYS = {
+    "Data_Car": ["CarID", "CarId", "Id"],
+    "Data_CarBody": ["Id"],
+    "Data_Engine": ["EngineID", "EngineId", "Id"],
+}
+
+
+def _changed_only(cur: sqlite3.Cursor, table: str, key_sql: str, key: int, upd: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Drops the columns of upd whose value already matches the stored row, so
+    a save that changes nothing never takes the write lock. A missing row
+    yields {} (the UPDATE would not touch anything either).
+    """
+    cur.execute(_select_cols_by_key_sql(table, tuple(upd), key_sql), (key,))
+    r = cur.fetchone()
+    if r is None:
+        return {}
+    return {c: v for (c, v), old in zip(upd.items(), r) if v != old}
+
+
+def _update_row(cur: sqlite3.Cursor, table: str, key: int, updates: Dict[str, Any]) -> None:
+    cols = _table_cols(cur, table)
+    pk = _first_existing_col(_table_colset(cur, table), _UPDATE_KEYS[table])
     if not pk:
-        con.close()
-        raise ValueError("Data_Car has no CarID/Id column.")
-    # only update existing columns
-    upd = {k: v for k, v in updates.items() if k in cols and k != pk}
+        raise ValueError(f"{table} has no {'/'.join(_UPDATE_KEYS[table])} column.")
+    # only update existing columns, in table order: the same column set always
+    # maps to the same cached SQL text whatever order the caller's dict has
+    upd = {c: updates[c] for c in cols if c in updates and c != pk}
+    if upd:
+        upd = _changed_only(cur, table, f'"{pk}"', key, upd)
     if not upd:
-        con.close()
         return
-    sets = ", ".join([f'"{k}"=?' for k in upd.keys()])
-    cur.execute(f'UPDATE "Data_Car" SET {sets} WHERE "{pk}"=?', (*upd.values(), car_id))
-    con.commit()
-    con.close()
+    cur.execute(_update_sql(table, tuple(upd), f'"{pk}"'), (*upd.values(), key))
 
 
-def get_data_carbody_for_car(main_db: Path, car_id: int) -> Optional[Dict[str, Any]]:
+def apply_updates(main_db: Path, edits: List[Tuple[str, int, Dict[str, Any]]]) -> None:
     """
-    FM4 common scheme: Data_CarBody.Id lives in car base-block (car_id*1000..+999).
-    We pick the first row in that block.
+    Writes several (table, key, updates) edits to MAIN in one transaction:
+    either all of them land or none do.
     """
-    con = _connect(main_db)
-    cur = con.cursor()
-    if "Data_CarBody" not in set(_list_tables(cur)):
-        con.close()
+    with _shared_cursor(main_db) as cur:
+        for table, key, updates in edits:
+            _update_row(cur, table, key, updates)
+        cur.connection.commit()
+
+
+def update_data_car(main_db: Path, car_id: int, updates: Dict[str, Any]) -> None:
+    apply_updates(main_db, [("Data_Car", car_id, updates)])
+
+
+def _get_data_carbody_for_car(cur: sqlite3.Cursor, car_id: int) -> Optional[Dict[str, Any]]:
+    if "Data_CarBody" not in _tables_set(cur):
         return None
-    cols = _cols(_table_info(cur, "Data_CarBody"))
+    cols = _table_cols(cur, "Data_CarBody")
     if "Id" not in cols:
-        con.close()
         return None
     base = car_id * 1000
     cur.execute('SELECT * FROM "Data_CarBody" WHERE "Id">=? AND "Id"<? ORDER BY "Id" LIMIT 1', (base, base + 1000))
     r = cur.fetchone()
-    con.close()
     return dict(r) if r else None
 
 
+def get_data_carbody_for_car(main_db: Path, car_id: int) -> Optional[Dict[str, Any]]:
+    """
+    FM4 common scheme: Data_CarBody.Id lives in car base-block (car_id*1000..+999).
+    We pick the first row in that block.
+    """
+    with _shared_cursor(main_db) as cur:
+        return _get_data_carbody_for_car(cur, car_id)
+
+
 def update_data_carbody(main_db: Path, carbody_id: int, updates: Dict[str, Any]) -> None:
-    con = _connect(main_db)
-    cur = con.cursor()
-    cols = _cols(_table_info(cur, "Data_CarBody"))
-    if "Id" not in cols:
-        con.close()
-        raise ValueError("Data_CarBody has no Id.")
-    upd = {k: v for k, v in updates.items() if k in cols and k != "Id"}
-    if not upd:
-        con.close()
-        return
-    sets = ", ".join([f'"{k}"=?' for k in upd.keys()])
-    cur.execute(f'UPDATE "Data_CarBody" SET {sets} WHERE "Id"=?', (*upd.values(), carbody_id))
-    con.commit()
-    con.close()
+    apply_updates(main_db, [("Data_CarBody", carbody_id, updates)])
 
 
 def get_data_engine(main_db: Path, engine_id: int) -> Optional[Dict[str, Any]]:
-    con = _connect(main_db)
-    cur = con.cursor()
-    if "Data_Engine" not in set(_list_tables(cur)):
-        con.close()
-        return None
-    cols = _cols(_table_info(cur, "Data_Engine"))
-    pk = _first_existing_col(cols, ["EngineID", "EngineId", "Id"])
-    if not pk:
-        con.close()
-        return None
-    cur.execute(f'SELECT * FROM "Data_Engine" WHERE "{pk}"=?', (engine_id,))
-    r = cur.fetchone()
-    con.close()
-    return dict(r) if r else None
+    with _shared_cursor(main_db) as cur:
+        if "Data_Engine" not in _tables_set(cur):
+            return None
+        cols = _table_colset(cur, "Data_Engine")
+        pk = _first_existing_col(cols, ["EngineID", "EngineId", "Id"])
+        if not pk:
+            return None
+        cur.execute(_select_by_key_sql("Data_Engine", f'"{pk}"'), (engine_id,))
+        r = cur.fetchone()
+        return dict(r) if r else None
 
 
 def update_data_engine(main_db: Path, engine_id: int, updates: Dict[str, Any]) -> None:
-    con = _connect(main_db)
-    cur = con.cursor()
-    cols = _cols(_table_info(cur, "Data_Engine"))
-    pk = _first_existing_col(cols, ["EngineID", "EngineId", "Id"])
-    if not pk:
-        con.close()
-        raise ValueError("Data_Engine has no EngineID/Id column.")
-    upd = {k: v for k, v in updates.items() if k in cols and k != pk}
-    if not upd:
-        con.close()
-        return
-    sets = ", ".join([f'"{k}"=?' for k in upd.keys()])
-    cur.execute(f'UPDATE "Data_Engine" SET {sets} WHERE "{pk}"=?', (*upd.values(), engine_id))
-    con.commit()
-    con.close()
+    apply_updates(main_db, [("Data_Engine", engine_id, updates)])
 
 
-def engine_exists_in_main(main_db: Path, engine_id: int) -> bool:
-    con = _connect(main_db)
-    cur = con.cursor()
-    if "Data_Engine" not in set(_list_tables(cur)):
-        con.close()
+def _engine_exists_in_main(cur: sqlite3.Cursor, engine_id: int) -> bool:
+    if "Data_Engine" not in _tables_set(cur):
         return False
-    cols = _cols(_table_info(cur, "Data_Engine"))
+    cols = _table_colset(cur, "Data_Engine")
     pk = _first_existing_col(cols, ["EngineID", "EngineId", "Id"])
     if not pk:
-        con.close()
         return False
     cur.execute(f'SELECT 1 FROM "Data_Engine" WHERE "{pk}"=? LIMIT 1', (engine_id,))
     ok = cur.fetchone() is not None
-    con.close()
     return ok
 
 
-def resolve_engine_name(sources: List[Path], engine_id: int) -> str:
-    for src in sources:
-        con = _connect(src)
+def engine_exists_in_main(main_db: Path, engine_id: int) -> bool:
+    with _shared_cursor(main_db) as cur:
+        return _engine_exists_in_main(cur, engine_id)
+
+
+def _engine_name_queries(sources: List[Path]) -> List[Tuple[sqlite3.Connection, str]]:
+    """
+    (connection, SQL) per batch of attached sources for resolve_engine_name,
+    built once per source set; caller holds _shared_lock. Each SQL takes the
+    EngineID as ?1 and returns the name from the first source that has one.
+    """
+    global _engine_name_key, _engine_name_batches
+    key = tuple(os.path.realpath(str(s)) for s in sources)
+    if key == _engine_name_key:
+        return _engine_name_batches
+
+    _close_engine_name_batches()
+    batches = []
+    probe = sqlite3.connect("file::memory:", uri=True)
+    step = _attach_limit(probe)
+    probe.close()
+    for start in range(0, len(key), step):
+        con = sqlite3.connect("file::memory:", uri=True, check_same_thread=False)
         cur = con.cursor()
-        if "Data_Engine" not in set(_list_tables(cur)):
-            con.close()
-            continue
-        cols = _cols(_table_info(cur, "Data_Engine"))
-        pk = _first_existing_col(cols, ["EngineID", "EngineId", "Id"])
-        name_col = _first_existing_col(cols, ["EngineName", "Name"])
-        if not pk or not name_col:
+        parts = []
+        for prio, s in enumerate(_attach_readonly(cur, [Path(k) for k in key[start : start + step]])):
+            cur.execute(f"PRAGMA {s}.table_info('Data_Engine')")
+            cols = {r[1] for r in cur.fetchall()}
+            pk = _first_existing_col(cols, ["EngineID", "EngineId", "Id"])
+            name_col = _first_existing_col(cols, ["EngineName", "Name"])
+            if pk and name_col:
+                parts.append(
+                    f'SELECT "{name_col}" AS n, {prio} AS p FROM {s}."Data_Engine" '
+                    f'WHERE "{pk}"=?1 AND "{name_col}" IS NOT NULL'
+                )
+        cur.close()
+        if parts:
+            batches.append((con, f"SELECT n FROM ({' UNION ALL '.join(parts)}) ORDER BY p LIMIT 1"))
+        else:
             con.close()
-            continue
-        cur.execute(f'SELECT "{name_col}" AS n FROM "Data_Engine" WHERE "{pk}"=?', (engine_id,))
-        r = cur.fetchone()
+    _engine_name_key, _engine_name_batches = key, batches
+    return batches
+
+
+def _close_engine_name_batches() -> None:
+    global _engine_name_key, _engine_name_batches
+    for con, _sql in _engine_name_batches:
         con.close()
-        if r and r["n"] is not None:
-            return str(r["n"])
+    _engine_name_key, _engine_name_batches = None, []
+
+
+def resolve_engine_name(sources: List[Path], engine_id: int) -> str:
+    """EngineName from the first source that has the engine; one query per batch of attached sources."""
+    with _shared_lock:
+        for con, sql in _engine_name_queries(sources):
+            r = con.execute(sql, (engine_id,)).fetchone()
+            if r:
+                return str(r[0])
     return ""
 
+
+@functools.lru_cache(maxsize=32)
+def _stock_drivetrain_sql(id_col: Optional[str], stock_row: bool, data_car: bool) -> Optional[str]:
+    """
+    One COALESCE over the get_stock_drivetrain_id_for_car fallbacks that
+    apply, in priority order; takes the CarID as ?1. None when none apply.
+    """
+    parts = []
+    if id_col:
+        if stock_row:
+            parts.append(
+                f'(SELECT "{id_col}" FROM "List_UpgradeDrivetrain" '
+                f'WHERE "Ordinal"=?1 AND "IsStock"=1 AND "Level"=0 LIMIT 1)'
+            )
+        parts.append(f'(SELECT "{id_col}" FROM "List_UpgradeDrivetrain" WHERE "Ordinal"=?1 LIMIT 1)')
+    if data_car:
+        parts.append('(SELECT "PowertrainID" FROM "Data_Car" WHERE "Id"=?1 LIMIT 1)')
+    if not parts:
+        return None
+    # COALESCE wants at least two arguments, hence the trailing NULL
+    return f"SELECT COALESCE({', '.join(parts)}, NULL)"
+
+
 def get_stock_drivetrain_id_for_car(main_db: Path, car_id: int) -> Optional[int]:
     """
     Tries to resolve the drivetrain/powertrain ID for a car from MAIN.
@@ -946,157 +1351,156 @@ def get_stock_drivetrain_id_for_car(main_db: Path, car_id: int) -> Optional[int]
     2) Any row in List_UpgradeDrivetrain for this car
     3) Data_Car.PowertrainID (fallback)
     """
-    con = _connect(main_db)
-    cur = con.cursor()
-    tables = set(_list_tables(cur))
-
-    # 1/2) Prefer List_UpgradeDrivetrain
-    if "List_UpgradeDrivetrain" in tables:
-        cols = _cols(_table_info(cur, "List_UpgradeDrivetrain"))
-        if "Ordinal" in cols:
-            id_col = _first_existing_col(cols, ["PowertrainID", "PowertrainId", "DrivetrainID", "DrivetrainId"])
-            if id_col:
-                has_isstock = "IsStock" in cols
-                has_level = "Level" in cols
-
-                if has_isstock and has_level:
-                    cur.execute(
-                        f'SELECT "{id_col}" AS v FROM "List_UpgradeDrivetrain" '
-                        f'WHERE "Ordinal"=? AND "IsStock"=1 AND "Level"=0 LIMIT 1',
-                        (car_id,),
-                    )
-                    r = cur.fetchone()
-                    if r and r["v"] is not None:
-                        con.close()
-                        return int(r["v"])
-
-                # fallback: first row for this car
-                cur.execute(
-                    f'SELECT "{id_col}" AS v FROM "List_UpgradeDrivetrain" WHERE "Ordinal"=? LIMIT 1',
-                    (car_id,),
-                )
-                r = cur.fetchone()
-                if r and r["v"] is not None:
-                    con.close()
-                    return int(r["v"])
-
-    # 3) Fallback to Data_Car.PowertrainID if exists
-    if "Data_Car" in tables:
-        cols = _cols(_table_info(cur, "Data_Car"))
-        if "Id" in cols and "PowertrainID" in cols:
-            cur.execute('SELECT "PowertrainID" AS v FROM "Data_Car" WHERE "Id"=? LIMIT 1', (car_id,))
-            r = cur.fetchone()
-            if r and r["v"] is not None:
-                con.close()
-                return int(r["v"])
-
-    con.close()
-    return None
-
-
-def get_stock_engine_for_car(main_db: Path, car_id: int) -> Optional[Dict[str, Any]]:
-    con = _connect(main_db)
-    cur = con.cursor()
-    if "List_UpgradeEngine" not in set(_list_tables(cur)):
-        con.close()
+    with _shared_cursor(main_db) as cur:
+        tables = _tables_set(cur)
+
+        # 1/2) Prefer List_UpgradeDrivetrain
+        id_col = None
+        stock_row = False
+        if "List_UpgradeDrivetrain" in tables:
+            cols = _table_colset(cur, "List_UpgradeDrivetrain")
+            if "Ordinal" in cols:
+                id_col = _first_existing_col(cols, ["PowertrainID", "PowertrainId", "DrivetrainID", "DrivetrainId"])
+                stock_row = "IsStock" in cols and "Level" in cols
+
+        # 3) Fallback to Data_Car.PowertrainID if exists
+        data_car = "Data_Car" in tables and {"Id", "PowertrainID"} <= _table_colset(cur, "Data_Car")
+
+        sql = _stock_drivetrain_sql(id_col, stock_row, data_car)
+        if not sql:
+            return None
+        cur.execute(sql, (car_id,))
+        v = cur.fetchone()[0]
+        return int(v) if v is not None else None
+
+
+@functools.lru_cache(maxsize=32)
+def _stock_engine_sql(stock_only: bool, name_join: Optional[Tuple[str, str, str]]) -> str:
+    """
+    Stock List_UpgradeEngine row for Ordinal=?. name_join (engine column,
+    Data_Engine key, name column) adds the engine's name from MAIN as
+    "__engine_name__" through a LEFT JOIN.
+    """
+    select, join = "u.*", ""
+    if name_join:
+        engine_col, pk, name_col = name_join
+        select += f', e."{name_col}" AS "__engine_name__"'
+        join = f' LEFT JOIN "Data_Engine" e ON e."{pk}"=u."{engine_col}"'
+    where = 'u."Ordinal"=?'
+    if stock_only:
+        where += ' AND u."IsStock"=1 AND u."Level"=0'
+    return f'SELECT {select} FROM "List_UpgradeEngine" u{join} WHERE {where} LIMIT 1'
+
+
+def _get_stock_engine_for_car(cur: sqlite3.Cursor, car_id: int, with_name: bool = False) -> Optional[Dict[str, Any]]:
+    if "List_UpgradeEngine" not in _tables_set(cur):
         return None
-    cols = _cols(_table_info(cur, "List_UpgradeEngine"))
+    cols = _table_colset(cur, "List_UpgradeEngine")
     if "Ordinal" not in cols:
-        con.close()
         return None
-    level_col = "Level" if "Level" in cols else None
-    isstock_col = "IsStock" if "IsStock" in cols else None
     engine_col = _first_existing_col(cols, ["EngineID", "EngineId", "Engine"])
     if not engine_col:
-        con.close()
         return None
 
-    # Prefer IsStock=1 & Level=0 when present
-    if level_col and isstock_col:
-        cur.execute(f'SELECT * FROM "List_UpgradeEngine" WHERE "Ordinal"=? AND "{isstock_col}"=1 AND "{level_col}"=0 LIMIT 1', (car_id,))
-        r = cur.fetchone()
-        con.close()
-        return dict(r) if r else None
-
-    # fallback first row
-    cur.execute(f'SELECT * FROM "List_UpgradeEngine" WHERE "Ordinal"=? LIMIT 1', (car_id,))
+    name_join = None
+    if with_name and "Data_Engine" in _tables_set(cur):
+        eng_cols = _table_colset(cur, "Data_Engine")
+        pk = _first_existing_col(eng_cols, ["EngineID", "EngineId", "Id"])
+        name_col = _first_existing_col(eng_cols, ["EngineName", "Name"])
+        if pk and name_col:
+            name_join = (engine_col, pk, name_col)
+
+    # Prefer IsStock=1 & Level=0 when present, otherwise the first row
+    stock_only = "Level" in cols and "IsStock" in cols
+    cur.execute(_stock_engine_sql(stock_only, name_join), (car_id,))
     r = cur.fetchone()
-    con.close()
-    return dict(r) if r else None
-
-
-def set_stock_engine_for_car(main_db: Path, car_id: int, engine_id: int) -> None:
-    """
-    Ensures exactly one stock engine row exists for the car:
-    - removes any rows for Ordinal=car_id where IsStock=1 and Level=0 (if columns exist)
-    - inserts or updates a single row with EngineID=engine_id, IsStock=1, Level=0
-    """
-    con = _connect(main_db)
-    cur = con.cursor()
-    if "List_UpgradeEngine" not in set(_list_tables(cur)):
-        con.close()
-        raise ValueError("List_UpgradeEngine does not exist in MAIN.")
+    if not r:
+        return None
+    row = dict(r)
+    if with_name:
+        row.setdefault("__engine_name__", None)
+    return row
 
-    cols = _cols(_table_info(cur, "List_UpgradeEngine"))
-    if "Ordinal" not in cols:
-        con.close()
-        raise ValueError("List_UpgradeEngine has no Ordinal column.")
 
-    level_col = "Level" if "Level" in cols else None
-    isstock_col = "IsStock" if "IsStock" in cols else None
-    engine_col = _first_existing_col(cols, ["EngineID", "EngineId", "Engine"])
-    if not engine_col:
-        con.close()
-        raise ValueError("List_UpgradeEngine has no EngineID column.")
+def get_stock_engine_for_car(main_db: Path, car_id: int) -> Optional[Dict[str, Any]]:
+    with _shared_cursor(main_db) as cur:
+        return _get_stock_engine_for_car(cur, car_id)
 
-    if level_col and isstock_col:
-        cur.execute(
-            f'DELETE FROM "List_UpgradeEngine" WHERE "Ordinal"=? AND "{isstock_col}"=1 AND "{level_col}"=0',
-            (car_id,),
-        )
 
-        cur.execute(f'SELECT * FROM "List_UpgradeEngine" WHERE "Ordinal"=? LIMIT 1', (car_id,))
-        base = cur.fetchone()
+def get_stock_engine_with_name(main_db: Path, car_id: int) -> Optional[Dict[str, Any]]:
+    """
+    get_stock_engine_for_car plus "__engine_name__", the engine's name from
+    MAIN's Data_Engine, read in the same query. The name is None when MAIN
+    does not have it (e.g. a DLC engine); resolve_engine_name covers that.
+    """
+    with _shared_cursor(main_db) as cur:
+        return _get_stock_engine_for_car(cur, car_id, with_name=True)
 
-        if base:
-            row = dict(base)
-            row["Ordinal"] = car_id
-            row[engine_col] = engine_id
-            row[isstock_col] = 1
-            row[level_col] = 0
 
+def set_stock_engine_for_car(main_db: Path, car_id: int, engine_id: int) -> None:
+    """
+    Ensures exactly one stock engine row exists for the car:
+    - repoints the existing IsStock=1, Level=0 row to engine_id (if columns exist)
+    - otherwise (none, or duplicates removed) inserts a single such row
+    """
+    with _shared_cursor(main_db) as cur:
+        if "List_UpgradeEngine" not in _tables_set(cur):
+            raise ValueError("List_UpgradeEngine does not exist in MAIN.")
+
+        cols = _table_cols(cur, "List_UpgradeEngine")
+        if "Ordinal" not in cols:
+            raise ValueError("List_UpgradeEngine has no Ordinal column.")
+
+        level_col = "Level" if "Level" in cols else None
+        isstock_col = "IsStock" if "IsStock" in cols else None
+        engine_col = _first_existing_col(_table_colset(cur, "List_UpgradeEngine"), ["EngineID", "EngineId", "Engine"])
+        if not engine_col:
+            raise ValueError("List_UpgradeEngine has no EngineID column.")
+
+        if level_col and isstock_col:
+            stock_where = f'"Ordinal"=? AND "{isstock_col}"=1 AND "{level_col}"=0'
+
+            # usual case: exactly one stock row, repointed in place (one statement)
+            cur.execute(f'UPDATE "List_UpgradeEngine" SET "{engine_col}"=? WHERE {stock_where}', (engine_id, car_id))
+            if cur.rowcount == 1:
+                cur.connection.commit()
+                return
+            if cur.rowcount > 1:
+                # duplicates: collapse to a single stock row
+                cur.execute(f'DELETE FROM "List_UpgradeEngine" WHERE {stock_where}', (car_id,))
+
+            # no stock row: copy the car's first upgrade row as one INSERT ... SELECT.
             # Do NOT insert primary key columns (they are UNIQUE and will collide)
-            cols_ins = [c for c in cols if c in row and c not in ("Id", "ID")]
-            vals_ins = [row[c] for c in cols_ins]
+            cols_ins = tuple(c for c in cols if c not in ("Id", "ID"))
+            fixed = {engine_col: "?", isstock_col: "1", level_col: "0"}
+            sel_sql = ",".join(fixed.get(c, f'"{c}"') for c in cols_ins)
+            cur.execute(
+                f'INSERT INTO "List_UpgradeEngine" ({_qcols(cols_ins)}) '
+                f'SELECT {sel_sql} FROM "List_UpgradeEngine" WHERE "Ordinal"=? LIMIT 1',
+                (engine_id, car_id),
+            )
+
+            if cur.rowcount == 0:
+                cols_ins = ["Ordinal", engine_col]
+                vals_ins = [car_id, engine_id]
+                cols_ins.append(isstock_col); vals_ins.append(1)
+                cols_ins.append(level_col); vals_ins.append(0)
+
+                cur.execute(_insert_sql("List_UpgradeEngine", tuple(cols_ins)), vals_ins)
+
+            cur.connection.commit()
+            return
 
-            cols_sql = ",".join(f'"{c}"' for c in cols_ins)
-            placeholders = ",".join(["?"] * len(cols_ins))
-            cur.execute(f'INSERT INTO "List_UpgradeEngine" ({cols_sql}) VALUES ({placeholders})', vals_ins)
+        # fallback: update first row
+        cur.execute(f'SELECT rowid AS rid FROM "List_UpgradeEngine" WHERE "Ordinal"=? LIMIT 1', (car_id,))
+        r = cur.fetchone()
+        if r:
+            rid = int(r["rid"])
+            cur.execute(_update_sql("List_UpgradeEngine", (engine_col,), "rowid"), (engine_id, rid))
         else:
-            cols_ins = ["Ordinal", engine_col]
-            vals_ins = [car_id, engine_id]
-            cols_ins.append(isstock_col); vals_ins.append(1)
-            cols_ins.append(level_col); vals_ins.append(0)
-
-            cols_sql = ",".join(f'"{c}"' for c in cols_ins)
-            placeholders = ",".join(["?"] * len(cols_ins))
-            cur.execute(f'INSERT INTO "List_UpgradeEngine" ({cols_sql}) VALUES ({placeholders})', vals_ins)
-
-        con.commit()
-        con.close()
-        return
-
-    # fallback: update first row
-    cur.execute(f'SELECT rowid AS rid FROM "List_UpgradeEngine" WHERE "Ordinal"=? LIMIT 1', (car_id,))
-    r = cur.fetchone()
-    if r:
-        rid = int(r["rid"])
-        cur.execute(f'UPDATE "List_UpgradeEngine" SET "{engine_col}"=? WHERE rowid=?', (engine_id, rid))
-    else:
-        cur.execute(f'INSERT INTO "List_UpgradeEngine" ("Ordinal","{engine_col}") VALUES (?,?)', (car_id, engine_id))
+            cur.execute(_insert_sql("List_UpgradeEngine", ("Ordinal", engine_col)), (car_id, engine_id))
 
-    con.commit()
-    con.close()
+        cur.connection.commit()
 
 
 
@@ -1106,21 +1510,17 @@ def list_car_related_tables(main_db: Path) -> List[str]:
     - All List_Upgrade* tables (even if they don't use Ordinal)
     - Any other table that has Ordinal (car-scoped)
     """
-    con = _connect(main_db)
-    cur = con.cursor()
-    tables = _list_tables(cur)
-
     out = []
-    for t in tables:
-        tl = t.lower()
-        if tl.startswith("list_upgrade"):
-            out.append(t)
-            continue
-        cols = _cols(_table_info(cur, t))
-        if "Ordinal" in cols:
-            out.append(t)
-
-    con.close()
+    with _shared_cursor(main_db) as cur:
+        _prime_schema(cur)  # every table's columns in one query; the loop below reads the memo
+        for t in _list_tables(cur):
+            tl = t.lower()
+            if tl.startswith("list_upgrade"):
+                out.append(t)
+                continue
+            cols = _table_cols(cur, t)
+            if "Ordinal" in cols:
+                out.append(t)
 
     # upgrades first
     out = sorted(set(out), key=lambda x: (0 if x.lower().startswith("list_upgrade") else 1, x.lower()))
@@ -1134,10 +1534,10 @@ def detect_scope_for_table(cur: sqlite3.Cursor, table: str) -> Tuple[Optional[st
     Returns (scope_kind, scope_col)
       scope_kind: "car" | "engine" | "carbody" | None
     """
-    if table not in set(_list_tables(cur)):
+    if table not in _tables_set(cur):
         return (None, None)
 
-    cols = _cols(_table_info(cur, table))
+    cols = _table_cols(cur, table)
 
     # Most common
     if "Ordinal" in cols:
@@ -1173,197 +1573,257 @@ def list_rows_scoped(
     engine_id: Optional[int],
     carbody_id: Optional[int],
     drivetrain_id: Optional[int],
-) -> Tuple[List[Dict[str, Any]], Optional[str], Optional[str], Optional[int]]:
+) -> Tuple[List[str], List[Tuple[Any, ...]], Optional[str], Optional[str], Optional[int]]:
     """
     Loads rows for a table using the appropriate scope column.
-    Returns: (rows, scope_kind, scope_col, scope_value)
+    Returns: (cols, rows, scope_kind, scope_col, scope_value)
+    rows are plain tuples in cols order; cols[0] is "__rowid__".
     """
-    con = _connect(main_db)
-    cur = con.cursor()
+    with _shared_cursor(main_db) as cur:
+
+        if table not in _tables_set(cur):
+            return ([], [], None, None, None)
+
+        scope_kind, scope_col = detect_scope_for_table(cur, table)
+        if not scope_kind or not scope_col:
+            return ([], [], None, None, None)
+
+        if scope_kind == "car":
+            scope_val = car_id
+        elif scope_kind == "engine":
+            if engine_id is None:
+                return ([], [], "engine", scope_col, None)
+            scope_val = int(engine_id)
+        elif scope_kind == "carbody":
+            if carbody_id is None:
+                return ([], [], "carbody", scope_col, None)
+            scope_val = int(carbody_id)
+        elif scope_kind == "drivetrain":
+            if drivetrain_id is None:
+                return ([], [], "drivetrain", scope_col, None)
+            scope_val = int(drivetrain_id)
+        else:
+            return ([], [], None, None, None)
 
-    if table not in set(_list_tables(cur)):
-        con.close()
-        return ([], None, None, None)
 
-    scope_kind, scope_col = detect_scope_for_table(cur, table)
-    if not scope_kind or not scope_col:
-        con.close()
-        return ([], None, None, None)
+        cur.row_factory = None  # plain tuples: no per-row dict for a list the UI reads 3 columns of
+        cur.execute(
+            f'SELECT rowid AS "__rowid__", * FROM "{table}" WHERE "{scope_col}"=? ORDER BY rowid',
+            (scope_val,),
+        )
+        rows = cur.fetchall()
+        return ([d[0] for d in cur.description], rows, scope_kind, scope_col, scope_val)
 
-    if scope_kind == "car":
-        scope_val = car_id
-    elif scope_kind == "engine":
-        if engine_id is None:
-            con.close()
-            return ([], "engine", scope_col, None)
-        scope_val = int(engine_id)
-    elif scope_kind == "carbody":
-        if carbody_id is None:
-            con.close()
-            return ([], "carbody", scope_col, None)
-        scope_val = int(carbody_id)
-    elif scope_kind == "drivetrain":
-        if drivetrain_id is None:
-            con.close()
-            return ([], "drivetrain", scope_col, None)
-        scope_val = int(drivetrain_id)
-    else:
-        con.close()
-        return ([], None, None, None)
 
+def list_rows_by_ordinal(main_db: Path, table: str, car_id: int) -> List[Dict[str, Any]]:
+    with _shared_cursor(main_db) as cur:
+        if table not in _tables_set(cur):
+            return []
+        cols = _table_cols(cur, table)
+        if "Ordinal" not in cols:
+            return []
+        cur.row_factory = None  # tuples zipped with the names once: cheaper than dict(Row) per row
+        cur.execute(f'SELECT rowid AS "__rowid__", * FROM "{table}" WHERE "Ordinal"=? ORDER BY rowid', (car_id,))
+        names = [d[0] for d in cur.description]
+        return [dict(zip(names, r)) for r in cur.fetchall()]
 
-    cur.execute(
-        f'SELECT rowid AS "__rowid__", * FROM "{table}" WHERE "{scope_col}"=? ORDER BY rowid',
-        (scope_val,),
-    )
-    rows = [dict(r) for r in cur.fetchall()]
-    con.close()
-    return (rows, scope_kind, scope_col, scope_val)
 
+def get_row_by_rowid(main_db: Path, table: str, rowid: int) -> Optional[Dict[str, Any]]:
+    with _shared_cursor(main_db) as cur:
+        if table not in _tables_set(cur):
+            return None
+        cur.execute(f'SELECT rowid AS "__rowid__", * FROM "{table}" WHERE rowid=?', (rowid,))
+        r = cur.fetchone()
+        return dict(r) if r else None
 
-def list_rows_by_ordinal(main_db: Path, table: str, car_id: int) -> List[Dict[str, Any]]:
-    con = _connect(main_db)
-    cur = con.cursor()
-    if table not in set(_list_tables(cur)):
-        con.close()
-        return []
-    cols = _cols(_table_info(cur, table))
-    if "Ordinal" not in cols:
-        con.close()
-        return []
-    cur.execute(f'SELECT rowid AS "__rowid__", * FROM "{table}" WHERE "Ordinal"=? ORDER BY rowid', (car_id,))
-    rows = [dict(r) for r in cur.fetchall()]
-    con.close()
-    return rows
 
+_SQLITE_MIN_MAX_PARAMS = 999  # SQLITE_MAX_VARIABLE_NUMBER before 3.32, the lowest a build may have
+_ROWID_CHUNK = 500  # bound parameters per IN (..), well under that floor
 
-def get_row_by_rowid(main_db: Path, table: str, rowid: int) -> Optional[Dict[str, Any]]:
-    con = _connect(main_db)
-    cur = con.cursor()
-    if table not in set(_list_tables(cur)):
-        con.close()
-        return None
-    cur.execute(f'SELECT rowid AS "__rowid__", * FROM "{table}" WHERE rowid=?', (rowid,))
-    r = cur.fetchone()
-    con.close()
-    return dict(r) if r else None
 
+def get_rows_by_rowid(main_db: Path, table: str, rowids: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+    """
+    Bulk get_row_by_rowid: {rowid: row} for the rowids that exist, one
+    SELECT .. WHERE rowid IN (..) per chunk of _ROWID_CHUNK ids.
+    """
+    ids = list(dict.fromkeys(int(r) for r in rowids))
+    out: Dict[int, Dict[str, Any]] = {}
+    if not ids:
+        return out
+    with _shared_cursor(main_db) as cur:
+        if table not in _tables_set(cur):
+            return out
+        cur.row_factory = None  # zip with the names once, as in list_rows_by_ordinal
+        for i in range(0, len(ids), _ROWID_CHUNK):
+            chunk = ids[i : i + _ROWID_CHUNK]
+            cur.execute(
+                f'SELECT rowid AS "__rowid__", * FROM "{table}" WHERE rowid IN ({_qplaceholders(len(chunk))})',
+                chunk,
+            )
+            names = [d[0] for d in cur.description]
+            for r in cur:
+                out[r[0]] = dict(zip(names, r))
+    return out
 
-def update_row_by_rowid(main_db: Path, table: str, rowid: int, updates: Dict[str, Any]) -> None:
-    con = _connect(main_db)
-    cur = con.cursor()
-    if table not in set(_list_tables(cur)):
-        con.close()
-        raise ValueError(f"Table not found: {table}")
 
-    cols = _cols(_table_info(cur, table))
-    upd = {k: v for k, v in updates.items() if k in cols}
-    if not upd:
-        con.close()
-        return
+def update_row_by_rowid(main_db: Path, table: str, rowid: int, updates: Dict[str, Any]) -> None:
+    with _shared_cursor(main_db) as cur:
+        if table not in _tables_set(cur):
+            raise ValueError(f"Table not found: {table}")
+
+        upd = {c: updates[c] for c in _table_cols(cur, table) if c in updates}  # table order, see _update_row
+        if upd:
+            upd = _changed_only(cur, table, "rowid", rowid, upd)
+        if not upd:
+            return
 
-    sets = ", ".join([f'"{k}"=?' for k in upd.keys()])
-    cur.execute(f'UPDATE "{table}" SET {sets} WHERE rowid=?', (*upd.values(), rowid))
-    con.commit()
-    con.close()
+        # one statement for all columns, write lock taken up front
+        cur.execute("BEGIN IMMEDIATE")
+        cur.execute(_update_sql(table, tuple(upd), "rowid"), (*upd.values(), rowid))
+        cur.connection.commit()
 
 
-def delete_row_by_rowid(main_db: Path, table: str, rowid: int) -> None:
-    con = _connect(main_db)
-    cur = con.cursor()
-    cur.execute(f'DELETE FROM "{table}" WHERE rowid=?', (rowid,))
-    con.commit()
-    con.close()
+def update_rows_by_rowid(main_db: Path, table: str, edits: Dict[int, Dict[str, Any]]) -> None:
+    """
+    Writes per-row edits {rowid: {column: value}} as one UPDATE per chunk of
+    rows, all in one transaction: each column is set with CASE rowid WHEN ..
+    THEN .. ELSE column END, limited to WHERE rowid IN (..). Chunks keep the
+    bound parameters under _SQLITE_MIN_MAX_PARAMS. Unknown columns are ignored.
+    """
+    with _shared_cursor(main_db) as cur:
+        if table not in _tables_set(cur):
+            raise ValueError(f"Table not found: {table}")
 
+        cols = set(_table_cols(cur, table))
+        upd_cols = [c for c in dict.fromkeys(k for u in edits.values() for k in u) if c in cols]
+        if not upd_cols:
+            return
 
-def insert_row(main_db: Path, table: str, values: Dict[str, Any]) -> None:
-    con = _connect(main_db)
-    cur = con.cursor()
-    if table not in set(_list_tables(cur)):
-        con.close()
-        raise ValueError(f"Table not found: {table}")
+        # each row binds at most one WHEN pair per column plus its IN entry
+        step = max(1, _SQLITE_MIN_MAX_PARAMS // (2 * len(upd_cols) + 1))
+        items = list(edits.items())
+
+        cur.execute("BEGIN IMMEDIATE")  # _shared_cursor rolls back if a chunk fails
+        for start in range(0, len(items), step):
+            chunk = items[start : start + step]
+            sets: List[str] = []
+            params: List[Any] = []
+            for c in upd_cols:
+                whens = [(rowid, u[c]) for rowid, u in chunk if c in u]
+                if not whens:
+                    continue
+                sets.append(f'"{c}"=CASE rowid {" ".join(["WHEN ? THEN ?"] * len(whens))} ELSE "{c}" END')
+                for rowid, v in whens:
+                    params += (rowid, v)
+            if not sets:
+                continue
+            params += (rowid for rowid, _u in chunk)
+            cur.execute(
+                f'UPDATE "{table}" SET {", ".join(sets)} WHERE rowid IN ({_qplaceholders(len(chunk))})',
+                params,
+            )
+        cur.connection.commit()
+
+
+def delete_rows_by_rowid(main_db: Path, table: str, rowids: Iterable[int]) -> int:
+    """Deletes rows by rowid with one executemany in one transaction. Returns rows deleted."""
+    params = [(int(r),) for r in rowids]
+    if not params:
+        return 0
+    with _shared_cursor(main_db) as cur:
+        cur.execute("BEGIN IMMEDIATE")
+        cur.executemany(_delete_by_key_sql(table, "rowid"), params)
+        n = cur.rowcount
+        cur.connection.commit()
+        return n
 
-    cols = _cols(_table_info(cur, table))
-    vals = {k: v for k, v in values.items() if k in cols}
-    if not vals:
-        con.close()
-        return
 
-    keys = list(vals.keys())
-    placeholders = ",".join(["?"] * len(keys))
-    cols_sql = ",".join(f'"{k}"' for k in keys)
+def delete_row_by_rowid(main_db: Path, table: str, rowid: int) -> None:
+    delete_rows_by_rowid(main_db, table, [rowid])
 
-    cur.execute(f'INSERT INTO "{table}" ({cols_sql}) VALUES ({placeholders})', [vals[k] for k in keys])
-    con.commit()
-    con.close()
 
-def apply_subsystem_from_donor(
-    main_db: Path,
-    donor_db: Path,
-    target_car_id: int,
-    donor_car_id: int,
-    subsystem: str,
-    level: int = 0,
-):
+def insert_rows(main_db: Path, table: str, rows: List[Dict[str, Any]]) -> int:
     """
-    Bridges your existing constructor logic into a single call for the new UI.
-    Uses your existing _pick_upgrade_table / _find_level_row / _write_level_row and physics cloning behavior.
+    Inserts rows (dicts with the same keys, e.g. one row copied to several
+    levels) with one executemany in one transaction. An INTEGER PRIMARY KEY
+    (rowid alias) is left to SQLite, so copies never collide on it.
+    Returns rows inserted.
     """
-    con_t = _connect(main_db)
-    cur_t = con_t.cursor()
+    if not rows:
+        return 0
+    with _shared_cursor(main_db) as cur:
+        if table not in _tables_set(cur):
+            raise ValueError(f"Table not found: {table}")
+
+        info = _table_info(cur, table)
+        pks = [r for r in info if r[5]]
+        rowid_pk = pks[0][1] if len(pks) == 1 and (pks[0][2] or "").strip().upper() == "INTEGER" else None
+        cols = _cols(info)
+        keys = tuple(k for k in rows[0] if k in cols and k != rowid_pk)
+        if not keys:
+            return 0
+
+        cur.execute("BEGIN IMMEDIATE")
+        cur.executemany(_insert_sql(table, keys), [tuple(r[k] for k in keys) for r in rows])
+        cur.connection.commit()
+        return len(rows)
 
-    con_s = _connect(donor_db)
-    cur_s = con_s.cursor()
 
-    upgrade_table = _pick_upgrade_table(cur_s, subsystem)
-    if not upgrade_table:
-        con_s.close(); con_t.close()
-        raise ValueError(f"Could not find upgrade table for subsystem '{subsystem}' in {donor_db.name}")
+def insert_row(main_db: Path, table: str, values: Dict[str, Any]) -> None:
+    insert_rows(main_db, table, [values])
 
-    src_row = _find_level_row(cur_s, upgrade_table, donor_car_id, level)
-    if not src_row:
-        con_s.close(); con_t.close()
-        raise ValueError(f"No donor row found for {subsystem} level {level} (car {donor_car_id})")
+def _attach_limit(con: sqlite3.Connection) -> int:
+    try:
+        return con.getlimit(sqlite3.SQLITE_LIMIT_ATTACHED)
+    except AttributeError:  # Python < 3.11
+        return 10  # SQLITE_MAX_ATTACHED default
 
-    # Write level row into MAIN (target)
-    written = _write_level_row(cur_t, upgrade_table, target_car_id, src_row, level)
 
-    # Clone linked physics IDs when present (existing logic below in your file)
-    # If your file already calls physics cloning inside _write_level_row or elsewhere, this is extra-safe but optional.
-    # We'll attempt to reuse your private function if present.
-    notes = []
-    if "_clone_physics_ids_from_upgrade_row" in globals():
-        try:
-            # base-block concept
-            base_old = donor_car_id * 1000
-            base_new = target_car_id * 1000
-            globals()["_clone_physics_ids_from_upgrade_row"](cur_s, cur_t, upgrade_table, src_row, base_old, base_new)
-            notes.append("Physics IDs cloned (best-effort).")
-        except Exception as e:
-            notes.append(f"Physics clone warning: {e}")
+def _attach_readonly(cur: sqlite3.Cursor, sources: List[Path]) -> List[str]:
+    """ATTACHes sources (mode=ro) as s0, s1, ..; returns the schema names."""
+    schemas = []
+    for i, src in enumerate(sources):
+        cur.execute(f"ATTACH DATABASE ? AS s{i}", (_ro_uri(src),))
+        schemas.append(f"s{i}")
+    return schemas
 
-    con_t.commit()
-    con_s.close(); con_t.close()
 
-    return f"Applied {subsystem} from donor CarID {donor_car_id} ({donor_db.name}) to target CarID {target_car_id} in {upgrade_table} (Level {level}). Rows written: {written}. Notes: {', '.join(notes) if notes else 'none'}"
+def _iter_attached(sources: List[Path], table: str) -> Iterator[Tuple[sqlite3.Cursor, List[Tuple[str, Tuple[str, ...]]]]]:
+    """
+    Attaches the sources read-only to one in-memory connection, as many at a
+    time as SQLite allows, and yields (cursor, [(schema, columns of table), ..])
+    for each batch - only files that have the table, in source order. Saves a
+    connection per file for whole-source scans.
+    """
+    con = sqlite3.connect("file::memory:", uri=True)
+    try:
+        cur = con.cursor()
+        step = _attach_limit(con)
+        for start in range(0, len(sources), step):
+            schemas = _attach_readonly(cur, sources[start : start + step])
+            found = []
+            for s in schemas:
+                cur.execute(f"PRAGMA {s}.table_info('{table}')")
+                cols = tuple(r[1] for r in cur.fetchall())
+                if cols:
+                    found.append((s, cols))
+            yield cur, found
+            for s in schemas:
+                cur.execute(f"DETACH DATABASE {s}")
+    finally:
+        con.close()
+
 
 def list_distinct_engine_medianames(sources: List[Path]) -> List[str]:
     out: set[str] = set()
-    for src in sources:
-        con = _connect(src)
-        cur = con.cursor()
-        if "Data_Engine" not in set(_list_tables(cur)):
-            con.close()
-            continue
-        cols = _cols(_table_info(cur, "Data_Engine"))
-        if "MediaName" not in cols:
-            con.close()
+    for cur, found in _iter_attached(sources, "Data_Engine"):
+        parts = [f'SELECT "MediaName" FROM {s}."Data_Engine"' for s, cols in found if "MediaName" in cols]
+        if not parts:
             continue
-        cur.execute('SELECT DISTINCT "MediaName" AS m FROM "Data_Engine"')
-        for r in cur.fetchall():
-            if r["m"] is not None and str(r["m"]).strip():
-                out.add(str(r["m"]))
-        con.close()
+        cur.execute(" UNION ".join(parts))  # one distinct scan per batch of files
+        for (m,) in cur:  # streamed, no intermediate list
+            if m is not None and str(m).strip():
+                out.add(str(m))
     return sorted(out)
     
 def build_powertrain_options(sources: List[Path], lookup_cache: Dict[str, Dict[int, str]]) -> List[Tuple[int, str]]:
@@ -1385,65 +1845,42 @@ def build_powertrain_options(sources: List[Path], lookup_cache: Dict[str, Dict[i
 
     items: Dict[int, str] = {}
 
-    for src in sources:
-        con = _connect(src)
-        cur = con.cursor()
-        if "Data_Drivetrain" not in set(_list_tables(cur)):
-            con.close()
-            continue
-        cols = _cols(_table_info(cur, "Data_Drivetrain"))
-        if "DrivetrainID" not in cols:
-            con.close()
-            continue
-
-        dtid_col = "DrivetrainID"
-        drivetype_col = "DrivetypeID" if "DrivetypeID" in cols else None
-        mount_col = "EngineMountingDirection" if "EngineMountingDirection" in cols else None
-
-        sel = [dtid_col]
-        if drivetype_col:
-            sel.append(drivetype_col)
-        if mount_col:
-            sel.append(mount_col)
-
-        sel_sql = ",".join(f'"{c}"' for c in sel)
-        cur.execute(f'SELECT {sel_sql} FROM "Data_Drivetrain"')
-        for r in cur.fetchall():
-            try:
-                did = int(r[dtid_col])
-            except Exception:
+    # one SELECT per file (source order decides which label wins), all on one
+    # connection with the files attached
+    for cur, found in _iter_attached(sources, "Data_Drivetrain"):
+        for s, cols in found:
+            if "DrivetrainID" not in cols:
                 continue
+            drivetype_sql = '"DrivetypeID"' if "DrivetypeID" in cols else "NULL"
+            mount_sql = '"EngineMountingDirection"' if "EngineMountingDirection" in cols else "NULL"
+            cur.execute(f'SELECT "DrivetrainID", {drivetype_sql}, {mount_sql} FROM {s}."Data_Drivetrain"')
+            # _safe_int returns ints as-is, so the usual all-integer rows never hit a try/except.
+            # Iterating the cursor steps rows as they come instead of building a list first
+            for did_v, drivetype_v, mount_v in cur:
+                did = _safe_int(did_v)
+                if did is None or did in items:
+                    continue
 
-            if did in items:
-                continue
+                dt = ""
+                if drivetype_v is not None:
+                    dtid = _safe_int(drivetype_v)
+                    dt = str(drivetype_v) if dtid is None else drive_types.get(dtid, str(dtid))
 
-            dt = ""
-            if drivetype_col and r[drivetype_col] is not None:
-                try:
-                    dtid = int(r[drivetype_col])
-                    dt = drive_types.get(dtid, str(dtid))
-                except Exception:
-                    dt = str(r[drivetype_col])
-
-            md = ""
-            if mount_col and r[mount_col] is not None:
-                try:
-                    md = mount_map.get(int(r[mount_col]), str(r[mount_col]))
-                except Exception:
-                    md = str(r[mount_col])
-
-            car_guess = did // 1000
-            parts = []
-            if dt:
-                parts.append(dt)
-            if md:
-                parts.append(md)
-            parts.append(f"CarBlock~{car_guess}")
-            label = " / ".join(parts)
-
-            items[did] = label
+                md = ""
+                if mount_v is not None:
+                    mid = _safe_int(mount_v)
+                    md = str(mount_v) if mid is None else mount_map.get(mid, str(mount_v))
 
-        con.close()
+                car_guess = did // 1000
+                parts = []
+                if dt:
+                    parts.append(dt)
+                if md:
+                    parts.append(md)
+                parts.append(f"CarBlock~{car_guess}")
+                label = " / ".join(parts)
+
+                items[did] = label
 
     return sorted(items.items(), key=lambda x: x[0])
 
@@ -1453,16 +1890,23 @@ def basic_validate_car(main_db: Path, car_id: int) -> List[str]:
     Lightweight validator (not a full integrity checker).
     Checks existence of core rows and common crash causes.
     """
+    with _shared_cursor(main_db) as cur:
+        cur.execute("BEGIN")  # one read snapshot for all checks; _shared_cursor ends it
+        return _validate_core(cur, car_id)
+
+
+def _validate_core(cur: sqlite3.Cursor, car_id: int) -> List[str]:
+    """basic_validate_car's checks, all on one cursor."""
     issues: List[str] = []
-    car = get_data_car(main_db, car_id)
+    car = _get_data_car(cur, car_id)
     if not car:
         issues.append("Data_Car row missing in MAIN.")
 
-    body = get_data_carbody_for_car(main_db, car_id)
+    body = _get_data_carbody_for_car(cur, car_id)
     if not body:
         issues.append("Data_CarBody row missing in MAIN (base-block lookup).")
 
-    stock = get_stock_engine_for_car(main_db, car_id)
+    stock = _get_stock_engine_for_car(cur, car_id)
     if not stock:
         issues.append("Stock engine row missing in List_UpgradeEngine for this car.")
     else:
@@ -1470,7 +1914,7 @@ def basic_validate_car(main_db: Path, car_id: int) -> List[str]:
         if eid is not None:
             try:
                 eid_i = int(eid)
-                if not engine_exists_in_main(main_db, eid_i):
+                if not _engine_exists_in_main(cur, eid_i):
                     issues.append(f"Stock EngineID {eid_i} not present in MAIN Data_Engine (clone/assign needed).")
             except Exception:
                 pass